@@ -0,0 +1,84 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.infrastructure.admission import AdmissionControl, AdmissionLimiter, AdmissionRejected
+from app.infrastructure.timing import phase
+
+
+class AdmissionSlot:
+    """
+    A request's place in its route group's limit. Released when the handler returns, unless an AdmittedStreamingResponse
+    has taken it over.
+    """
+
+    def __init__(self, limiter: Optional[AdmissionLimiter]) -> None:
+        self._limiter = limiter
+        self.taken_over = False
+
+    def release(self) -> None:
+        limiter, self._limiter = self._limiter, None
+        if limiter is not None:
+            limiter.release()
+
+
+class AdmittedStreamingResponse(StreamingResponse):
+    """
+    A StreamingResponse that holds its request's admission slot until the body has been sent, or sending failed: the
+    export and the change feed hold a pooled connection for as long as they stream.
+    """
+
+    def __init__(self, content: Any, slot: AdmissionSlot, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self.slot = slot
+        slot.taken_over = True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.slot.release()
+
+
+@asynccontextmanager
+async def admitted(request: Request, group: str) -> AsyncIterator[AdmissionSlot]:
+    """
+    Hold one of `group`'s admission slots (app.state.admission) for the duration of the block, or until an
+    AdmittedStreamingResponse takes the slot over. When the group's queue is full or the wait times out the request fails
+    fast with 503 and Retry-After. Apps without admission control (e.g. test apps built around a single router) are not
+    limited.
+    """
+    control: Optional[AdmissionControl] = getattr(request.app.state, "admission", None)
+    if control is None:
+        yield AdmissionSlot(None)
+        return
+    limiter = control.limiter(group)
+    try:
+        with phase("admission_wait"):
+            await limiter.acquire()
+    except AdmissionRejected as exc:
+        raise HTTPException(
+            status_code=503, detail=f"Server busy ({exc.reason}); retry later", headers={"Retry-After": str(control.retry_after_seconds)}
+        )
+    slot = AdmissionSlot(limiter)
+    try:
+        yield slot
+    finally:
+        if not slot.taken_over:
+            slot.release()
+
+
+def admission(group: str) -> Callable[[Request], AsyncIterator[AdmissionSlot]]:
+    """
+    Route dependency holding one of `group`'s admission slots (see admitted) while the handler runs, or while its body
+    streams when it returns an AdmittedStreamingResponse.
+    """
+
+    async def admit(request: Request) -> AsyncIterator[AdmissionSlot]:
+        async with admitted(request, group) as slot:
+            yield slot
+
+    return admit
@@ -0,0 +1,167 @@
+from datetime import datetime
+from functools import partial
+from typing import Annotated, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from app.api.admission import AdmissionSlot, AdmittedStreamingResponse, admission
+from app.schemas.stand_schema import StandBatchRequest, StandBatchSchema, StandPageSchema, StandPartTreeSchema, StandSchema, StandSearchQuery
+from app.infrastructure.database import get_app_settings, get_async_db, get_async_session_factory, read_only_request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.infrastructure.repositories.stand_repository import PartTreeDirection
+from app.infrastructure.repositories.async_stand_repository import (
+    get_part_tree,
+    get_stand,
+    get_stand_schema,
+    get_stands,
+    iter_stands,
+    list_stands,
+    search_stands,
+)
+from app.domain.stand_domain import Stand
+from app.infrastructure.adapters import stand_adapter
+from app.core.config import Settings
+from app.api.fields import parse_attribute_fields
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.stand_export import csv_lines_async, ndjson_lines_async
+from app.api.endpoints.stand_endpoint import EXPORT_MEDIA_TYPES, admit_stand_read, cacheable_read, cached_stand, stand_response
+from app.api.etag import CachedStand, render_stand
+from app.infrastructure.cache import TTLCache, get_stand_cache
+from app.infrastructure.single_flight import stand_reads
+
+# Same routes as stand_endpoint, served on the event loop through AsyncSession. main.py mounts one or the other (Settings.db_async).
+
+router = APIRouter()
+
+
+@router.get("/stands/", response_model=StandPageSchema, response_model_exclude_unset=True, dependencies=[Depends(admission("stand_listing"))])
+async def stands(
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = None,
+    include_parts: bool = False,
+    as_of: Optional[datetime] = None,
+    fields: Optional[str] = None,
+    settings: Settings = Depends(get_app_settings),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    limit = min(limit or settings.stand_page_default_limit, settings.stand_page_max_limit)
+    after = decode_cursor(cursor) if cursor else None
+    attribute_fields = parse_attribute_fields(fields)
+    domain_stands, has_more = await list_stands(db_session, after, limit, include_parts, settings.stand_loader_strategy, as_of, attribute_fields)
+    next_cursor = encode_cursor(domain_stands[-1].stand_oid) if has_more else None
+    return StandPageSchema(stands=[stand_adapter.domain_to_schema_stand(stand, attribute_fields) for stand in domain_stands], next=next_cursor)
+
+
+@router.get("/stands/search", response_model=StandPageSchema, response_model_exclude_unset=True, dependencies=[Depends(admission("stand_listing"))])
+async def search(
+    query: Annotated[StandSearchQuery, Query()],
+    settings: Settings = Depends(get_app_settings),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    limit = min(query.limit or settings.stand_page_default_limit, settings.stand_page_max_limit)
+    after = decode_cursor(query.cursor) if query.cursor else None
+    attribute_fields = parse_attribute_fields(query.fields)
+    domain_stands, has_more = await search_stands(
+        db_session, query, after, limit, query.include_parts, settings.stand_loader_strategy, query.as_of, attribute_fields
+    )
+    next_cursor = encode_cursor(domain_stands[-1].stand_oid) if has_more else None
+    return StandPageSchema(stands=[stand_adapter.domain_to_schema_stand(stand, attribute_fields) for stand in domain_stands], next=next_cursor)
+
+
+@router.get("/stands/export")
+async def export_stands(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    settings: Settings = Depends(get_app_settings),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+    slot: AdmissionSlot = Depends(admission("stand_export")),
+):
+    async def body():
+        async with session_factory() as db_session:
+            stands = iter_stands(db_session, settings.stand_export_yield_per)
+            lines = ndjson_lines_async(stands) if format == "ndjson" else csv_lines_async(stands)
+            async for line in lines:
+                yield line
+
+    return AdmittedStreamingResponse(body(), slot, media_type=EXPORT_MEDIA_TYPES[format])
+
+
+async def load_stand_schema(
+    db_session: AsyncSession, settings: Settings, stand_oid: str, as_of: Optional[datetime] = None, attribute_fields: Optional[Tuple[str, ...]] = None
+) -> Optional[StandSchema]:
+    if settings.stand_read_mode == "fast":
+        return await get_stand_schema(db_session, stand_oid, as_of, attribute_fields)
+    domain_stand: Optional[Stand] = await get_stand(db_session, stand_oid, settings.stand_loader_strategy, as_of, attribute_fields)
+    return stand_adapter.domain_to_schema_stand(domain_stand, attribute_fields) if domain_stand is not None else None
+
+
+async def load_rendered_stand(
+    session_factory: async_sessionmaker, settings: Settings, stand_oid: str, as_of: Optional[datetime], attribute_fields: Optional[Tuple[str, ...]]
+) -> Optional[CachedStand]:
+    async with session_factory() as db_session:
+        stand_schema = await load_stand_schema(db_session, settings, stand_oid, as_of, attribute_fields)
+    return render_stand(stand_schema) if stand_schema is not None else None
+
+
+@router.get("/stands/{stand_oid}/", response_model=StandSchema, dependencies=[Depends(admit_stand_read)])
+async def read_stand(
+    stand_oid: str,
+    request: Request,
+    as_of: Optional[datetime] = None,
+    fields: Optional[str] = None,
+    cached: Optional[CachedStand] = Depends(cached_stand),
+    cacheable: bool = Depends(cacheable_read),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+    settings: Settings = Depends(get_app_settings),
+    stand_cache: TTLCache = Depends(get_stand_cache),
+):
+    if cached is not None:
+        return stand_response(request, cached)
+    attribute_fields = parse_attribute_fields(fields)
+    # Taken before the load: a write that invalidates the stand while it is loading keeps the older body out of the cache.
+    generation = stand_cache.generation(stand_oid)
+    load = partial(load_rendered_stand, session_factory, settings, stand_oid, as_of, attribute_fields)
+    if settings.stand_read_coalescing:
+        cached = await stand_reads.do_async((stand_oid, as_of, attribute_fields, session_factory), load)
+    else:
+        cached = await load()
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Stand not found")
+    if cacheable:
+        stand_cache.set(stand_oid, cached, generation)
+    return stand_response(request, cached)
+
+
+# A read sent as a POST only for the size of its body: served by the replica like the GETs.
+@router.post(
+    "/stands/batch",
+    response_model=StandBatchSchema,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(admission("stand_read")), Depends(read_only_request)],
+)
+async def read_stands_batch(
+    request: StandBatchRequest, settings: Settings = Depends(get_app_settings), db_session: AsyncSession = Depends(get_async_db)
+):
+    attribute_fields = parse_attribute_fields(request.fields)
+    domain_stands, missing = await get_stands(db_session, request.stand_oids, settings.stand_loader_strategy, request.as_of, attribute_fields)
+    return StandBatchSchema(stands=[stand_adapter.domain_to_schema_stand(stand, attribute_fields) for stand in domain_stands], missing=missing)
+
+
+@router.get(
+    "/stand-parts/{stand_part_oid}/{direction}",
+    response_model=StandPartTreeSchema,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(admission("stand_read"))],
+)
+async def read_part_tree(
+    stand_part_oid: str,
+    direction: PartTreeDirection,
+    max_depth: Optional[int] = Query(default=None, ge=0),
+    fields: Optional[str] = None,
+    settings: Settings = Depends(get_app_settings),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    max_depth = min(max_depth if max_depth is not None else settings.stand_part_tree_max_depth, settings.stand_part_tree_max_depth)
+    attribute_fields = parse_attribute_fields(fields)
+    parts = await get_part_tree(db_session, stand_part_oid, direction, max_depth, attribute_fields)
+    tree = stand_adapter.domain_to_schema_part_tree(parts, ancestors=direction == "ancestors", attribute_fields=attribute_fields)
+    if tree is None:
+        raise HTTPException(status_code=404, detail="Stand part not found")
+    return tree
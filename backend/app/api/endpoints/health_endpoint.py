@@ -0,0 +1,80 @@
+import time
+from typing import Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.cache import RefreshingCache, TTLCache, get_stand_cache, get_stand_summary_cache
+from app.infrastructure.database import Database, get_database, get_session_factory
+from app.infrastructure.pool_metrics import get_pool_metrics, pool_status
+from app.infrastructure.single_flight import stand_reads
+from app.infrastructure.stand_snapshot import StandSnapshotService, get_stand_snapshot
+from app.schemas.health_schema import (
+    AdmissionStatsSchema,
+    CacheStatsSchema,
+    DbHealthSchema,
+    PoolSchema,
+    SingleFlightStatsSchema,
+    SnapshotStatsSchema,
+    SummaryCacheStatsSchema,
+)
+
+router = APIRouter()
+
+
+def pool_schema(engine: Engine) -> PoolSchema:
+    metrics = get_pool_metrics(engine)
+    return PoolSchema(**pool_status(engine), **(metrics.as_dict() if metrics is not None else {}))
+
+
+@router.get("/health/db", response_model=DbHealthSchema)
+def db_health(session_factory: sessionmaker = Depends(get_session_factory), database: Database = Depends(get_database)):
+    # The session is opened here rather than by get_db, so a failed connect is answered with a 503 too.
+    with session_factory() as db_session:
+        start = time.perf_counter()
+        try:
+            db_session.execute(text("SELECT 1"))
+        except SQLAlchemyError:
+            raise HTTPException(status_code=503, detail="Database unavailable")
+        ping_ms = (time.perf_counter() - start) * 1000
+        # The ping runs on the engine the request was routed to: the replica when there is one.
+        async_engine, read_engine, async_read_engine = database.async_engine, database.read_engine, database.async_read_engine
+        return DbHealthSchema(
+            status="ok",
+            ping_ms=ping_ms,
+            pool=pool_schema(database.engine),
+            async_pool=pool_schema(async_engine.sync_engine) if async_engine is not None else None,
+            read_pool=pool_schema(read_engine) if read_engine is not None else None,
+            async_read_pool=pool_schema(async_read_engine.sync_engine) if async_read_engine is not None else None,
+            routes=dict(database.routes),
+        )
+
+
+@router.get("/health/cache", response_model=CacheStatsSchema)
+def cache_health(stand_cache: TTLCache = Depends(get_stand_cache)):
+    return CacheStatsSchema(**stand_cache.stats())
+
+
+@router.get("/health/summary-cache", response_model=SummaryCacheStatsSchema)
+def summary_cache_health(stand_summary_cache: RefreshingCache = Depends(get_stand_summary_cache)):
+    return SummaryCacheStatsSchema(**stand_summary_cache.stats())
+
+
+@router.get("/health/snapshot", response_model=SnapshotStatsSchema)
+def snapshot_health(stand_snapshot: StandSnapshotService = Depends(get_stand_snapshot)):
+    return SnapshotStatsSchema(**stand_snapshot.stats())
+
+
+@router.get("/health/single-flight", response_model=SingleFlightStatsSchema)
+def single_flight_health():
+    return SingleFlightStatsSchema(**stand_reads.stats())
+
+
+# Per route group, for the groups that have served a request so far. Empty when admission control is disabled.
+@router.get("/health/admission", response_model=Dict[str, AdmissionStatsSchema])
+def admission_health(request: Request):
+    control = request.app.state.admission
+    return control.stats() if control is not None else {}
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import sessionmaker
+from app.api.admission import AdmissionSlot, AdmittedStreamingResponse, admission
+from app.infrastructure.database import get_app_settings, get_session_factory
+from app.infrastructure.repositories.stand_repository import ChangePosition, iter_stand_changes
+from app.core.config import Settings
+from app.api.pagination import decode_change_cursor
+from app.api.stand_export import change_ndjson_lines
+from app.api.endpoints.stand_endpoint import EXPORT_MEDIA_TYPES
+
+
+router = APIRouter()
+
+
+# NDJSON stream of the stands changed after `cursor` (or `since`; from the beginning without either) up to now. Every line
+# carries the cursor that resumes the feed after it. Served from the sync engine in async mode too.
+# Changes are ordered by the effective-dated instants themselves, so a version written later with an effective or expiry
+# date at or before a consumer's cursor is not replayed to it; the periodic full export covers such backdated writes.
+@router.get("/stands/changes")
+def stand_changes(
+    since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    settings: Settings = Depends(get_app_settings),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    slot: AdmissionSlot = Depends(admission("stand_changes")),
+):
+    after: ChangePosition = decode_change_cursor(cursor) if cursor else (since or datetime.min, None)
+    # Fixed up front so the changes and the stands the stream returns share one point in time.
+    until = datetime.now()
+
+    def body():
+        with session_factory() as db_session:
+            changes = iter_stand_changes(db_session, after, until, settings.stand_changes_batch_size)
+            yield from change_ndjson_lines(changes)
+
+    return AdmittedStreamingResponse(body(), slot, media_type=EXPORT_MEDIA_TYPES["ndjson"])
@@ -1,24 +1,196 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
-from app.schemas.stand_schema import StandSchema
-from app.infrastructure.database import get_db
-from sqlalchemy.orm import Session
-from app.infrastructure.repositories.stand_repository import get_stand
+from datetime import datetime
+from functools import partial
+from typing import Annotated, AsyncIterator, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from app.api.admission import AdmissionSlot, AdmittedStreamingResponse, admission, admitted
+from app.schemas.stand_schema import StandBatchRequest, StandBatchSchema, StandPageSchema, StandPartTreeSchema, StandSchema, StandSearchQuery
+from app.infrastructure.database import get_app_settings, get_db, get_session_factory, read_only_request, route_request
+from sqlalchemy.orm import Session, sessionmaker
+from app.infrastructure.repositories.stand_repository import (
+    PartTreeDirection,
+    get_part_tree,
+    get_stand,
+    get_stand_schema,
+    get_stands,
+    iter_stands,
+    list_stands,
+    search_stands,
+)
 from app.domain.stand_domain import Stand
 from app.infrastructure.adapters import stand_adapter
+from app.core.config import Settings
+from app.api.fields import parse_attribute_fields
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.stand_export import csv_lines, ndjson_lines
+from app.api.etag import CachedStand, etag_matches, render_stand
+from app.infrastructure.cache import TTLCache, get_stand_cache
+from app.infrastructure.single_flight import stand_reads
 
 
 router = APIRouter()
 
 
-@router.get("/stands/")
-async def stands():
-    return {"stands": ["9001001001", "9001001002", "9001001098"]}
+@router.get("/stands/", response_model=StandPageSchema, response_model_exclude_unset=True, dependencies=[Depends(admission("stand_listing"))])
+def stands(
+    limit: Optional[int] = Query(default=None, ge=1),
+    cursor: Optional[str] = None,
+    include_parts: bool = False,
+    as_of: Optional[datetime] = None,
+    fields: Optional[str] = None,
+    settings: Settings = Depends(get_app_settings),
+    db_session: Session = Depends(get_db),
+):
+    limit = min(limit or settings.stand_page_default_limit, settings.stand_page_max_limit)
+    after = decode_cursor(cursor) if cursor else None
+    attribute_fields = parse_attribute_fields(fields)
+    domain_stands, has_more = list_stands(db_session, after, limit, include_parts, settings.stand_loader_strategy, as_of, attribute_fields)
+    next_cursor = encode_cursor(domain_stands[-1].stand_oid) if has_more else None
+    return StandPageSchema(stands=[stand_adapter.domain_to_schema_stand(stand, attribute_fields) for stand in domain_stands], next=next_cursor)
 
 
-@router.get("/stands/{stand_oid}/", response_model=StandSchema)
-def read_stand(stand_oid: str, db_session: Session = Depends(get_db)):
-    domain_stand: Optional[Stand] = get_stand(db_session, stand_oid)
-    if domain_stand is None:
+@router.get("/stands/search", response_model=StandPageSchema, response_model_exclude_unset=True, dependencies=[Depends(admission("stand_listing"))])
+def search(
+    query: Annotated[StandSearchQuery, Query()],
+    settings: Settings = Depends(get_app_settings),
+    db_session: Session = Depends(get_db),
+):
+    limit = min(query.limit or settings.stand_page_default_limit, settings.stand_page_max_limit)
+    after = decode_cursor(query.cursor) if query.cursor else None
+    attribute_fields = parse_attribute_fields(query.fields)
+    domain_stands, has_more = search_stands(
+        db_session, query, after, limit, query.include_parts, settings.stand_loader_strategy, query.as_of, attribute_fields
+    )
+    next_cursor = encode_cursor(domain_stands[-1].stand_oid) if has_more else None
+    return StandPageSchema(stands=[stand_adapter.domain_to_schema_stand(stand, attribute_fields) for stand in domain_stands], next=next_cursor)
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@router.get("/stands/export")
+def export_stands(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    settings: Settings = Depends(get_app_settings),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    slot: AdmissionSlot = Depends(admission("stand_export")),
+):
+    # The body is produced after the request's dependencies have exited, so the generator owns its session.
+    def body():
+        with session_factory() as db_session:
+            stands = iter_stands(db_session, settings.stand_export_yield_per)
+            yield from ndjson_lines(stands) if format == "ndjson" else csv_lines(stands)
+
+    return AdmittedStreamingResponse(body(), slot, media_type=EXPORT_MEDIA_TYPES[format])
+
+
+def load_stand_schema(
+    db_session: Session, settings: Settings, stand_oid: str, as_of: Optional[datetime] = None, attribute_fields: Optional[Tuple[str, ...]] = None
+) -> Optional[StandSchema]:
+    if settings.stand_read_mode == "fast":
+        return get_stand_schema(db_session, stand_oid, as_of, attribute_fields)
+    domain_stand: Optional[Stand] = get_stand(db_session, stand_oid, settings.stand_loader_strategy, as_of, attribute_fields)
+    return stand_adapter.domain_to_schema_stand(domain_stand, attribute_fields) if domain_stand is not None else None
+
+
+def load_rendered_stand(
+    session_factory: sessionmaker, settings: Settings, stand_oid: str, as_of: Optional[datetime], attribute_fields: Optional[Tuple[str, ...]]
+) -> Optional[CachedStand]:
+    with session_factory() as db_session:
+        stand_schema = load_stand_schema(db_session, settings, stand_oid, as_of, attribute_fields)
+    return render_stand(stand_schema) if stand_schema is not None else None
+
+
+async def cacheable_read(as_of: Optional[datetime] = None, fields: Optional[str] = None, route: str = Depends(route_request)) -> bool:
+    # Point-in-time and sparse reads bypass the cache, which holds each stand's full representation under its OID, and
+    # so do reads pinned to the primary: a cached body may have come from a replica that has not seen the client's write.
+    return as_of is None and fields is None and route != "read_your_writes"
+
+
+async def cached_stand(
+    stand_oid: str, cacheable: bool = Depends(cacheable_read), stand_cache: TTLCache = Depends(get_stand_cache)
+) -> Optional[CachedStand]:
+    return stand_cache.get(stand_oid) if cacheable else None
+
+
+async def admit_stand_read(request: Request, cached: Optional[CachedStand] = Depends(cached_stand)) -> AsyncIterator[AdmissionSlot]:
+    # The cache is looked up before admission: a hit needs neither a slot nor a pooled connection, so cached stands are
+    # still served while the stand_read group is full.
+    if cached is not None:
+        yield AdmissionSlot(None)
+        return
+    async with admitted(request, "stand_read") as slot:
+        yield slot
+
+
+@router.get("/stands/{stand_oid}/", response_model=StandSchema, dependencies=[Depends(admit_stand_read)])
+def read_stand(
+    stand_oid: str,
+    request: Request,
+    as_of: Optional[datetime] = None,
+    fields: Optional[str] = None,
+    cached: Optional[CachedStand] = Depends(cached_stand),
+    cacheable: bool = Depends(cacheable_read),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    settings: Settings = Depends(get_app_settings),
+    stand_cache: TTLCache = Depends(get_stand_cache),
+):
+    # A session is only opened on a cache miss, so cache hits never take a pooled connection.
+    if cached is not None:
+        return stand_response(request, cached)
+    attribute_fields = parse_attribute_fields(fields)
+    # Taken before the load: a write that invalidates the stand while it is loading keeps the older body out of the cache.
+    generation = stand_cache.generation(stand_oid)
+    # Concurrent misses for the same stand and options share one load, and one pooled connection.
+    load = partial(load_rendered_stand, session_factory, settings, stand_oid, as_of, attribute_fields)
+    if settings.stand_read_coalescing:
+        cached = stand_reads.do((stand_oid, as_of, attribute_fields, session_factory), load)
+    else:
+        cached = load()
+    if cached is None:
         raise HTTPException(status_code=404, detail="Stand not found")
-    return stand_adapter.domain_to_schema_stand(domain_stand)
+    if cacheable:
+        stand_cache.set(stand_oid, cached, generation)
+    return stand_response(request, cached)
+
+
+def stand_response(request: Request, cached: CachedStand) -> Response:
+    # The body is already rendered from a valid StandSchema, so returning a Response skips response_model re-validation.
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers={"ETag": cached.etag})
+    return Response(content=cached.body, media_type="application/json", headers={"ETag": cached.etag})
+
+
+# A read sent as a POST only for the size of its body: served by the replica like the GETs.
+@router.post(
+    "/stands/batch",
+    response_model=StandBatchSchema,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(admission("stand_read")), Depends(read_only_request)],
+)
+def read_stands_batch(request: StandBatchRequest, settings: Settings = Depends(get_app_settings), db_session: Session = Depends(get_db)):
+    attribute_fields = parse_attribute_fields(request.fields)
+    domain_stands, missing = get_stands(db_session, request.stand_oids, settings.stand_loader_strategy, request.as_of, attribute_fields)
+    return StandBatchSchema(stands=[stand_adapter.domain_to_schema_stand(stand, attribute_fields) for stand in domain_stands], missing=missing)
+
+
+@router.get(
+    "/stand-parts/{stand_part_oid}/{direction}",
+    response_model=StandPartTreeSchema,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(admission("stand_read"))],
+)
+def read_part_tree(
+    stand_part_oid: str,
+    direction: PartTreeDirection,
+    max_depth: Optional[int] = Query(default=None, ge=0),
+    fields: Optional[str] = None,
+    settings: Settings = Depends(get_app_settings),
+    db_session: Session = Depends(get_db),
+):
+    max_depth = min(max_depth if max_depth is not None else settings.stand_part_tree_max_depth, settings.stand_part_tree_max_depth)
+    attribute_fields = parse_attribute_fields(fields)
+    parts = get_part_tree(db_session, stand_part_oid, direction, max_depth, attribute_fields)
+    tree = stand_adapter.domain_to_schema_part_tree(parts, ancestors=direction == "ancestors", attribute_fields=attribute_fields)
+    if tree is None:
+        raise HTTPException(status_code=404, detail="Stand part not found")
+    return tree
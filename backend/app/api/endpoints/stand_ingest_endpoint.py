@@ -0,0 +1,67 @@
+from typing import List, Tuple
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import sessionmaker
+from app.api.admission import admission
+from app.schemas.stand_schema import StandIngestChunkSchema, StandIngestFailureSchema, StandIngestSchema
+from app.infrastructure.database import Database, get_database, get_session_factory
+from app.infrastructure.repositories.stand_ingest_repository import ingest_chunk
+from app.domain.stand_domain import Stand
+from app.infrastructure.adapters import stand_adapter
+from app.api.stand_ingest import stand_records
+from app.infrastructure.cache import RefreshingCache, TTLCache, get_stand_cache, get_stand_summary_cache, invalidate_stands
+from app.infrastructure.stand_snapshot import StandSnapshotService, get_stand_snapshot
+
+
+router = APIRouter()
+
+
+# Ingest always writes through the sync engine, in async mode too: pyodbc's fast_executemany has no aioodbc equivalent.
+@router.post("/stands/ingest", response_model=StandIngestSchema, dependencies=[Depends(admission("stand_ingest"))])
+async def ingest_stands(
+    request: Request,
+    session_factory: sessionmaker = Depends(get_session_factory),
+    database: Database = Depends(get_database),
+    stand_cache: TTLCache = Depends(get_stand_cache),
+    stand_summary_cache: RefreshingCache = Depends(get_stand_summary_cache),
+    stand_snapshot: StandSnapshotService = Depends(get_stand_snapshot),
+):
+    result = StandIngestSchema(received=0, written=0)
+    # Until the replica has caught up, replica reads of the written stands must not refill the cache.
+    hold_seconds = database.settings.db_read_your_writes_seconds if database.has_replica else 0
+
+    async def write(chunk: List[Tuple[int, Stand]]) -> None:
+        outcome = await run_in_threadpool(ingest_chunk, session_factory, chunk)
+        invalidate_stands(stand_cache, outcome.written, hold_seconds)
+        if outcome.written:
+            stand_summary_cache.expire()
+            stand_snapshot.mark_changed(outcome.written)
+        result.written += len(outcome.written)
+        result.chunks.append(
+            StandIngestChunkSchema(
+                index=len(result.chunks),
+                stands=len(chunk),
+                written=len(outcome.written),
+                failed=len(outcome.failures),
+                inserted=outcome.counts.inserted,
+                updated=outcome.counts.updated,
+                retried=outcome.retried,
+                duration_ms=outcome.duration_ms,
+            )
+        )
+        result.failures.extend(StandIngestFailureSchema(index=f.index, stand_oid=f.stand_oid, error=f.error) for f in outcome.failures)
+
+    chunk: List[Tuple[int, Stand]] = []
+    async for index, record in stand_records(request):
+        result.received += 1
+        if isinstance(record, str):
+            result.failures.append(StandIngestFailureSchema(index=index, error=record))
+            continue
+        chunk.append((index, stand_adapter.schema_to_domain_stand(record)))
+        if len(chunk) >= database.settings.stand_ingest_chunk_size:
+            await write(chunk)
+            chunk = []
+    if chunk:
+        await write(chunk)
+    result.failures.sort(key=lambda failure: failure.index)
+    return result
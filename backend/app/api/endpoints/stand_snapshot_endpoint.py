@@ -0,0 +1,46 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import sessionmaker
+from app.api.admission import admission
+from app.schemas.stand_schema import StandSnapshotMatchSchema, StandSnapshotQuery
+from app.schemas.health_schema import SnapshotStatsSchema
+from app.infrastructure.database import get_app_settings, get_primary_session_factory
+from app.infrastructure.stand_snapshot import StandSnapshotService, get_stand_snapshot
+from app.core.config import Settings
+
+
+router = APIRouter()
+
+
+def require_snapshot(settings: Settings = Depends(get_app_settings)) -> None:
+    if not settings.stand_snapshot_enabled:
+        raise HTTPException(status_code=404, detail="The stand snapshot is disabled; set STAND_SNAPSHOT_ENABLED=true to use it")
+
+
+# Filters run against the in-memory snapshot without touching the database (except for its first load).
+@router.get(
+    "/stands/snapshot", response_model=StandSnapshotMatchSchema, dependencies=[Depends(require_snapshot), Depends(admission("stand_snapshot"))]
+)
+def snapshot_stands(
+    query: Annotated[StandSnapshotQuery, Query()],
+    session_factory: sessionmaker = Depends(get_primary_session_factory),
+    stand_snapshot: StandSnapshotService = Depends(get_stand_snapshot),
+):
+    snapshot = stand_snapshot.snapshot(session_factory)
+    stand_oids = snapshot.filter(query)
+    return StandSnapshotMatchSchema(as_of=snapshot.as_of, count=len(stand_oids), stand_oids=stand_oids)
+
+
+@router.post(
+    "/stands/snapshot/refresh",
+    response_model=SnapshotStatsSchema,
+    dependencies=[Depends(require_snapshot), Depends(admission("stand_snapshot"))],
+)
+def refresh_snapshot(
+    full: bool = False,
+    session_factory: sessionmaker = Depends(get_primary_session_factory),
+    stand_snapshot: StandSnapshotService = Depends(get_stand_snapshot),
+):
+    stand_snapshot.snapshot(session_factory)
+    stand_snapshot.refresh(full)
+    return SnapshotStatsSchema(**stand_snapshot.stats())
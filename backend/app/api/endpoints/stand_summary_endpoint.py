@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from functools import partial
+from typing import Iterable, List, Tuple
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import sessionmaker
+from app.api.admission import admission
+from app.schemas.stand_schema import StandSummaryRefreshSchema, StandSummaryRowSchema, StandSummarySchema
+from app.infrastructure.database import get_primary_session_factory
+from app.infrastructure.repositories.stand_repository import SUMMARY_DIMENSIONS, SummaryDimension, summarize_stands
+from app.infrastructure.cache import RefreshingCache, get_stand_summary_cache
+
+
+router = APIRouter()
+
+
+def compute_summary(session_factory: sessionmaker, group_by: Tuple[str, ...]) -> StandSummarySchema:
+    with session_factory() as db_session:
+        rows = summarize_stands(db_session, group_by)
+    return StandSummarySchema(group_by=list(group_by), refreshed_at=datetime.now(timezone.utc), rows=[StandSummaryRowSchema(**row) for row in rows])
+
+
+def summary_key(group_by: Iterable[str]) -> Tuple[str, ...]:
+    # The dimensions in SUMMARY_DIMENSIONS order, so every spelling of a grouping shares one cache entry.
+    group_by = set(group_by)
+    return tuple(name for name in SUMMARY_DIMENSIONS if name in group_by)
+
+
+# Dashboards poll this; only the first request for a grouping queries the base tables (none for the groupings computed
+# at startup), later ones are served from the app's summary cache, which it refreshes on a schedule (see main.py).
+@router.get(
+    "/stands/summary", response_model=StandSummarySchema, response_model_exclude_unset=True, dependencies=[Depends(admission("stand_summary"))]
+)
+def stand_summary(
+    group_by: List[SummaryDimension] = Query(default=["species"]),
+    session_factory: sessionmaker = Depends(get_primary_session_factory),
+    stand_summary_cache: RefreshingCache = Depends(get_stand_summary_cache),
+):
+    key = summary_key(group_by)
+    return stand_summary_cache.get(key, partial(compute_summary, session_factory, key))
+
+
+@router.post("/stands/summary/refresh", response_model=StandSummaryRefreshSchema, dependencies=[Depends(admission("stand_summary"))])
+def refresh_stand_summaries(stand_summary_cache: RefreshingCache = Depends(get_stand_summary_cache)):
+    return StandSummaryRefreshSchema(refreshed=[list(key) for key in stand_summary_cache.refresh()])
@@ -0,0 +1,33 @@
+import hashlib
+from typing import NamedTuple, Optional
+
+from fastapi.responses import JSONResponse
+
+from app.schemas.stand_schema import StandSchema
+from app.infrastructure.timing import timed
+
+
+class CachedStand(NamedTuple):
+    # The exact JSON body GET /stands/{stand_oid}/ serves, and its strong ETag
+    body: bytes
+    etag: str
+
+
+@timed("serialize")
+def render_stand(stand: StandSchema) -> CachedStand:
+    """
+    Render a StandSchema the way FastAPI renders a response_model, once, and derive its ETag from the bytes.
+    Fields never set (those left out by a sparse `fields=` read) are omitted.
+    """
+    body = JSONResponse(stand.model_dump(mode="json", exclude_unset=True)).body
+    return CachedStand(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match uses weak comparison: W/ prefixes are ignored and "*" matches any current representation.
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
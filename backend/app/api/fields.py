@@ -0,0 +1,21 @@
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.schemas.stand_schema import StandAttributesSchema
+
+STAND_ATTRIBUTES_FIELDS = tuple(StandAttributesSchema.model_fields)
+
+
+def parse_attribute_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    `fields=species,status,...` -> the StandAttributes fields to load and serialize, in model order and always including
+    stand_part_oid. None (parameter absent) means every field.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(STAND_ATTRIBUTES_FIELDS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return tuple(name for name in STAND_ATTRIBUTES_FIELDS if name in requested or name == "stand_part_oid")
@@ -0,0 +1,53 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException
+
+
+def _encode(payload: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
+
+
+def encode_cursor(after: str) -> str:
+    """
+    Opaque keyset cursor: clients pass it back verbatim to get the page following `after`.
+    """
+    return _encode({"after": after})
+
+
+def decode_cursor(cursor: str) -> str:
+    after = _decode(cursor).get("after")
+    if not isinstance(after, str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return after
+
+
+def encode_change_cursor(changed_at: datetime, stand_oid: str) -> str:
+    """
+    Change feed position: resuming from it returns the changes ordered after (changed_at, stand_oid).
+    """
+    return _encode({"changed_at": changed_at.isoformat(), "after": stand_oid})
+
+
+def decode_change_cursor(cursor: str) -> Tuple[datetime, str]:
+    payload = _decode(cursor)
+    changed_at, after = payload.get("changed_at"), payload.get("after")
+    if not isinstance(changed_at, str) or not isinstance(after, str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        return datetime.fromisoformat(changed_at), after
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,88 @@
+import csv
+import io
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Tuple
+
+from app.domain.stand_domain import Stand
+from app.infrastructure.adapters import stand_adapter
+from app.api.pagination import encode_change_cursor
+from app.schemas.stand_schema import StandAttributesSchema, StandChangeSchema, StandPartSchema, StandSchema
+
+STAND_COLUMNS = [name for name in StandSchema.model_fields if name != "stand_parts"]
+STAND_PART_COLUMNS = [name for name in StandPartSchema.model_fields if name not in ("stand_oid", "stand_attributes")]
+# STAND_ATTRIBUTES columns that share a name with a STAND_PART column (effective_date) get an "attributes_" prefix.
+STAND_ATTRIBUTES_COLUMN_NAMES = {
+    name: f"attributes_{name}" if name in STAND_PART_COLUMNS else name for name in StandAttributesSchema.model_fields if name != "stand_part_oid"
+}
+STAND_ATTRIBUTES_COLUMNS = list(STAND_ATTRIBUTES_COLUMN_NAMES.values())
+CSV_COLUMNS = STAND_COLUMNS + STAND_PART_COLUMNS + STAND_ATTRIBUTES_COLUMNS
+
+
+def ndjson_line(stand: Stand) -> str:
+    """
+    One StandSchema JSON document per line.
+    """
+    return stand_adapter.domain_to_schema_stand(stand).model_dump_json() + "\n"
+
+
+def change_ndjson_line(changed_at: datetime, stand: Stand) -> str:
+    """
+    One StandChangeSchema JSON document per line, carrying the cursor that resumes the feed after it.
+    """
+    change = StandChangeSchema(
+        changed_at=changed_at, cursor=encode_change_cursor(changed_at, stand.stand_oid), stand=stand_adapter.domain_to_schema_stand(stand)
+    )
+    return change.model_dump_json() + "\n"
+
+
+def csv_header() -> str:
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=CSV_COLUMNS).writeheader()
+    return buffer.getvalue()
+
+
+def csv_rows(stand: Stand) -> str:
+    """
+    One CSV row per StandAttributes row, with the owning stand and part columns repeated.
+    Stands without parts and parts without attributes still get a row, with the missing columns left blank.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+    writer.writerows(_flatten(stand_adapter.domain_to_schema_stand(stand).model_dump(mode="json")))
+    return buffer.getvalue()
+
+
+def change_ndjson_lines(changes: Iterable[Tuple[datetime, Stand]]) -> Iterator[str]:
+    for changed_at, stand in changes:
+        yield change_ndjson_line(changed_at, stand)
+
+
+def ndjson_lines(stands: Iterable[Stand]) -> Iterator[str]:
+    for stand in stands:
+        yield ndjson_line(stand)
+
+
+def csv_lines(stands: Iterable[Stand]) -> Iterator[str]:
+    yield csv_header()
+    for stand in stands:
+        yield csv_rows(stand)
+
+
+async def ndjson_lines_async(stands: AsyncIterable[Stand]) -> AsyncIterator[str]:
+    async for stand in stands:
+        yield ndjson_line(stand)
+
+
+async def csv_lines_async(stands: AsyncIterable[Stand]) -> AsyncIterator[str]:
+    yield csv_header()
+    async for stand in stands:
+        yield csv_rows(stand)
+
+
+def _flatten(stand: Dict) -> Iterator[Dict]:
+    parts: List[Dict] = stand.pop("stand_parts") or [{}]
+    for part in parts:
+        attributes: List[Dict] = part.pop("stand_attributes", None) or [{}]
+        for attribute in attributes:
+            row = {STAND_ATTRIBUTES_COLUMN_NAMES[name]: value for name, value in attribute.items() if name in STAND_ATTRIBUTES_COLUMN_NAMES}
+            yield {**row, **part, **stand}
@@ -0,0 +1,58 @@
+import json
+from typing import AsyncIterator, Tuple, Union
+
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+
+from app.schemas.stand_schema import StandSchema
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# A record is either a valid StandSchema or the message explaining why it is not one.
+StandRecord = Tuple[int, Union[StandSchema, str]]
+
+
+def validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}" for error in exc.errors())
+
+
+async def body_lines(request: Request) -> AsyncIterator[bytes]:
+    """
+    Non-blank lines of the request body, yielded as they arrive.
+    """
+    buffer = b""
+    async for piece in request.stream():
+        *lines, buffer = (buffer + piece).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+async def stand_records(request: Request) -> AsyncIterator[StandRecord]:
+    """
+    Parse an ingest body into (index, record) pairs. NDJSON (Content-Type application/x-ndjson) is parsed line by line
+    as it streams in; anything else must be a JSON array of stands. A malformed record does not stop the rest.
+    """
+    if request.headers.get("content-type", "").split(";")[0].strip() == NDJSON_MEDIA_TYPE:
+        index = 0
+        async for line in body_lines(request):
+            try:
+                yield index, StandSchema.model_validate_json(line)
+            except ValidationError as exc:
+                yield index, validation_message(exc)
+            index += 1
+        return
+
+    try:
+        items = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body is not valid JSON")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of stands or NDJSON")
+    for index, item in enumerate(items):
+        try:
+            yield index, StandSchema.model_validate(item)
+        except ValidationError as exc:
+            yield index, validation_message(exc)
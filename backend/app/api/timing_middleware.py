@@ -0,0 +1,91 @@
+import logging
+import random
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings
+from app.infrastructure.timing import StackSampler, format_samples, start_timing
+
+logger = logging.getLogger("app.request_timing")
+
+
+class RequestTimingMiddleware:
+    """
+    Times every HTTP request by phase (see app.infrastructure.timing), adds a Server-Timing header to the response and
+    logs one "app.request_timing" record per request, with the breakdown under the record's `request_timing` attribute.
+
+    Requests are stack-profiled when picked at random at Settings.request_profile_rate, or, with
+    Settings.request_profile_slow_ms set, when they turn out slower than it (every request is sampled then, and the
+    samples of the fast ones are dropped). Profiles are logged under `request_profile`.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Settings) -> None:
+        self.app = app
+        self.settings = settings
+        self._sampler: Optional[StackSampler] = None
+
+    def sampler(self) -> StackSampler:
+        if self._sampler is None:
+            self._sampler = StackSampler(self.settings.request_profile_interval_ms / 1000)
+        return self._sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = start_timing()
+        status_code = 500
+        settings = self.settings
+        picked = settings.request_profile_rate > 0 and random.random() < settings.request_profile_rate
+        sampler = self.sampler() if picked or settings.request_profile_slow_ms is not None else None
+        if sampler is not None:
+            sampler.register(timing)
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timing.server_timing(timing.elapsed_ms()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            total_ms = timing.elapsed_ms()
+            if sampler is not None:
+                sampler.unregister(timing)
+            route = scope.get("route")
+            record = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "status": status_code,
+                **timing.as_dict(total_ms),
+            }
+            phases = " ".join(f"{name}={ms:.1f}ms" for name, ms in timing.phases.items())
+            logger.info(
+                "%s %s %d %.1fms %s sql=%d/%.1fms lazy_loads=%d",
+                record["method"],
+                record["path"],
+                status_code,
+                total_ms,
+                phases,
+                timing.sql_statements,
+                timing.sql_ms,
+                timing.lazy_loads,
+                extra={"request_timing": record},
+            )
+            slow = settings.request_profile_slow_ms is not None and total_ms >= settings.request_profile_slow_ms
+            if sampler is not None and (picked or slow) and timing.samples:
+                profile = {**record, "reason": "slow" if slow else "sampled", "samples": dict(timing.samples)}
+                logger.info(
+                    "profile of %s %s (%.1fms):\n%s",
+                    record["method"],
+                    record["path"],
+                    total_ms,
+                    format_samples(timing.samples),
+                    extra={"request_profile": profile},
+                )
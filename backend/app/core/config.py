@@ -1,17 +1,150 @@
 # config.py
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
-    db_username: str
-    db_password: str
-    db_host: str
-    db_port: int
-    db_name: str
-    db_odbc_driver: str
+    # MSSQL connection. Only required once an engine is created without db_url / db_async_url.
+    db_username: Optional[str] = None
+    db_password: Optional[str] = None
+    db_host: Optional[str] = None
+    db_port: Optional[int] = None
+    db_name: Optional[str] = None
+    db_odbc_driver: Optional[str] = None
+    # Full SQLAlchemy URL. When set it replaces the MSSQL URL built from the fields above (e.g. "sqlite://" for tests).
+    db_url: Optional[str] = None
+
+    # Serve the stand endpoints from an AsyncEngine/AsyncSession instead of sync sessions in the threadpool.
+    db_async: bool = False
+    # Async SQLAlchemy URL. Defaults to the MSSQL URL above with the aioodbc driver (e.g. "sqlite+aiosqlite://" for tests).
+    db_async_url: Optional[str] = None
+
+    # Connection pool. Size the pool for the concurrent DB work a worker runs (threadpool tokens or async requests):
+    # requests beyond pool_size + max_overflow queue for up to pool_timeout seconds.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    # Recycle connections older than this many seconds (-1 disables); pre-ping drops connections left stale by a failover.
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # Readable secondary serving GET requests (writes and other requests stay on the primary). db_read_url and
+    # db_async_read_url point at it directly; with only db_read_replica on, reads use the MSSQL URL above with
+    # ApplicationIntent=ReadOnly, which an availability group listener routes to a readable secondary.
+    db_read_replica: bool = False
+    db_read_url: Optional[str] = None
+    db_async_read_url: Optional[str] = None
+    # Read-your-writes: after a write, the client's reads go to the primary for this many seconds (via a cookie), and
+    # any request carrying an X-Read-Primary header does. Cover the replica's usual lag.
+    db_read_your_writes_seconds: float = 5
+
+    # Connections opened into each pool at startup (capped at db_pool_size), so the first requests do not pay for
+    # connecting; startup also runs the hot read statements once to compile them into the engine's statement cache.
+    db_pool_warmup_connections: int = 2
+    db_prime_statements: bool = True
+
+    # How the Stand aggregate (parts + attributes) is loaded: "selectin" = 3 statements, "joined" = 1 statement.
+    stand_loader_strategy: Literal["selectin", "joined"] = "selectin"
+
+    # GET /stands/{stand_oid}/ read path: "orm" builds ORM -> domain -> schema objects, "fast" maps Core rows straight
+    # to constructed schemas. Both produce identical JSON.
+    stand_read_mode: Literal["orm", "fast"] = "orm"
+
+    # GET /stands/ page size; requests above the maximum are clamped to it.
+    stand_page_default_limit: int = 100
+    stand_page_max_limit: int = 500
+
+    # In-process cache of Stand aggregates for GET /stands/{stand_oid}/ (0 entries disables it).
+    stand_cache_max_entries: int = 10000
+    stand_cache_ttl_seconds: float = 60
+
+    # Concurrent GET /stands/{stand_oid}/ cache misses for the same stand and options share one in-flight load.
+    stand_read_coalescing: bool = True
+
+    # GET /stands/summary results are recomputed every stand_summary_refresh_seconds by a task the app runs, and in the
+    # background by a read that finds one older than that (e.g. expired by an ingest). The groupings listed in
+    # stand_summary_precompute (e.g. [["species"], ["species", "ownership"]]) are computed at startup, so that not even
+    # their first read queries the base tables.
+    stand_summary_refresh_seconds: float = 300
+    stand_summary_precompute: List[List[str]] = []
+
+    # Columnar snapshot of the current STAND_ATTRIBUTES rows behind GET /stands/snapshot (off unless enabled). Once it
+    # is refresh_seconds old it is refreshed incrementally in the background; every full_reload_seconds it is rebuilt.
+    stand_snapshot_enabled: bool = False
+    stand_snapshot_refresh_seconds: float = 30
+    stand_snapshot_full_reload_seconds: float = 3600
+
+    # Rows fetched per round trip by the streaming /stands/export cursor.
+    stand_export_yield_per: int = 1000
+
+    # Rows fetched per round trip while streaming GET /stands/changes.
+    stand_changes_batch_size: int = 500
+
+    # Upper bound on the levels a part ancestors/descendants request walks (MSSQL's default MAXRECURSION is 100).
+    stand_part_tree_max_depth: int = 100
+
+    # Stands written per transaction by POST /stands/ingest; a failed chunk is retried one stand per transaction.
+    stand_ingest_chunk_size: int = 1000
+
+    # Admission control for DB-bound routes: each route group runs at most its share of the connections a pool can hand
+    # out (db_pool_size + db_max_overflow) at once, and the shares add up to at most the whole pool, so requests are turned
+    # away with a 503 rather than left queueing for db_pool_timeout. Up to admission_max_queue more requests per group
+    # wait for at most admission_queue_timeout_seconds; the rest fail fast with 503 and Retry-After.
+    admission_enabled: bool = True
+    admission_pool_shares: Dict[str, float] = {
+        "stand_read": 0.4,
+        "stand_listing": 0.2,
+        "stand_export": 0.1,
+        "stand_changes": 0.1,
+        "stand_ingest": 0.1,
+        "stand_summary": 0.05,
+        "stand_snapshot": 0.05,
+    }
+    admission_max_queue: int = 100
+    admission_queue_timeout_seconds: float = 2
+    admission_retry_after_seconds: int = 1
+
+    # At shutdown, background summary and snapshot refreshes get this long to finish before the engines are disposed.
+    shutdown_drain_seconds: float = 10
+
+    # Per-request phase timing: a Server-Timing header and an "app.request_timing" log record for every request.
+    request_timing_enabled: bool = True
+    # Opt-in stack profiler: profile this fraction of requests, and/or every request slower than request_profile_slow_ms.
+    request_profile_rate: float = 0.0
+    request_profile_slow_ms: Optional[float] = None
+    request_profile_interval_ms: float = 5
 
     class Config:
         env_file = ".env"  # This tells Pydantic to load the .env file
 
+    def database_url(self) -> str:
+        return self.db_url or self.mssql_url("pyodbc")
+
+    def async_database_url(self) -> str:
+        return self.db_async_url or self.mssql_url("aioodbc")
+
+    def read_database_url(self) -> Optional[str]:
+        if self.db_read_url is not None:
+            return self.db_read_url
+        return self.mssql_url("pyodbc") + "&ApplicationIntent=ReadOnly" if self.db_read_replica else None
+
+    def async_read_database_url(self) -> Optional[str]:
+        if self.db_async_read_url is not None:
+            return self.db_async_read_url
+        return self.mssql_url("aioodbc") + "&ApplicationIntent=ReadOnly" if self.db_read_replica else None
+
+    def mssql_url(self, driver: str) -> str:
+        required = ("db_username", "db_password", "db_host", "db_name", "db_odbc_driver")
+        missing = [name.upper() for name in required if getattr(self, name) is None]
+        if missing:
+            raise ValueError(f"Set DB_URL or the MSSQL connection settings ({', '.join(missing)} missing)")
+        return f"mssql+{driver}://{self.db_username}:{self.db_password}@{self.db_host}/{self.db_name}?driver={self.db_odbc_driver}"
+
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    The process' Settings, read from the environment and .env on first use rather than at import.
+    """
+    return Settings()
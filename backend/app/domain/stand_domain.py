@@ -1,17 +1,18 @@
 # domain model
-from dataclasses import dataclass, field
+# Slotted dataclasses: no per-instance __dict__, which matters for batch jobs holding hundreds of thousands of rows.
+from dataclasses import dataclass, field, fields, make_dataclass
 from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Stand:
     stand_oid: str
     od_object_type: Optional[str] = None
     stand_parts: List["StandPart"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StandPart:
     stand_part_oid: str
     stand_oid: str
@@ -23,7 +24,7 @@ class StandPart:
     stand_attributes: List["StandAttributes"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StandAttributes:
     stand_part_oid: str
     effective_date: Optional[datetime] = None
@@ -60,3 +61,33 @@ class StandAttributes:
     aspect: Optional[float] = None
     elevation: Optional[float] = None
     edx_in_progress_flag: Optional[str] = None
+
+
+# Code-like columns with few distinct values. Compact conversions intern them so equal values share one str object.
+LOW_CARDINALITY_FIELDS = (
+    "status",
+    "timber_type",
+    "harvest_code",
+    "source",
+    "ownership",
+    "species",
+    "co_dom_species",
+    "regeneration_type",
+    "special_area_flag",
+    "survival_status",
+    "strata",
+    "reserved_timber_stand_flag",
+    "sold_flag",
+    "cng_edx_import_flag",
+    "decremented_from_ss_flag",
+    "edx_in_progress_flag",
+)
+
+# Immutable (and hashable) StandAttributes with the same fields, for long-lived snapshots shared between callers.
+FrozenStandAttributes = make_dataclass(
+    "FrozenStandAttributes",
+    [(f.name, f.type, field(default=f.default)) for f in fields(StandAttributes)],
+    frozen=True,
+    slots=True,
+)
+FrozenStandAttributes.__module__ = __name__
@@ -0,0 +1,132 @@
+"""
+Table-driven converters between the ORM, domain and schema representations of a record.
+
+The field list is derived once, at import time, from the dataclass, ORM mapper and Pydantic model metadata, and
+`field_mapping` refuses to build a converter when the three disagree, so a column added to one layer but not the
+others fails at startup instead of being silently dropped. Each `compile_*` function returns a (convert, convert_many)
+pair specialized for one target type.
+"""
+
+import dataclasses
+import sys
+from itertools import starmap
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import inspect
+
+T = TypeVar("T")
+Converter = Tuple[Callable[[Any], T], Callable[[Iterable[Any]], List[T]]]
+
+
+def dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def orm_field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(column_attr.key for column_attr in inspect(cls).column_attrs)
+
+
+def schema_field_names(cls: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(cls.model_fields)
+
+
+def field_mapping(dataclass_cls: type, orm_cls: type, schema_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """
+    The fields shared by all three representations, in the dataclass' positional order.
+    Raises TypeError if any representation has a field the others lack.
+    """
+    fields = dataclass_field_names(dataclass_cls)
+    for cls, names in ((orm_cls, orm_field_names(orm_cls)), (schema_cls, schema_field_names(schema_cls))):
+        if set(names) != set(fields):
+            missing = sorted(set(fields) - set(names))
+            extra = sorted(set(names) - set(fields))
+            raise TypeError(f"{cls.__qualname__} does not match {dataclass_cls.__qualname__}: missing {missing}, extra {extra}")
+    return fields
+
+
+def _tuple_getter(fields: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    # attrgetter returns a bare value rather than a 1-tuple when given a single name
+    if len(fields) == 1:
+        return lambda source: (getattr(source, fields[0]),)
+    return attrgetter(*fields)
+
+
+def _orm_tuple_getter(fields: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    # Loaded ORM instances keep their column values in __dict__; reading it directly skips the instrumented descriptors.
+    # Unloaded (deferred or expired) attributes are missing from __dict__ and go through normal attribute access.
+    from_dict = itemgetter(*fields) if len(fields) > 1 else (lambda values: (values[fields[0]],))
+    from_attributes = _tuple_getter(fields)
+
+    def get(source: Any) -> Tuple[Any, ...]:
+        try:
+            return from_dict(source.__dict__)
+        except KeyError:
+            return from_attributes(source)
+
+    return get
+
+
+def _interning(get: Callable[[Any], Tuple[Any, ...]], positions: List[int]) -> Callable[[Any], List[Any]]:
+    def get_interned(source: Any) -> List[Any]:
+        values = list(get(source))
+        for i in positions:
+            if values[i] is not None:
+                values[i] = sys.intern(values[i])
+        return values
+
+    return get_interned
+
+
+def compile_to_dataclass(cls: Type[T], fields: Tuple[str, ...], from_orm: bool = False, intern_fields: Iterable[str] = ()) -> Converter[T]:
+    """
+    Read `fields` off the source with one C-level getter call and pass them positionally to the dataclass.
+    `fields` must be the dataclass' own field order. Set `from_orm` when the sources are ORM instances.
+    String values of `intern_fields` are interned, so repeated codes share one object across all converted rows.
+    """
+    if dataclass_field_names(cls) != fields:
+        raise TypeError(f"fields are not in {cls.__qualname__}'s positional order")
+    get = _orm_tuple_getter(fields) if from_orm else _tuple_getter(fields)
+    intern_positions = [fields.index(name) for name in intern_fields]
+    if intern_positions:
+        get = _interning(get, intern_positions)
+
+    def convert(source: Any) -> T:
+        return cls(*get(source))
+
+    def convert_many(sources: Iterable[Any]) -> List[T]:
+        return list(starmap(cls, map(get, sources)))
+
+    return convert, convert_many
+
+
+def compile_to_schema(cls: Type[BaseModel]) -> Converter[BaseModel]:
+    """
+    Validate straight from the source object's attributes; pydantic-core reads them without building kwargs.
+    The batch variant validates the whole list in a single call.
+    """
+    many = TypeAdapter(List[cls])
+
+    def convert(source: Any) -> BaseModel:
+        return cls.model_validate(source, from_attributes=True)
+
+    def convert_many(sources: Iterable[Any]) -> List[BaseModel]:
+        return many.validate_python(list(sources), from_attributes=True)
+
+    return convert, convert_many
+
+
+def compile_to_orm(cls: Type[T], fields: Tuple[str, ...]) -> Converter[T]:
+    """
+    ORM constructors must go through the mapper's instrumented __init__, so these only save building the kwargs by hand.
+    """
+    get = _tuple_getter(fields)
+
+    def convert(source: Any) -> T:
+        return cls(**dict(zip(fields, get(source))))
+
+    def convert_many(sources: Iterable[Any]) -> List[T]:
+        return [cls(**dict(zip(fields, values))) for values in map(get, sources)]
+
+    return convert, convert_many
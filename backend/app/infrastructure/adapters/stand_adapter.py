@@ -1,23 +1,57 @@
-from typing import List
+import sys
+from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import Column, Numeric, inspect
+from sqlalchemy.engine import Row
 from app.infrastructure.orm_models.stand_model import Stand as ORMStand, StandPart as ORMStandPart, StandAttributes as ORMStandAttributes
-from app.domain.stand_domain import Stand as DomainStand, StandPart as DomainStandPart, StandAttributes as DomainStandAttributes
-from app.schemas.stand_schema import StandSchema, StandPartSchema, StandAttributesSchema
+from app.domain.stand_domain import (
+    LOW_CARDINALITY_FIELDS,
+    FrozenStandAttributes,
+    Stand as DomainStand,
+    StandPart as DomainStandPart,
+    StandAttributes as DomainStandAttributes,
+)
+from app.schemas.stand_schema import StandSchema, StandPartSchema, StandPartTreeSchema, StandAttributesSchema
+from app.infrastructure.adapters import converters
+from app.infrastructure.timing import timed
+
+# The StandAttributes field list is derived from the three models at import time (and checked to agree across them);
+# the attribute adapters below are compiled from it rather than spelling out every field.
+STAND_ATTRIBUTES_FIELDS = converters.field_mapping(DomainStandAttributes, ORMStandAttributes, StandAttributesSchema)
+_orm_to_domain_stand_attributes, _orm_to_domain_stand_attributes_many = converters.compile_to_dataclass(
+    DomainStandAttributes, STAND_ATTRIBUTES_FIELDS, from_orm=True
+)
+_orm_to_compact_stand_attributes, _orm_to_compact_stand_attributes_many = converters.compile_to_dataclass(
+    DomainStandAttributes, STAND_ATTRIBUTES_FIELDS, from_orm=True, intern_fields=LOW_CARDINALITY_FIELDS
+)
+_orm_to_frozen_stand_attributes, _orm_to_frozen_stand_attributes_many = converters.compile_to_dataclass(
+    FrozenStandAttributes, STAND_ATTRIBUTES_FIELDS, from_orm=True, intern_fields=LOW_CARDINALITY_FIELDS
+)
+_schema_to_domain_stand_attributes, _schema_to_domain_stand_attributes_many = converters.compile_to_dataclass(
+    DomainStandAttributes, STAND_ATTRIBUTES_FIELDS
+)
+_domain_to_schema_stand_attributes, _domain_to_schema_stand_attributes_many = converters.compile_to_schema(StandAttributesSchema)
+_domain_to_orm_stand_attributes, _domain_to_orm_stand_attributes_many = converters.compile_to_orm(ORMStandAttributes, STAND_ATTRIBUTES_FIELDS)
 
 # --------- ORM Model to Domain Model Adapters ---------
 
 
-def orm_to_domain(orm_stand: ORMStand) -> DomainStand:
+@timed("adapter")
+def orm_to_domain(orm_stand: ORMStand, attribute_fields: Optional[Sequence[str]] = None) -> DomainStand:
     """
     Convert an ORM Stand object to a Domain Stand object.
+    `attribute_fields` limits the StandAttributes values read to those loaded by a load_only query; the rest are None.
     """
     return DomainStand(
         stand_oid=orm_stand.stand_oid,
         od_object_type=orm_stand.od_object_type,
-        stand_parts=[orm_to_domain_stand_part(part) for part in orm_stand.stand_part_children],
+        stand_parts=[orm_to_domain_stand_part(part, attribute_fields) for part in orm_stand.stand_part_children],
     )
 
 
-def orm_to_domain_stand_part(orm_stand_part: ORMStandPart) -> DomainStandPart:
+def orm_to_domain_stand_part(orm_stand_part: ORMStandPart, attribute_fields: Optional[Sequence[str]] = None) -> DomainStandPart:
     """
     Convert an ORM StandPart object to a Domain StandPart object.
     """
@@ -25,11 +59,11 @@ def orm_to_domain_stand_part(orm_stand_part: ORMStandPart) -> DomainStandPart:
         stand_part_oid=orm_stand_part.stand_part_oid,
         stand_oid=orm_stand_part.stand_oid,
         stand_pnt_part_oid=orm_stand_part.stand_pnt_part_oid,
-        od_part_type=orm_stand_part.od_part_type,
+        od_part_type=sys.intern(orm_stand_part.od_part_type) if orm_stand_part.od_part_type is not None else None,
         rte_scenario_oid=orm_stand_part.rte_scenario_oid,
         effective_date=orm_stand_part.effective_date,
         expiry_date=orm_stand_part.expiry_date,
-        stand_attributes=[orm_to_domain_stand_attributes(attr) for attr in orm_stand_part.stand_attribute_children],
+        stand_attributes=orm_to_domain_stand_attributes_many(orm_stand_part.stand_attribute_children, attribute_fields),
     )
 
 
@@ -37,60 +71,47 @@ def orm_to_domain_stand_attributes(orm_attr: ORMStandAttributes) -> DomainStandA
     """
     Convert an ORM StandAttributes object to a Domain StandAttributes object.
     """
-    return DomainStandAttributes(
-        stand_part_oid=orm_attr.stand_part_oid,
-        effective_date=orm_attr.effective_date,
-        relate=orm_attr.relate,
-        stand_number=orm_attr.stand_number,
-        status=orm_attr.status,
-        timber_type=orm_attr.timber_type,
-        harvest_code=orm_attr.harvest_code,
-        established_year=orm_attr.established_year,
-        last_thinned_date=orm_attr.last_thinned_date,
-        last_thinned_year=orm_attr.last_thinned_year,
-        first_thin_year=orm_attr.first_thin_year,
-        second_thin_year=orm_attr.second_thin_year,
-        third_thin_year=orm_attr.third_thin_year,
-        site_index=orm_attr.site_index,
-        source=orm_attr.source,
-        old_id_1=orm_attr.old_id_1,
-        old_id_2=orm_attr.old_id_2,
-        ownership=orm_attr.ownership,
-        description=orm_attr.description,
-        species=orm_attr.species,
-        co_dom_species=orm_attr.co_dom_species,
-        regeneration_type=orm_attr.regeneration_type,
-        special_area_flag=orm_attr.special_area_flag,
-        survival_status=orm_attr.survival_status,
-        survival_checked=orm_attr.survival_checked,
-        strata=orm_attr.strata,
-        reserved_timber_stand_flag=orm_attr.reserved_timber_stand_flag,
-        sold_flag=orm_attr.sold_flag,
-        old_oid=orm_attr.old_oid,
-        cng_edx_import_flag=orm_attr.cng_edx_import_flag,
-        decremented_from_ss_flag=orm_attr.decremented_from_ss_flag,
-        slope=orm_attr.slope,
-        aspect=orm_attr.aspect,
-        elevation=orm_attr.elevation,
-        edx_in_progress_flag=orm_attr.edx_in_progress_flag,
-    )
+    return _orm_to_domain_stand_attributes(orm_attr)
+
+
+def orm_to_domain_stand_attributes_many(
+    orm_attrs: Iterable[ORMStandAttributes], fields: Optional[Sequence[str]] = None
+) -> List[DomainStandAttributes]:
+    if fields is not None:
+        # Reading an unloaded column would issue a lazy load per row, so only the loaded ones are touched.
+        return [DomainStandAttributes(**{name: getattr(orm_attr, name) for name in fields}) for orm_attr in orm_attrs]
+    return _orm_to_domain_stand_attributes_many(orm_attrs)
+
+
+def orm_to_compact_stand_attributes_many(
+    orm_attrs: Iterable[ORMStandAttributes], frozen: bool = False
+) -> Union[List[DomainStandAttributes], List[FrozenStandAttributes]]:
+    """
+    Batch conversion for jobs that hold many rows in memory: low-cardinality codes are interned, and with `frozen`
+    the rows are immutable FrozenStandAttributes. Both are accepted anywhere a Domain StandAttributes is.
+    """
+    if frozen:
+        return _orm_to_frozen_stand_attributes_many(orm_attrs)
+    return _orm_to_compact_stand_attributes_many(orm_attrs)
 
 
 # --------- Domain Model to Pydantic Schema Adapters ---------
 
 
-def domain_to_schema_stand(domain_stand: DomainStand) -> StandSchema:
+@timed("adapter")
+def domain_to_schema_stand(domain_stand: DomainStand, attribute_fields: Optional[Sequence[str]] = None) -> StandSchema:
     """
     Convert a Domain Stand object to a Pydantic StandSchema.
+    With `attribute_fields`, only those StandAttributes fields are set, so serializing with exclude_unset leaves out the rest.
     """
     return StandSchema(
         stand_oid=domain_stand.stand_oid,
         od_object_type=domain_stand.od_object_type,
-        stand_parts=[domain_to_schema_stand_part(part) for part in domain_stand.stand_parts],
+        stand_parts=[domain_to_schema_stand_part(part, attribute_fields) for part in domain_stand.stand_parts],
     )
 
 
-def domain_to_schema_stand_part(domain_stand_part: DomainStandPart) -> StandPartSchema:
+def domain_to_schema_stand_part(domain_stand_part: DomainStandPart, attribute_fields: Optional[Sequence[str]] = None) -> StandPartSchema:
     """
     Convert a Domain StandPart object to a Pydantic StandPartSchema.
     """
@@ -102,7 +123,7 @@ def domain_to_schema_stand_part(domain_stand_part: DomainStandPart) -> StandPart
         rte_scenario_oid=domain_stand_part.rte_scenario_oid,
         effective_date=domain_stand_part.effective_date,
         expiry_date=domain_stand_part.expiry_date,
-        stand_attributes=[domain_to_schema_stand_attributes(attr) for attr in domain_stand_part.stand_attributes],
+        stand_attributes=domain_to_schema_stand_attributes_many(domain_stand_part.stand_attributes, attribute_fields),
     )
 
 
@@ -110,48 +131,53 @@ def domain_to_schema_stand_attributes(domain_attr: DomainStandAttributes) -> Sta
     """
     Convert a Domain StandAttributes object to a Pydantic StandAttributesSchema.
     """
-    return StandAttributesSchema(
-        stand_part_oid=domain_attr.stand_part_oid,
-        effective_date=domain_attr.effective_date,
-        relate=domain_attr.relate,
-        stand_number=domain_attr.stand_number,
-        status=domain_attr.status,
-        timber_type=domain_attr.timber_type,
-        harvest_code=domain_attr.harvest_code,
-        established_year=domain_attr.established_year,
-        last_thinned_date=domain_attr.last_thinned_date,
-        last_thinned_year=domain_attr.last_thinned_year,
-        first_thin_year=domain_attr.first_thin_year,
-        second_thin_year=domain_attr.second_thin_year,
-        third_thin_year=domain_attr.third_thin_year,
-        site_index=domain_attr.site_index,
-        source=domain_attr.source,
-        old_id_1=domain_attr.old_id_1,
-        old_id_2=domain_attr.old_id_2,
-        ownership=domain_attr.ownership,
-        description=domain_attr.description,
-        species=domain_attr.species,
-        co_dom_species=domain_attr.co_dom_species,
-        regeneration_type=domain_attr.regeneration_type,
-        special_area_flag=domain_attr.special_area_flag,
-        survival_status=domain_attr.survival_status,
-        survival_checked=domain_attr.survival_checked,
-        strata=domain_attr.strata,
-        reserved_timber_stand_flag=domain_attr.reserved_timber_stand_flag,
-        sold_flag=domain_attr.sold_flag,
-        old_oid=domain_attr.old_oid,
-        cng_edx_import_flag=domain_attr.cng_edx_import_flag,
-        decremented_from_ss_flag=domain_attr.decremented_from_ss_flag,
-        slope=domain_attr.slope,
-        aspect=domain_attr.aspect,
-        elevation=domain_attr.elevation,
-        edx_in_progress_flag=domain_attr.edx_in_progress_flag,
-    )
+    return _domain_to_schema_stand_attributes(domain_attr)
+
+
+def domain_to_schema_stand_attributes_many(
+    domain_attrs: Iterable[DomainStandAttributes], fields: Optional[Sequence[str]] = None
+) -> List[StandAttributesSchema]:
+    if fields is not None:
+        return [StandAttributesSchema.model_validate({name: getattr(domain_attr, name) for name in fields}) for domain_attr in domain_attrs]
+    return _domain_to_schema_stand_attributes_many(domain_attrs)
+
+
+@timed("adapter")
+def domain_to_schema_part_tree(
+    parts: Sequence[Tuple[DomainStandPart, int]], ancestors: bool = False, attribute_fields: Optional[Sequence[str]] = None
+) -> Optional[StandPartTreeSchema]:
+    """
+    Nest depth-ordered (part, depth) pairs into a StandPartTreeSchema. Descendants are rooted at the requested part (depth 0);
+    ancestors at the furthest ancestor found, with the chain running down to the requested part. With `attribute_fields`,
+    only those StandAttributes fields are set, as loaded by get_part_tree.
+    On cyclic parent links a part comes back once per lap of the cycle; only its first (shallowest) occurrence is kept,
+    which cuts the cycle at the link that closes it.
+    """
+    if not parts:
+        return None
+    nodes: Dict[str, StandPartTreeSchema] = {}
+    for part, depth in parts:
+        if part.stand_part_oid in nodes:
+            if ancestors:
+                break  # the chain has come back round: everything further up is already in it
+            continue
+        nodes[part.stand_part_oid] = StandPartTreeSchema.model_construct(
+            **dict(domain_to_schema_stand_part(part, attribute_fields)), depth=depth, children=[]
+        )
+    chain = list(nodes.values())
+    if ancestors:
+        for parent, child in zip(chain[1:], chain):
+            parent.children.append(child)
+        return chain[-1]
+    for node in chain[1:]:
+        nodes[node.stand_pnt_part_oid].children.append(node)
+    return chain[0]
 
 
 # --------- Pydantic Schema to Domain Model Adapters ---------
 
 
+@timed("adapter")
 def schema_to_domain_stand(stand_schema: StandSchema) -> DomainStand:
     """
     Convert a Pydantic StandSchema to a Domain Stand.
@@ -175,7 +201,7 @@ def schema_to_domain_stand_part(stand_part_schema: StandPartSchema) -> DomainSta
         rte_scenario_oid=stand_part_schema.rte_scenario_oid,
         effective_date=stand_part_schema.effective_date,
         expiry_date=stand_part_schema.expiry_date,
-        stand_attributes=[schema_to_domain_stand_attributes(attr) for attr in stand_part_schema.stand_attributes],
+        stand_attributes=schema_to_domain_stand_attributes_many(stand_part_schema.stand_attributes),
     )
 
 
@@ -183,48 +209,17 @@ def schema_to_domain_stand_attributes(stand_attr_schema: StandAttributesSchema)
     """
     Convert a Pydantic StandAttributesSchema to a Domain StandAttributes.
     """
-    return DomainStandAttributes(
-        stand_part_oid=stand_attr_schema.stand_part_oid,
-        effective_date=stand_attr_schema.effective_date,
-        relate=stand_attr_schema.relate,
-        stand_number=stand_attr_schema.stand_number,
-        status=stand_attr_schema.status,
-        timber_type=stand_attr_schema.timber_type,
-        harvest_code=stand_attr_schema.harvest_code,
-        established_year=stand_attr_schema.established_year,
-        last_thinned_date=stand_attr_schema.last_thinned_date,
-        last_thinned_year=stand_attr_schema.last_thinned_year,
-        first_thin_year=stand_attr_schema.first_thin_year,
-        second_thin_year=stand_attr_schema.second_thin_year,
-        third_thin_year=stand_attr_schema.third_thin_year,
-        site_index=stand_attr_schema.site_index,
-        source=stand_attr_schema.source,
-        old_id_1=stand_attr_schema.old_id_1,
-        old_id_2=stand_attr_schema.old_id_2,
-        ownership=stand_attr_schema.ownership,
-        description=stand_attr_schema.description,
-        species=stand_attr_schema.species,
-        co_dom_species=stand_attr_schema.co_dom_species,
-        regeneration_type=stand_attr_schema.regeneration_type,
-        special_area_flag=stand_attr_schema.special_area_flag,
-        survival_status=stand_attr_schema.survival_status,
-        survival_checked=stand_attr_schema.survival_checked,
-        strata=stand_attr_schema.strata,
-        reserved_timber_stand_flag=stand_attr_schema.reserved_timber_stand_flag,
-        sold_flag=stand_attr_schema.sold_flag,
-        old_oid=stand_attr_schema.old_oid,
-        cng_edx_import_flag=stand_attr_schema.cng_edx_import_flag,
-        decremented_from_ss_flag=stand_attr_schema.decremented_from_ss_flag,
-        slope=stand_attr_schema.slope,
-        aspect=stand_attr_schema.aspect,
-        elevation=stand_attr_schema.elevation,
-        edx_in_progress_flag=stand_attr_schema.edx_in_progress_flag,
-    )
+    return _schema_to_domain_stand_attributes(stand_attr_schema)
+
+
+def schema_to_domain_stand_attributes_many(stand_attr_schemas: Iterable[StandAttributesSchema]) -> List[DomainStandAttributes]:
+    return _schema_to_domain_stand_attributes_many(stand_attr_schemas)
 
 
 # --------- Domain Model to ORM Adapters ---------
 
 
+@timed("adapter")
 def domain_to_orm(domain_stand: DomainStand) -> ORMStand:
     """
     Convert a Domain Stand to an ORM Stand.
@@ -250,7 +245,7 @@ def domain_to_orm_stand_part(domain_stand_part: DomainStandPart) -> ORMStandPart
         effective_date=domain_stand_part.effective_date,
         expiry_date=domain_stand_part.expiry_date,
     )
-    orm_stand_part.stand_attribute_children = [domain_to_orm_stand_attributes(attr) for attr in domain_stand_part.stand_attributes]
+    orm_stand_part.stand_attribute_children = domain_to_orm_stand_attributes_many(domain_stand_part.stand_attributes)
     return orm_stand_part
 
 
@@ -258,40 +253,125 @@ def domain_to_orm_stand_attributes(domain_attr: DomainStandAttributes) -> ORMSta
     """
     Convert a Domain StandAttributes to an ORM StandAttributes.
     """
-    return ORMStandAttributes(
-        stand_part_oid=domain_attr.stand_part_oid,
-        effective_date=domain_attr.effective_date,
-        relate=domain_attr.relate,
-        stand_number=domain_attr.stand_number,
-        status=domain_attr.status,
-        timber_type=domain_attr.timber_type,
-        harvest_code=domain_attr.harvest_code,
-        established_year=domain_attr.established_year,
-        last_thinned_date=domain_attr.last_thinned_date,
-        last_thinned_year=domain_attr.last_thinned_year,
-        first_thin_year=domain_attr.first_thin_year,
-        second_thin_year=domain_attr.second_thin_year,
-        third_thin_year=domain_attr.third_thin_year,
-        site_index=domain_attr.site_index,
-        source=domain_attr.source,
-        old_id_1=domain_attr.old_id_1,
-        old_id_2=domain_attr.old_id_2,
-        ownership=domain_attr.ownership,
-        description=domain_attr.description,
-        species=domain_attr.species,
-        co_dom_species=domain_attr.co_dom_species,
-        regeneration_type=domain_attr.regeneration_type,
-        special_area_flag=domain_attr.special_area_flag,
-        survival_status=domain_attr.survival_status,
-        survival_checked=domain_attr.survival_checked,
-        strata=domain_attr.strata,
-        reserved_timber_stand_flag=domain_attr.reserved_timber_stand_flag,
-        sold_flag=domain_attr.sold_flag,
-        old_oid=domain_attr.old_oid,
-        cng_edx_import_flag=domain_attr.cng_edx_import_flag,
-        decremented_from_ss_flag=domain_attr.decremented_from_ss_flag,
-        slope=domain_attr.slope,
-        aspect=domain_attr.aspect,
-        elevation=domain_attr.elevation,
-        edx_in_progress_flag=domain_attr.edx_in_progress_flag,
-    )
+    return _domain_to_orm_stand_attributes(domain_attr)
+
+
+def domain_to_orm_stand_attributes_many(domain_attrs: Iterable[DomainStandAttributes]) -> List[ORMStandAttributes]:
+    return _domain_to_orm_stand_attributes_many(domain_attrs)
+
+
+# --------- Domain Model to Bulk Parameter Adapters ---------
+# Plain dicts keyed by ORM attribute name, the parameter format of ORM bulk INSERT / UPDATE by primary key.
+
+_stand_attributes_values = attrgetter(*STAND_ATTRIBUTES_FIELDS)
+
+
+@timed("adapter")
+def domain_to_rows(domain_stands: Iterable[DomainStand]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Flatten Domain Stands into STAND, STAND_PART and STAND_ATTRIBUTES parameter rows.
+    """
+    stand_rows, part_rows, attribute_rows = [], [], []
+    for domain_stand in domain_stands:
+        stand_rows.append({"stand_oid": domain_stand.stand_oid, "od_object_type": domain_stand.od_object_type})
+        for part in domain_stand.stand_parts:
+            part_rows.append(
+                {
+                    "stand_part_oid": part.stand_part_oid,
+                    "stand_oid": part.stand_oid,
+                    "stand_pnt_part_oid": part.stand_pnt_part_oid,
+                    "od_part_type": part.od_part_type,
+                    "rte_scenario_oid": part.rte_scenario_oid,
+                    "effective_date": part.effective_date,
+                    "expiry_date": part.expiry_date,
+                }
+            )
+            attribute_rows.extend(dict(zip(STAND_ATTRIBUTES_FIELDS, _stand_attributes_values(attr))) for attr in part.stand_attributes)
+    return stand_rows, part_rows, attribute_rows
+
+
+# --------- SQLAlchemy Core Row to Pydantic Schema Adapters ---------
+# The fast read path selects plain columns and builds already-valid schemas with model_construct, skipping the ORM
+# and domain copies. Values are normalized the way schema validation would (Numeric Decimals become floats), so the
+# JSON produced is identical to domain_to_schema_stand's.
+
+
+def mapped_columns(orm_class) -> Tuple[Tuple[str, Column], ...]:
+    """
+    (attribute name, Column) for every mapped column of an ORM class, in declaration order.
+    """
+    return tuple((column_attr.key, column_attr.columns[0]) for column_attr in inspect(orm_class).column_attrs)
+
+
+STAND_COLUMNS = mapped_columns(ORMStand)
+STAND_PART_COLUMNS = mapped_columns(ORMStandPart)
+STAND_ATTRIBUTES_COLUMNS = mapped_columns(ORMStandAttributes)
+STAND_ROW_COLUMNS = tuple(column for _, column in STAND_COLUMNS + STAND_PART_COLUMNS + STAND_ATTRIBUTES_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def stand_attributes_columns(fields: Optional[Tuple[str, ...]] = None) -> Tuple[Tuple[str, Column], ...]:
+    """
+    STAND_ATTRIBUTES_COLUMNS limited to `fields` (all of them when None). STAND_PART_OID stays first either way.
+    """
+    if fields is None:
+        return STAND_ATTRIBUTES_COLUMNS
+    return tuple((key, column) for key, column in STAND_ATTRIBUTES_COLUMNS if key in fields or key == "stand_part_oid")
+
+
+def stand_row_columns(attribute_fields: Optional[Sequence[str]] = None) -> Tuple[Column, ...]:
+    if attribute_fields is None:
+        return STAND_ROW_COLUMNS
+    return tuple(column for _, column in STAND_COLUMNS + STAND_PART_COLUMNS + stand_attributes_columns(tuple(attribute_fields)))
+
+
+def _float(value: Optional[Decimal]) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _row_reader(columns: Tuple[Tuple[str, Column], ...], offset: int) -> Callable[[Row], Dict[str, Any]]:
+    keys = [key for key, _ in columns]
+    converters = [(i, _float) for i, (_, column) in enumerate(columns) if isinstance(column.type, Numeric) and column.type.asdecimal]
+    end = offset + len(columns)
+
+    def read(row: Row) -> Dict[str, Any]:
+        values = list(row[offset:end])
+        for i, convert in converters:
+            values[i] = convert(values[i])
+        return dict(zip(keys, values))
+
+    return read
+
+
+_read_stand = _row_reader(STAND_COLUMNS, 0)
+_read_stand_part = _row_reader(STAND_PART_COLUMNS, len(STAND_COLUMNS))
+_read_stand_attributes = _row_reader(STAND_ATTRIBUTES_COLUMNS, len(STAND_COLUMNS) + len(STAND_PART_COLUMNS))
+_STAND_PART_OID = len(STAND_COLUMNS) + [key for key, _ in STAND_PART_COLUMNS].index("stand_part_oid")
+_STAND_ATTRIBUTES_OID = len(STAND_COLUMNS) + len(STAND_PART_COLUMNS) + [key for key, _ in STAND_ATTRIBUTES_COLUMNS].index("stand_part_oid")
+
+
+@lru_cache(maxsize=None)
+def _sparse_stand_attributes_reader(fields: Tuple[str, ...]) -> Callable[[Row], Dict[str, Any]]:
+    return _row_reader(stand_attributes_columns(fields), len(STAND_COLUMNS) + len(STAND_PART_COLUMNS))
+
+
+@timed("adapter")
+def rows_to_schema_stand(rows: Sequence[Row], attribute_fields: Optional[Sequence[str]] = None) -> Optional[StandSchema]:
+    """
+    Build a StandSchema from the STAND ⟕ STAND_PART ⟕ STAND_ATTRIBUTES rows of one stand (columns in stand_row_columns(attribute_fields)
+    order, ordered by part). Returns None when there are no rows.
+    """
+    if not rows:
+        return None
+    read_attributes = _read_stand_attributes if attribute_fields is None else _sparse_stand_attributes_reader(tuple(attribute_fields))
+    parts: Dict[str, StandPartSchema] = {}
+    for row in rows:
+        stand_part_oid = row[_STAND_PART_OID]
+        if stand_part_oid is None:
+            continue
+        part = parts.get(stand_part_oid)
+        if part is None:
+            part = parts[stand_part_oid] = StandPartSchema.model_construct(**_read_stand_part(row), stand_attributes=[])
+        if row[_STAND_ATTRIBUTES_OID] is not None:
+            part.stand_attributes.append(StandAttributesSchema.model_construct(**read_attributes(row)))
+    return StandSchema.model_construct(**_read_stand(rows[0]), stand_parts=list(parts.values()))
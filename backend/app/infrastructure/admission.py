@@ -0,0 +1,124 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, group: str, reason: str) -> None:
+        super().__init__(f"{group}: {reason}")
+        self.group = group
+        self.reason = reason
+
+
+class AdmissionLimiter:
+    """
+    Lets at most `limit` requests of a route group run at once. Up to `max_queue` more wait in FIFO order, each for at
+    most `queue_timeout` seconds; requests beyond the queue, or still waiting at the timeout, are rejected with
+    AdmissionRejected so the caller can fail fast instead of queueing on the connection pool.
+
+    Runs on the event loop: waiting requests hold neither a threadpool thread nor a pooled connection.
+    """
+
+    def __init__(self, group: str, limit: int, max_queue: int, queue_timeout: float) -> None:
+        self.group = group
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.max_queue_depth = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.queue_wait_total_ms = 0.0
+        self.queue_wait_max_ms = 0.0
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(self.group, "queue full")
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as the wait ended: pass it on.
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                self.rejected_timeout += 1
+                raise AdmissionRejected(self.group, "queue timeout") from None
+            raise
+        finally:
+            waited_ms = (time.perf_counter() - start) * 1000
+            self.queue_wait_total_ms += waited_ms
+            self.queue_wait_max_ms = max(self.queue_wait_max_ms, waited_ms)
+        self.admitted += 1
+
+    def release(self) -> None:
+        # The slot goes straight to the longest-waiting request, so `active` only drops when nobody is waiting.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queue_depth": len(self._waiters),
+            "max_queue_depth": self.max_queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "queue_wait_avg_ms": self.queue_wait_total_ms / self.queued if self.queued else 0.0,
+            "queue_wait_max_ms": self.queue_wait_max_ms,
+        }
+
+
+class AdmissionControl:
+    """
+    One AdmissionLimiter per route group, created on first use. The groups' shares partition the connections the pool
+    can hand out (pool_size + max_overflow): a group's limit is its share of them, rounded down but at least 1, and
+    groups without a share split nothing but what the listed ones leave over. So together the groups never admit more
+    requests than there are connections, except that a pool smaller than the number of groups still gives each one.
+    """
+
+    def __init__(self, pool_capacity: int, pool_shares: Mapping[str, float], max_queue: int, queue_timeout: float, retry_after_seconds: int) -> None:
+        if sum(pool_shares.values()) > 1 + 1e-9:
+            raise ValueError(f"admission pool shares add up to {sum(pool_shares.values()):g} of the pool, more than all of it")
+        self.pool_capacity = pool_capacity
+        self.pool_shares = dict(pool_shares)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        # Retry-After of the 503s sent for rejected requests.
+        self.retry_after_seconds = retry_after_seconds
+        self._limiters: Dict[str, AdmissionLimiter] = {}
+
+    def limit_for(self, group: str) -> int:
+        share = self.pool_shares.get(group, 1 - sum(self.pool_shares.values()))
+        return max(1, math.floor(self.pool_capacity * share + 1e-9))
+
+    def limiter(self, group: str) -> AdmissionLimiter:
+        limiter: Optional[AdmissionLimiter] = self._limiters.get(group)
+        if limiter is None:
+            limiter = self._limiters[group] = AdmissionLimiter(group, self.limit_for(group), self.max_queue, self.queue_timeout)
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {group: limiter.stats() for group, limiter in sorted(self._limiters.items())}
@@ -0,0 +1,224 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from fastapi import Request
+
+from app.infrastructure.single_flight import stand_reads
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded, thread-safe LRU cache whose entries also expire `ttl_seconds` after they were stored.
+    Values are shared between callers and must be treated as read-only.
+
+    `invalidate` can hold keys off for a while: until then `set` ignores them, so a value read from a replica that has
+    not caught up with the write yet is not cached for a whole TTL. It also bumps each key's `generation`: a loader that
+    records the generation before it reads and passes it to `set` does not cache a value that a write invalidated while
+    it was being loaded.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._held: Dict[Hashable, float] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self, key: Hashable) -> int:
+        # How many times `key` has been invalidated.
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def set(self, key: Hashable, value: V, generation: Optional[int] = None) -> None:
+        """
+        Cache `value` under `key`, unless `generation` is given and the key has been invalidated since it was read.
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation is not None and self._generations.get(key, 0) != generation:
+                return
+            now = self._clock()
+            if key in self._held:
+                if self._held[key] > now:
+                    return
+                del self._held[key]
+            self._entries[key] = (now + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys: Iterable[Hashable], hold_seconds: float = 0) -> int:
+        """
+        Drop the given keys, and keep them from being set again for `hold_seconds`; returns how many were cached.
+        Write paths call this after committing.
+        """
+        keys = list(keys)
+        with self._lock:
+            if hold_seconds > 0:
+                now = self._clock()
+                self._held = {key: until for key, until in self._held.items() if until > now}
+                self._held.update((key, now + hold_seconds) for key in keys)
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            dropped = sum(self._entries.pop(key, None) is not None for key in keys)
+            self.invalidations += dropped
+            return dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._held.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class RefreshingCache(Generic[V]):
+    """
+    Computed results that are refreshed rather than expired. A key's first `get` computes it inline and remembers how;
+    after `refresh_seconds` the stale value keeps being served while one background thread recomputes it, so readers
+    only ever wait on the very first computation. `refresh` recomputes on demand and `expire` forces the next read to refresh.
+    """
+
+    def __init__(self, refresh_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[float, V]] = {}
+        self._computes: Dict[Hashable, Callable[[], V]] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._refreshed = threading.Condition(self._lock)
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.last_error: Optional[str] = None
+
+    def get(self, key: Hashable, compute: Callable[[], V]) -> V:
+        with self._lock:
+            self._computes[key] = compute
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                stale = entry[0] + self.refresh_seconds <= self._clock()
+                if stale and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(target=self._refresh_in_background, args=(key,), daemon=True).start()
+        if entry is None:
+            return self._compute(key, compute)
+        return entry[1]
+
+    def _compute(self, key: Hashable, compute: Callable[[], V]) -> V:
+        value = compute()
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self.refreshes += 1
+        return value
+
+    def _refresh_in_background(self, key: Hashable) -> None:
+        try:
+            self._compute(key, self._computes[key])
+        except Exception as exc:  # keep serving the previous value; the error is reported through stats()
+            with self._lock:
+                self.refresh_errors += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+                self._refreshed.notify_all()
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no background refresh is running; returns False if some still are after `timeout` seconds.
+        """
+        with self._refreshed:
+            return self._refreshed.wait_for(lambda: not self._refreshing, timeout)
+
+    def refresh(self, keys: Optional[Iterable[Hashable]] = None) -> List[Hashable]:
+        """
+        Recompute the given keys (every key computed so far by default) now; returns the keys refreshed.
+        """
+        with self._lock:
+            computes = [(key, self._computes[key]) for key in (self._computes if keys is None else keys) if key in self._computes]
+        for key, compute in computes:
+            self._compute(key, compute)
+        return [key for key, _ in computes]
+
+    def expire(self) -> None:
+        with self._lock:
+            self._entries = {key: (float("-inf"), value) for key, (_, value) in self._entries.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._computes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "refresh_seconds": self.refresh_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+                "last_error": self.last_error,
+            }
+
+
+# Rendered Stand aggregates (JSON body + ETag) served by GET /stands/{stand_oid}/, keyed by stand_oid. create_app builds
+# one per app from its Settings, on app.state.
+def get_stand_cache(request: Request) -> TTLCache:
+    return request.app.state.stand_cache
+
+
+# GROUP BY summaries served by GET /stands/summary, keyed by their group_by tuple. Built per app like the stand cache.
+def get_stand_summary_cache(request: Request) -> RefreshingCache:
+    return request.app.state.stand_summary_cache
+
+
+def invalidate_stands(stand_cache: TTLCache, stand_oids: Iterable[str], hold_seconds: float = 0) -> int:
+    # Reads arriving after the write must not join a load that may have started before it.
+    stand_oids = set(stand_oids)
+    stand_reads.forget(lambda key: key[0] in stand_oids)
+    return stand_cache.invalidate(stand_oids, hold_seconds)
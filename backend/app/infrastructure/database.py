@@ -1,19 +1,264 @@
+import math
+import threading
+from collections import Counter
+from contextlib import AsyncExitStack, ExitStack
+from typing import AsyncIterator, Dict, Optional
+
+from fastapi import Depends, Request, Response
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from ..core.config import settings
+from sqlalchemy.pool import QueuePool, StaticPool
+from ..core.config import Settings
+from .pool_metrics import checkout_timer, instrument_pool
+from .timing import current_timing, phase
+
+
+def pool_options(settings: Settings, url: str) -> dict:
+    """
+    create_engine pool arguments from Settings. SQLite pools are not sized, so only pre-ping and recycle apply there;
+    an in-memory SQLite database is one shared connection, or every pooled connection would see its own empty database.
+    """
+    options = {"pool_pre_ping": settings.db_pool_pre_ping, "pool_recycle": settings.db_pool_recycle}
+    url = make_url(url)
+    if url.get_backend_name() != "sqlite":
+        options.update(pool_size=settings.db_pool_size, max_overflow=settings.db_max_overflow, pool_timeout=settings.db_pool_timeout)
+    elif url.database in (None, "", ":memory:"):
+        options.update(poolclass=StaticPool, connect_args={"check_same_thread": False})
+    return options
 
 
-DATABASE_URL = f"mssql+pyodbc://{settings.db_username}:{settings.db_password}@{settings.db_host}/{settings.db_name}?driver={settings.db_odbc_driver}"
+def dialect_options(url: str) -> dict:
+    """
+    Driver-specific create_engine arguments. pyodbc's fast_executemany sends an executemany as one bulk parameter array
+    instead of a round trip per row, which is what the bulk ingest relies on.
+    """
+    if make_url(url).get_driver_name() == "pyodbc":
+        return {"fast_executemany": True}
+    return {}
+
 
-engine = create_engine(url=DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def warmup_count(engine: Engine, connections: int) -> int:
+    # Connections beyond a QueuePool's size are overflow, closed again as soon as they are returned.
+    return min(connections, engine.pool.size()) if isinstance(engine.pool, QueuePool) else min(connections, 1)
+
+
+class Database:
+    """
+    The engines and session factories of one application. Nothing connects, or even imports a driver, until an engine
+    is first used; create_app's lifespan warms the pools up at startup and disposes of them at shutdown. Engines passed
+    in (e.g. a test's SQLite engine) are used as they are.
+
+    With a read replica configured (Settings.read_database_url), GET requests are served by the read engines and
+    everything else by the primary; see route_request.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        engine: Optional[Engine] = None,
+        async_engine: Optional[AsyncEngine] = None,
+        read_engine: Optional[Engine] = None,
+        async_read_engine: Optional[AsyncEngine] = None,
+    ) -> None:
+        self.settings = settings
+        self._engine = engine
+        self._async_engine = async_engine
+        self._read_engine = read_engine
+        self._async_read_engine = async_read_engine
+        self._session_factories: Dict[bool, sessionmaker] = {}
+        self._async_session_factories: Dict[bool, async_sessionmaker] = {}
+        # Requests per routing decision ("primary", "replica", "read_your_writes").
+        self.routes: Counter = Counter()
+        self._routes_lock = threading.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            self._engine = sync_engine(self.settings, self.settings.database_url())
+        instrument_pool(self._engine)
+        return self._engine
+
+    @property
+    def read_engine(self) -> Optional[Engine]:
+        if self._read_engine is None and self.settings.read_database_url() is not None:
+            self._read_engine = sync_engine(self.settings, self.settings.read_database_url())
+        if self._read_engine is not None:
+            instrument_pool(self._read_engine)
+        return self._read_engine
+
+    @property
+    def async_engine(self) -> Optional[AsyncEngine]:
+        # Only built when Settings.db_async is on, so the async driver is not required otherwise.
+        if self._async_engine is None and self.settings.db_async:
+            url = self.settings.async_database_url()
+            self._async_engine = create_async_engine(url=url, **pool_options(self.settings, url))
+        if self._async_engine is not None:
+            instrument_pool(self._async_engine.sync_engine)
+        return self._async_engine
+
+    @property
+    def async_read_engine(self) -> Optional[AsyncEngine]:
+        if self._async_read_engine is None and self.settings.db_async and self.settings.async_read_database_url() is not None:
+            url = self.settings.async_read_database_url()
+            self._async_read_engine = create_async_engine(url=url, **pool_options(self.settings, url))
+        if self._async_read_engine is not None:
+            instrument_pool(self._async_read_engine.sync_engine)
+        return self._async_read_engine
+
+    @property
+    def has_replica(self) -> bool:
+        return self._read_engine is not None or self._async_read_engine is not None or self.settings.read_database_url() is not None
+
+    def session_factory_for(self, replica: bool = False) -> sessionmaker:
+        # Without a read engine, reads fall back to the primary.
+        replica = replica and self.read_engine is not None
+        if replica not in self._session_factories:
+            bind = self.read_engine if replica else self.engine
+            self._session_factories[replica] = sessionmaker(autocommit=False, autoflush=False, bind=bind)
+        return self._session_factories[replica]
+
+    @property
+    def session_factory(self) -> sessionmaker:
+        return self.session_factory_for(replica=False)
+
+    def async_session_factory_for(self, replica: bool = False) -> Optional[async_sessionmaker]:
+        replica = replica and self.async_read_engine is not None
+        if replica not in self._async_session_factories:
+            bind = self.async_read_engine if replica else self.async_engine
+            if bind is None:
+                return None
+            self._async_session_factories[replica] = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=bind)
+        return self._async_session_factories[replica]
+
+    @property
+    def async_session_factory(self) -> Optional[async_sessionmaker]:
+        return self.async_session_factory_for(replica=False)
+
+    def record_route(self, route: str) -> None:
+        with self._routes_lock:
+            self.routes[route] += 1
+
+    def warm_up(self, connections: int) -> int:
+        """
+        Open up to `connections` pooled connections at once in each sync pool and return them to it; returns how many
+        were opened.
+        """
+        opened = 0
+        for engine in filter(None, (self.engine, self.read_engine)):
+            count = warmup_count(engine, connections)
+            with ExitStack() as stack:
+                for _ in range(count):
+                    stack.enter_context(engine.connect())
+            opened += count
+        return opened
+
+    async def warm_up_async(self, connections: int) -> int:
+        opened = 0
+        for engine in filter(None, (self.async_engine, self.async_read_engine)):
+            count = warmup_count(engine.sync_engine, connections)
+            async with AsyncExitStack() as stack:
+                for _ in range(count):
+                    await stack.enter_async_context(engine.connect())
+            opened += count
+        return opened
+
+    async def dispose(self) -> None:
+        # Only engines that were created are disposed, so shutting down never connects.
+        for async_engine in filter(None, (self._async_engine, self._async_read_engine)):
+            await async_engine.dispose()
+        for engine in filter(None, (self._engine, self._read_engine)):
+            engine.dispose()
+
+
+def sync_engine(settings: Settings, url: str) -> Engine:
+    return create_engine(url=url, **pool_options(settings, url), **dialect_options(url))
+
+
+def get_database(request: Request) -> Database:
+    return request.app.state.database
+
+
+# The Settings of the app serving the request, which need not be the process' get_settings().
+def get_app_settings(database: Database = Depends(get_database)) -> Settings:
+    return database.settings
+
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+# Read-your-writes: a client sends this header (any value), or carries the cookie that writes set, to have its reads
+# served by the primary while the replica may still lag behind its writes.
+READ_PRIMARY_HEADER = "x-read-primary"
+READ_PRIMARY_COOKIE = "read_primary"
+
+
+def read_only_request(request: Request) -> None:
+    """
+    Route-level dependency for reads that are not GETs (e.g. POST /stands/batch): lets them go to the replica too.
+    """
+    request.state.read_only = True
+
+
+def route_request(request: Request, response: Response, database: Database = Depends(get_database)) -> str:
+    """
+    Decide which engine serves the request: "replica" for reads, "primary" for writes, "read_your_writes" for reads
+    sent to the primary by the override. The decision is counted on the Database (GET /health/db) and recorded on the
+    request's timing (Server-Timing "db" entry and the request log). Resolved once per request.
+    """
+    if not database.has_replica:
+        route = "primary"
+    elif request.method not in READ_METHODS and not getattr(request.state, "read_only", False):
+        route = "primary"
+        seconds = database.settings.db_read_your_writes_seconds
+        if seconds > 0:
+            response.set_cookie(READ_PRIMARY_COOKIE, "1", max_age=math.ceil(seconds), httponly=True, samesite="lax")
+    elif READ_PRIMARY_HEADER in request.headers or READ_PRIMARY_COOKIE in request.cookies:
+        route = "read_your_writes"
+    else:
+        route = "replica"
+    database.record_route(route)
+    timing = current_timing()
+    if timing is not None:
+        timing.db_route = route
+    return route
+
+
+# Handlers that outlive the request scope (e.g. StreamingResponse bodies) depend on this directly and open their own session.
+def get_session_factory(route: str = Depends(route_request), database: Database = Depends(get_database)) -> sessionmaker:
+    return database.session_factory_for(replica=route == "replica")
+
+
+# For results kept past the request and refreshed after writes (summaries, the stand snapshot): a refresh run right after
+# a write must not read a replica that has not caught up with it.
+def get_primary_session_factory(database: Database = Depends(get_database)) -> sessionmaker:
+    return database.session_factory
+
+
 # Dependency injection. Ensures single db instance per request.
-def get_db():
-    db = SessionLocal()
+def get_db(session_factory: sessionmaker = Depends(get_session_factory)):
+    db = session_factory()
     try:
+        # Check the connection out up front so the time spent waiting on the pool is measured.
+        with phase("db_checkout"), checkout_timer(db.get_bind()):
+            db.connection()
         yield db  # yield acts as a context manager. Calls to get_db will continue to the finally when transaction completes or fails.
     finally:
         db.close()
+
+
+def get_async_session_factory(route: str = Depends(route_request), database: Database = Depends(get_database)) -> async_sessionmaker:
+    session_factory = database.async_session_factory_for(replica=route == "replica")
+    if session_factory is None:
+        raise RuntimeError("The async engine is disabled; set DB_ASYNC=true to use the async endpoints")
+    return session_factory
+
+
+# Async counterpart of get_db. Waiting on the database yields the event loop instead of holding a threadpool slot.
+async def get_async_db(session_factory: async_sessionmaker = Depends(get_async_session_factory)) -> AsyncIterator[AsyncSession]:
+    async with session_factory() as db:
+        with phase("db_checkout"), checkout_timer(db.bind.sync_engine):
+            await db.connection()
+        yield db
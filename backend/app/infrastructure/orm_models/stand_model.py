@@ -1,17 +1,21 @@
 from sqlalchemy import (
     CHAR,
     ForeignKey,
+    Index,
     Integer,
     String,
     DateTime,
     Text,
     Numeric,
-    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List, Optional
 from ..database import Base
 
+# Deferred group for the wide STAND_ATTRIBUTES text columns. Queries leave them out unless they undefer the group
+# (the full-aggregate loaders do) or name them in load_only.
+LARGE_COLUMNS = "large_columns"
+
 
 class Stand(Base):
     __tablename__ = "STAND"
@@ -20,11 +24,18 @@ class Stand(Base):
     od_object_type: Mapped[str] = mapped_column("OD_OBJECT_TYPE", CHAR(5), nullable=False)
 
     # One-to-many relationship: one Stand can have many StandParts
-    stand_part_children: Mapped[List["StandPart"]] = relationship()
+    stand_part_children: Mapped[List["StandPart"]] = relationship(order_by="StandPart.stand_part_oid")
 
 
 class StandPart(Base):
     __tablename__ = "STAND_PART"
+    __table_args__ = (
+        # Serves the as-of filter on a stand's parts: seek by stand, then range on the effective-dated columns.
+        Index("IX_STAND_PART_STAND_OID_EFFECTIVE_DATE", "STAND_OID", "EFFECTIVE_DATE", "EXPIRY_DATE"),
+        # The change feed's range seeks on the instants a version took effect or expired.
+        Index("IX_STAND_PART_EFFECTIVE_DATE", "EFFECTIVE_DATE", "STAND_OID"),
+        Index("IX_STAND_PART_EXPIRY_DATE", "EXPIRY_DATE", "STAND_OID"),
+    )
 
     stand_oid: Mapped[str] = mapped_column("STAND_OID", String(10), ForeignKey("STAND.STAND_OID"), nullable=False)
     stand_part_oid: Mapped[str] = mapped_column("STAND_PART_OID", String(10), primary_key=True, nullable=False)
@@ -40,6 +51,19 @@ class StandPart(Base):
 
 class StandAttributes(Base):
     __tablename__ = "STAND_ATTRIBUTES"
+    __table_args__ = (
+        # The change feed's range seek on the instants an attributes version took effect.
+        Index("IX_STAND_ATTRIBUTES_EFFECTIVE_DATE", "EFFECTIVE_DATE", "STAND_PART_OID"),
+        # Stand search predicates. The most common query (species + status + site_index range) is one composite seek;
+        # the other filter columns each get an index so any one of them can drive the search.
+        Index("IX_STAND_ATTRIBUTES_SPECIES_STATUS_SITE_INDEX", "SPECIES", "STATUS", "SITE_INDEX"),
+        Index("IX_STAND_ATTRIBUTES_TIMBER_TYPE", "TIMBER_TYPE"),
+        Index("IX_STAND_ATTRIBUTES_OWNERSHIP", "OWNERSHIP"),
+        Index("IX_STAND_ATTRIBUTES_HARVEST_CODE", "HARVEST_CODE"),
+        Index("IX_STAND_ATTRIBUTES_SITE_INDEX", "SITE_INDEX"),
+        Index("IX_STAND_ATTRIBUTES_SLOPE", "SLOPE"),
+        Index("IX_STAND_ATTRIBUTES_ELEVATION", "ELEVATION"),
+    )
 
     stand_part_oid: Mapped[str] = mapped_column(
         "STAND_PART_OID",
@@ -62,10 +86,10 @@ class StandAttributes(Base):
     third_thin_year: Mapped[Optional[str]] = mapped_column("THIRD_THIN_YEAR", String(4), nullable=True)
     site_index: Mapped[Optional[int]] = mapped_column("SITE_INDEX", Integer, nullable=True)
     source: Mapped[Optional[str]] = mapped_column("SOURCE", String(25), nullable=True)
-    old_id_1: Mapped[Optional[str]] = mapped_column("OLD_ID_1", String(256), nullable=True)
-    old_id_2: Mapped[Optional[str]] = mapped_column("OLD_ID_2", String(256), nullable=True)
+    old_id_1: Mapped[Optional[str]] = mapped_column("OLD_ID_1", String(256), nullable=True, deferred=True, deferred_group=LARGE_COLUMNS)
+    old_id_2: Mapped[Optional[str]] = mapped_column("OLD_ID_2", String(256), nullable=True, deferred=True, deferred_group=LARGE_COLUMNS)
     ownership: Mapped[Optional[str]] = mapped_column("OWNERSHIP", String(25), nullable=True)
-    description: Mapped[Optional[str]] = mapped_column("DESCRIPTION", Text, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column("DESCRIPTION", Text, nullable=True, deferred=True, deferred_group=LARGE_COLUMNS)
     species: Mapped[Optional[str]] = mapped_column("SPECIES", String(25), nullable=True)
     co_dom_species: Mapped[Optional[str]] = mapped_column("CO_DOM_SPECIES", String(10), nullable=True)
     regeneration_type: Mapped[Optional[str]] = mapped_column("REGENERATION_TYPE", String(10), nullable=True)
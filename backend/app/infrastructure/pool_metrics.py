@@ -0,0 +1,121 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Connection pool counters for one engine, fed by pool events and by the session dependencies.
+    """
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    in_use: int = 0
+    max_in_use: int = 0
+    checkout_waits: int = 0
+    checkout_wait_total_ms: float = 0.0
+    checkout_wait_max_ms: float = 0.0
+    checkout_errors: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.in_use = max(self.in_use - 1, 0)
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def record_checkout_wait(self, seconds: float, failed: bool = False) -> None:
+        wait_ms = seconds * 1000
+        with self._lock:
+            self.checkout_waits += 1
+            self.checkout_wait_total_ms += wait_ms
+            self.checkout_wait_max_ms = max(self.checkout_wait_max_ms, wait_ms)
+            if failed:
+                self.checkout_errors += 1
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "checkout_errors": self.checkout_errors,
+                "checkout_wait_avg_ms": self.checkout_wait_total_ms / self.checkout_waits if self.checkout_waits else 0.0,
+                "checkout_wait_max_ms": self.checkout_wait_max_ms,
+            }
+
+
+_metrics: "WeakKeyDictionary[Engine, PoolMetrics]" = WeakKeyDictionary()
+
+
+def instrument_pool(engine: Engine) -> PoolMetrics:
+    """
+    Attach PoolMetrics to `engine`'s pool events. Calling it again for the same engine returns the existing metrics.
+    """
+    metrics = _metrics.get(engine)
+    if metrics is None:
+        metrics = _metrics[engine] = PoolMetrics()
+        event.listen(engine, "connect", metrics.on_connect)
+        event.listen(engine, "checkout", metrics.on_checkout)
+        event.listen(engine, "checkin", metrics.on_checkin)
+        event.listen(engine, "invalidate", metrics.on_invalidate)
+    return metrics
+
+
+def get_pool_metrics(engine: Engine) -> Optional[PoolMetrics]:
+    return _metrics.get(engine)
+
+
+@contextmanager
+def checkout_timer(engine: Engine) -> Iterator[None]:
+    """
+    Time a connection checkout (queueing for a free slot, connecting, pre-ping) against the engine's metrics.
+    """
+    metrics = _metrics.get(engine)
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        if metrics is not None:
+            metrics.record_checkout_wait(time.perf_counter() - start, failed=True)
+        raise
+    if metrics is not None:
+        metrics.record_checkout_wait(time.perf_counter() - start)
+
+
+def pool_status(engine: Engine) -> Dict[str, Optional[int]]:
+    """
+    Live sizing of a QueuePool. Pools without queue sizing (e.g. SQLite's) report None.
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size() if hasattr(pool, "size") else None,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+        "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+    }
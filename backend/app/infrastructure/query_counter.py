@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """
+    Records every SQL statement sent through an engine while active.
+    """
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryCounter]:
+    """
+    Count the statements executed against `engine` inside the `with` block.
+
+        with count_queries(engine) as counter:
+            get_stand(db, "9001001001")
+        print(counter.count)
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter._before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._before_cursor_execute)
+
+
+@contextmanager
+def assert_query_count(engine: Engine, expected: int) -> Iterator[QueryCounter]:
+    """
+    Fail with the captured SQL if the `with` block does not execute exactly `expected` statements.
+    """
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count != expected:
+        executed = "\n".join(counter.statements)
+        raise AssertionError(f"Expected {expected} queries, {counter.count} were executed:\n{executed}")
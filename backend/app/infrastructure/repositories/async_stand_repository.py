@@ -0,0 +1,133 @@
+from app.infrastructure.orm_models.stand_model import Stand as ORMStand
+from app.domain.stand_domain import Stand as DomainStand, StandPart as DomainStandPart
+from app.infrastructure.adapters import stand_adapter
+from app.infrastructure.timing import timed
+from app.infrastructure.repositories import stand_repository
+from app.infrastructure.repositories.stand_repository import (
+    PartTreeDirection,
+    StandRowGrouper,
+    chunked,
+    part_tree_statement,
+    stand_aggregate_options,
+    stand_export_statement,
+    stand_rows_statement,
+    stand_search_statement,
+)
+from app.schemas.stand_schema import StandSchema, StandSearchRequest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+# Async counterparts of stand_repository. Statements and loader options are shared; only the I/O is awaited.
+
+
+@timed("query")
+async def get_stand(
+    db: AsyncSession,
+    stand_oid: str,
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Optional[DomainStand]:
+    statement = select(ORMStand).options(*stand_aggregate_options(loader_strategy, as_of, attribute_fields)).where(ORMStand.stand_oid == stand_oid)
+    orm_stand: Optional[ORMStand] = (await db.execute(statement)).unique().scalars().first()
+    if orm_stand is None:
+        return None
+    return stand_adapter.orm_to_domain(orm_stand, attribute_fields)
+
+
+@timed("query")
+async def get_stand_schema(
+    db: AsyncSession, stand_oid: str, as_of: Optional[datetime] = None, attribute_fields: Optional[Sequence[str]] = None
+) -> Optional[StandSchema]:
+    rows = (await db.execute(stand_rows_statement(stand_oid, as_of, attribute_fields))).all()
+    return stand_adapter.rows_to_schema_stand(rows, attribute_fields)
+
+
+async def prime_statement_cache(db: AsyncSession, loader_strategy: str = "selectin") -> Optional[str]:
+    stand_oid = await db.scalar(select(ORMStand.stand_oid).order_by(ORMStand.stand_oid).limit(1))
+    if stand_oid is not None:
+        await get_stand(db, stand_oid, loader_strategy)
+        await get_stand_schema(db, stand_oid)
+    return stand_oid
+
+
+@timed("query")
+async def get_stands(
+    db: AsyncSession,
+    stand_oids: Sequence[str],
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[DomainStand], List[str]]:
+    requested = list(dict.fromkeys(stand_oids))
+    found: Dict[str, DomainStand] = {}
+    for chunk in chunked(requested, stand_repository.IN_CLAUSE_CHUNK_SIZE):
+        statement = select(ORMStand).options(*stand_aggregate_options(loader_strategy, as_of, attribute_fields)).where(ORMStand.stand_oid.in_(chunk))
+        for orm_stand in (await db.execute(statement)).unique().scalars():
+            found[orm_stand.stand_oid] = stand_adapter.orm_to_domain(orm_stand, attribute_fields)
+    stands = [found[stand_oid] for stand_oid in requested if stand_oid in found]
+    missing = [stand_oid for stand_oid in requested if stand_oid not in found]
+    return stands, missing
+
+
+@timed("query")
+async def list_stands(
+    db: AsyncSession,
+    after: Optional[str] = None,
+    limit: int = 100,
+    include_parts: bool = True,
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[DomainStand], bool]:
+    options = stand_aggregate_options(loader_strategy, as_of, attribute_fields) if include_parts else (noload(ORMStand.stand_part_children),)
+    statement = select(ORMStand).options(*options)
+    if after is not None:
+        statement = statement.where(ORMStand.stand_oid > after)
+    statement = statement.order_by(ORMStand.stand_oid).limit(limit + 1)
+    orm_stands = (await db.execute(statement)).unique().scalars().all()
+    return [stand_adapter.orm_to_domain(orm_stand, attribute_fields) for orm_stand in orm_stands[:limit]], len(orm_stands) > limit
+
+
+@timed("query")
+async def search_stands(
+    db: AsyncSession,
+    criteria: StandSearchRequest,
+    after: Optional[str] = None,
+    limit: int = 100,
+    include_parts: bool = True,
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[DomainStand], bool]:
+    stand_oids = (await db.scalars(stand_search_statement(criteria, as_of or datetime.now(), after, limit))).all()
+    options = stand_aggregate_options(loader_strategy, as_of, attribute_fields) if include_parts else (noload(ORMStand.stand_part_children),)
+    statement = select(ORMStand).options(*options).where(ORMStand.stand_oid.in_(stand_oids[:limit])).order_by(ORMStand.stand_oid)
+    orm_stands = (await db.execute(statement)).unique().scalars().all()
+    return [stand_adapter.orm_to_domain(orm_stand, attribute_fields) for orm_stand in orm_stands], len(stand_oids) > limit
+
+
+async def iter_stands(db: AsyncSession, yield_per: int = 1000) -> AsyncIterator[DomainStand]:
+    grouper = StandRowGrouper()
+    async for row in await db.stream(stand_export_statement(yield_per)):
+        domain_stand = grouper.add(*row)
+        if domain_stand is not None:
+            yield domain_stand
+    domain_stand = grouper.finish()
+    if domain_stand is not None:
+        yield domain_stand
+
+
+@timed("query")
+async def get_part_tree(
+    db: AsyncSession,
+    stand_part_oid: str,
+    direction: PartTreeDirection,
+    max_depth: int = 100,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> List[Tuple[DomainStandPart, int]]:
+    rows = await db.execute(part_tree_statement(stand_part_oid, direction, max_depth, attribute_fields))
+    return [(stand_adapter.orm_to_domain_stand_part(orm_part, attribute_fields), depth) for orm_part, depth in rows]
@@ -0,0 +1,108 @@
+from app.infrastructure.orm_models.stand_model import Stand as ORMStand, StandPart as ORMStandPart, StandAttributes as ORMStandAttributes
+from app.domain.stand_domain import Stand as DomainStand
+from app.infrastructure.adapters import stand_adapter
+from app.infrastructure.repositories.stand_repository import chunked
+from dataclasses import dataclass, field
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.orm import InstrumentedAttribute, Session, sessionmaker
+from typing import Any, Dict, List, Sequence, Set, Tuple
+import time
+
+# (name, ORM class, primary key attribute), in foreign key order.
+UPSERT_TABLES = (
+    ("stand", ORMStand, "stand_oid"),
+    ("stand_part", ORMStandPart, "stand_part_oid"),
+    ("stand_attributes", ORMStandAttributes, "stand_part_oid"),
+)
+
+
+@dataclass
+class UpsertCounts:
+    inserted: Dict[str, int] = field(default_factory=dict)
+    updated: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, other: "UpsertCounts") -> None:
+        for totals, counts in ((self.inserted, other.inserted), (self.updated, other.updated)):
+            for table, count in counts.items():
+                totals[table] = totals.get(table, 0) + count
+
+
+@dataclass
+class IngestFailure:
+    index: int
+    stand_oid: str
+    error: str
+
+
+@dataclass
+class ChunkOutcome:
+    written: List[str] = field(default_factory=list)
+    failures: List[IngestFailure] = field(default_factory=list)
+    counts: UpsertCounts = field(default_factory=UpsertCounts)
+    retried: bool = False
+    duration_ms: float = 0.0
+
+
+def existing_keys(db: Session, column: InstrumentedAttribute, keys: Sequence[str]) -> Set[str]:
+    found: Set[str] = set()
+    for chunk in chunked(keys):
+        found.update(db.scalars(select(column).where(column.in_(chunk))))
+    return found
+
+
+def upsert_rows(db: Session, orm_class: type, key: str, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Insert the rows whose key is new and update the rest, each as a single executemany. A key repeated within `rows` keeps its last row.
+    Returns (inserted, updated).
+    """
+    by_key = {row[key]: row for row in rows}
+    existing = existing_keys(db, getattr(orm_class, key), list(by_key))
+    inserts = [row for row_key, row in by_key.items() if row_key not in existing]
+    updates = [row for row_key, row in by_key.items() if row_key in existing]
+    if inserts:
+        db.execute(insert(orm_class), inserts)
+    if updates:
+        db.execute(update(orm_class), updates)
+    return len(inserts), len(updates)
+
+
+def upsert_stands(db: Session, domain_stands: Sequence[DomainStand]) -> UpsertCounts:
+    """
+    Upsert STAND, STAND_PART and STAND_ATTRIBUTES rows for the given aggregates in the session's transaction; the caller commits.
+    Existing parts and attributes that are absent from an aggregate are left in place.
+    """
+    counts = UpsertCounts()
+    for (table, orm_class, key), rows in zip(UPSERT_TABLES, stand_adapter.domain_to_rows(domain_stands)):
+        counts.inserted[table], counts.updated[table] = upsert_rows(db, orm_class, key, rows)
+    return counts
+
+
+def error_message(exc: SQLAlchemyError) -> str:
+    return str(exc.orig) if isinstance(exc, DBAPIError) else str(exc)
+
+
+def ingest_chunk(session_factory: sessionmaker, records: Sequence[Tuple[int, DomainStand]]) -> ChunkOutcome:
+    """
+    Write one chunk of (request index, stand) records in a single transaction. If it fails, the chunk is rolled back and
+    retried one stand per transaction, so the good stands still land and the bad ones are reported individually.
+    """
+    start = time.perf_counter()
+    outcome = ChunkOutcome()
+    try:
+        with session_factory() as db, db.begin():
+            outcome.counts = upsert_stands(db, [stand for _, stand in records])
+        outcome.written = [stand.stand_oid for _, stand in records]
+    except SQLAlchemyError:
+        outcome.retried = True
+        for index, stand in records:
+            try:
+                with session_factory() as db, db.begin():
+                    counts = upsert_stands(db, [stand])
+            except SQLAlchemyError as exc:
+                outcome.failures.append(IngestFailure(index, stand.stand_oid, error_message(exc)))
+            else:
+                outcome.written.append(stand.stand_oid)
+                outcome.counts.add(counts)
+    outcome.duration_ms = (time.perf_counter() - start) * 1000
+    return outcome
@@ -1,12 +1,490 @@
-from app.infrastructure.orm_models.stand_model import Stand as ORMStand
-from app.domain.stand_domain import Stand as DomainStand
+from app.infrastructure.orm_models.stand_model import (
+    LARGE_COLUMNS,
+    Stand as ORMStand,
+    StandPart as ORMStandPart,
+    StandAttributes as ORMStandAttributes,
+)
+from app.domain.stand_domain import Stand as DomainStand, StandPart as DomainStandPart
+from app.schemas.stand_schema import StandSchema, StandSearchRequest
 from app.infrastructure.adapters import stand_adapter
-from sqlalchemy.orm import Session
-from typing import Optional
+from app.infrastructure.timing import timed
+from sqlalchemy import ColumnElement, Float, Select, and_, cast, distinct, func, literal, or_, select, union_all
+from sqlalchemy.orm import InstrumentedAttribute, Load, Session, joinedload, noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import LoaderOption
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Literal, Optional, Sequence, Tuple, get_args
 
+LOADER_STRATEGIES = ("selectin", "joined")
 
-def get_stand(db: Session, stand_oid: str) -> Optional[DomainStand]:  # ✅ Corrected order
-    orm_stand: Optional[ORMStand] = db.query(ORMStand).filter(ORMStand.stand_oid == stand_oid).first()
+# MSSQL rejects statements with more than 2100 bound parameters; leave headroom for the rest of the statement.
+IN_CLAUSE_CHUNK_SIZE = 2000
+
+
+def chunked(values: Sequence[str], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[Sequence[str]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def part_active_at(as_of: datetime) -> ColumnElement[bool]:
+    """
+    StandPart versions in effect at `as_of`: effective on or before it and not yet expired.
+    """
+    return and_(ORMStandPart.effective_date <= as_of, or_(ORMStandPart.expiry_date.is_(None), ORMStandPart.expiry_date > as_of))
+
+
+def attributes_active_at(as_of: datetime) -> ColumnElement[bool]:
+    return or_(ORMStandAttributes.effective_date.is_(None), ORMStandAttributes.effective_date <= as_of)
+
+
+def stand_aggregate_options(
+    loader_strategy: str = "selectin", as_of: Optional[datetime] = None, attribute_fields: Optional[Sequence[str]] = None
+) -> Tuple[LoaderOption, ...]:
+    """
+    Loader options that pull a Stand's parts and their attributes eagerly.
+    "selectin" costs one SELECT per level (3 total), "joined" a single LEFT OUTER JOIN statement.
+    Either way the statement count is independent of the number of parts.
+    With `as_of`, only the part and attribute versions in effect at that instant are loaded (filtered in SQL).
+    With `attribute_fields`, only those StandAttributes columns are loaded; otherwise all of them, deferred ones included.
+    """
+    parts = ORMStand.stand_part_children
+    attributes = ORMStandPart.stand_attribute_children
+    if as_of is not None:
+        parts, attributes = parts.and_(part_active_at(as_of)), attributes.and_(attributes_active_at(as_of))
+    if loader_strategy == "selectin":
+        loader = selectinload(parts).selectinload(attributes)
+    elif loader_strategy == "joined":
+        loader = joinedload(parts).joinedload(attributes)
+    else:
+        raise ValueError(f"Unknown loader strategy {loader_strategy!r}, expected one of {LOADER_STRATEGIES}")
+    return (attribute_loader(loader, attribute_fields),)
+
+
+def attribute_loader(loader: Load, attribute_fields: Optional[Sequence[str]]) -> Load:
+    # `loader` loads StandAttributes: limit it to `attribute_fields`, or undefer every column when None.
+    if attribute_fields is not None:
+        return loader.load_only(*(getattr(ORMStandAttributes, name) for name in attribute_fields))
+    return loader.undefer_group(LARGE_COLUMNS)
+
+
+@timed("query")
+def get_stand(
+    db: Session,
+    stand_oid: str,
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Optional[DomainStand]:
+    orm_stand: Optional[ORMStand] = (
+        db.query(ORMStand).options(*stand_aggregate_options(loader_strategy, as_of, attribute_fields)).filter(ORMStand.stand_oid == stand_oid).first()
+    )
     if orm_stand is None:
         return None
-    return stand_adapter.orm_to_domain(orm_stand)
+    return stand_adapter.orm_to_domain(orm_stand, attribute_fields)
+
+
+def stand_rows_statement(stand_oid: str, as_of: Optional[datetime] = None, attribute_fields: Optional[Sequence[str]] = None) -> Select:
+    """
+    The whole aggregate as plain columns in one round trip: STAND ⟕ STAND_PART ⟕ STAND_ATTRIBUTES, ordered by part.
+    `as_of` goes into the join conditions, so a stand with no part in effect still comes back (with no parts).
+    """
+    part_join = ORMStandPart.stand_oid == ORMStand.stand_oid
+    attributes_join = ORMStandAttributes.stand_part_oid == ORMStandPart.stand_part_oid
+    if as_of is not None:
+        part_join, attributes_join = and_(part_join, part_active_at(as_of)), and_(attributes_join, attributes_active_at(as_of))
+    return (
+        select(*stand_adapter.stand_row_columns(attribute_fields))
+        .select_from(ORMStand)
+        .outerjoin(ORMStandPart, part_join)
+        .outerjoin(ORMStandAttributes, attributes_join)
+        .where(ORMStand.stand_oid == stand_oid)
+        .order_by(ORMStandPart.stand_part_oid)
+    )
+
+
+@timed("query")
+def get_stand_schema(
+    db: Session, stand_oid: str, as_of: Optional[datetime] = None, attribute_fields: Optional[Sequence[str]] = None
+) -> Optional[StandSchema]:
+    """
+    Fast read path: Core rows straight to a constructed StandSchema, without ORM or domain objects.
+    """
+    rows = db.execute(stand_rows_statement(stand_oid, as_of, attribute_fields)).all()
+    return stand_adapter.rows_to_schema_stand(rows, attribute_fields)
+
+
+def prime_statement_cache(db: Session, loader_strategy: str = "selectin") -> Optional[str]:
+    """
+    Read the first stand through both GET /stands/{stand_oid}/ read modes, so the engine has compiled and cached their
+    statements (including the selectin loads, which only run for a stand that exists) before the first request.
+    Returns that stand's OID, or None when there are no stands.
+    """
+    stand_oid = db.scalar(select(ORMStand.stand_oid).order_by(ORMStand.stand_oid).limit(1))
+    if stand_oid is not None:
+        get_stand(db, stand_oid, loader_strategy)
+        get_stand_schema(db, stand_oid)
+    return stand_oid
+
+
+@timed("query")
+def get_stands(
+    db: Session,
+    stand_oids: Sequence[str],
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[DomainStand], List[str]]:
+    """
+    Load many Stand aggregates with chunked IN-list queries.
+    Returns the stands found (in request order, duplicates removed) and the OIDs that do not exist.
+    """
+    requested = list(dict.fromkeys(stand_oids))
+    found: Dict[str, DomainStand] = {}
+    for chunk in chunked(requested, IN_CLAUSE_CHUNK_SIZE):
+        options = stand_aggregate_options(loader_strategy, as_of, attribute_fields)
+        for orm_stand in db.query(ORMStand).options(*options).filter(ORMStand.stand_oid.in_(chunk)).all():
+            found[orm_stand.stand_oid] = stand_adapter.orm_to_domain(orm_stand, attribute_fields)
+    stands = [found[stand_oid] for stand_oid in requested if stand_oid in found]
+    missing = [stand_oid for stand_oid in requested if stand_oid not in found]
+    return stands, missing
+
+
+@timed("query")
+def list_stands(
+    db: Session,
+    after: Optional[str] = None,
+    limit: int = 100,
+    include_parts: bool = True,
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[DomainStand], bool]:
+    """
+    One keyset page of stands ordered by STAND_OID, starting after the `after` OID.
+    Seeks on the primary key instead of using OFFSET, so every page costs the same.
+    Returns the page and whether more rows follow it.
+    """
+    options = stand_aggregate_options(loader_strategy, as_of, attribute_fields) if include_parts else (noload(ORMStand.stand_part_children),)
+    query = db.query(ORMStand).options(*options)
+    if after is not None:
+        query = query.filter(ORMStand.stand_oid > after)
+    orm_stands = query.order_by(ORMStand.stand_oid).limit(limit + 1).all()
+    return [stand_adapter.orm_to_domain(orm_stand, attribute_fields) for orm_stand in orm_stands[:limit]], len(orm_stands) > limit
+
+
+SEARCH_EQUALITY_FIELDS = ("species", "timber_type", "status", "ownership", "harvest_code")
+SEARCH_RANGE_FIELDS = ("site_index", "slope", "elevation")
+
+
+def search_predicates(criteria: StandSearchRequest) -> List[ColumnElement[bool]]:
+    """
+    WHERE clauses on STAND_ATTRIBUTES for the criteria that are set.
+    """
+    predicates = []
+    for name in SEARCH_EQUALITY_FIELDS:
+        values = getattr(criteria, name)
+        if values:
+            column = getattr(ORMStandAttributes, name)
+            predicates.append(column == values[0] if len(values) == 1 else column.in_(values))
+    for name in SEARCH_RANGE_FIELDS:
+        column, low, high = getattr(ORMStandAttributes, name), getattr(criteria, f"{name}_min"), getattr(criteria, f"{name}_max")
+        if low is not None:
+            predicates.append(column >= low)
+        if high is not None:
+            predicates.append(column <= high)
+    return predicates
+
+
+def stand_search_statement(criteria: StandSearchRequest, as_of: datetime, after: Optional[str] = None, limit: int = 100) -> Select:
+    """
+    One keyset page (plus one row) of the OIDs of stands with a part in effect at `as_of` whose attributes match
+    `criteria`, ordered by STAND_OID: expired and future part versions do not make a stand match.
+    The filters are driven from the STAND_ATTRIBUTES indexes; parts are reached by primary key.
+    """
+    statement = (
+        select(ORMStandPart.stand_oid)
+        .join(ORMStandAttributes, ORMStandAttributes.stand_part_oid == ORMStandPart.stand_part_oid)
+        .where(*search_predicates(criteria), part_active_at(as_of), attributes_active_at(as_of))
+        .distinct()
+        .order_by(ORMStandPart.stand_oid)
+        .limit(limit + 1)
+    )
+    if after is not None:
+        statement = statement.where(ORMStandPart.stand_oid > after)
+    return statement
+
+
+@timed("query")
+def search_stands(
+    db: Session,
+    criteria: StandSearchRequest,
+    after: Optional[str] = None,
+    limit: int = 100,
+    include_parts: bool = True,
+    loader_strategy: str = "selectin",
+    as_of: Optional[datetime] = None,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[DomainStand], bool]:
+    """
+    Stands matching `criteria` with their current parts unless `as_of` is given, a keyset page at a time: the matching
+    OIDs first, then their aggregates by primary key. With `as_of`, only the versions in effect then are loaded too.
+    """
+    stand_oids = db.scalars(stand_search_statement(criteria, as_of or datetime.now(), after, limit)).all()
+    options = stand_aggregate_options(loader_strategy, as_of, attribute_fields) if include_parts else (noload(ORMStand.stand_part_children),)
+    orm_stands = db.query(ORMStand).options(*options).filter(ORMStand.stand_oid.in_(stand_oids[:limit])).order_by(ORMStand.stand_oid).all()
+    return [stand_adapter.orm_to_domain(orm_stand, attribute_fields) for orm_stand in orm_stands], len(stand_oids) > limit
+
+
+SummaryDimension = Literal["species", "timber_type", "ownership", "status"]
+SUMMARY_DIMENSIONS = get_args(SummaryDimension)
+
+
+def stand_summary_statement(group_by: Sequence[str], as_of: datetime) -> Select:
+    """
+    Stand and part counts with mean site_index, slope and elevation per combination of `group_by` attribute values, over
+    the attributes of the parts in effect at `as_of`. site_index is cast before AVG, which MSSQL would otherwise truncate to an integer.
+    """
+    dimensions = [getattr(ORMStandAttributes, name) for name in group_by]
+    return (
+        select(
+            *dimensions,
+            func.count(distinct(ORMStandPart.stand_oid)).label("stands"),
+            func.count().label("parts"),
+            func.avg(cast(ORMStandAttributes.site_index, Float)).label("mean_site_index"),
+            func.avg(ORMStandAttributes.slope).label("mean_slope"),
+            func.avg(ORMStandAttributes.elevation).label("mean_elevation"),
+        )
+        .select_from(ORMStandAttributes)
+        .join(ORMStandPart, ORMStandPart.stand_part_oid == ORMStandAttributes.stand_part_oid)
+        .where(part_active_at(as_of))
+        .group_by(*dimensions)
+        .order_by(*dimensions)
+    )
+
+
+@timed("query")
+def summarize_stands(db: Session, group_by: Sequence[str], as_of: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    One dict per group (see stand_summary_statement), computed in SQL against the current parts unless `as_of` is given.
+    """
+    return [dict(row) for row in db.execute(stand_summary_statement(group_by, as_of or datetime.now())).mappings()]
+
+
+SNAPSHOT_NUMERIC_FIELDS = ("site_index", "slope", "aspect", "elevation")
+SNAPSHOT_CODED_FIELDS = SEARCH_EQUALITY_FIELDS
+
+
+def stand_snapshot_statement(as_of: datetime, stand_oids: Optional[Sequence[str]] = None) -> Select:
+    """
+    (stand_oid, stand_part_oid, *SNAPSHOT_NUMERIC_FIELDS, *SNAPSHOT_CODED_FIELDS) for every part in effect at `as_of` that
+    has attributes in effect, or only for the given stands.
+    """
+    statement = (
+        select(
+            ORMStandPart.stand_oid,
+            ORMStandPart.stand_part_oid,
+            *(getattr(ORMStandAttributes, name) for name in SNAPSHOT_NUMERIC_FIELDS + SNAPSHOT_CODED_FIELDS),
+        )
+        .join(ORMStandAttributes, ORMStandAttributes.stand_part_oid == ORMStandPart.stand_part_oid)
+        .where(part_active_at(as_of), attributes_active_at(as_of))
+    )
+    if stand_oids is not None:
+        statement = statement.where(ORMStandPart.stand_oid.in_(stand_oids))
+    return statement
+
+
+@timed("query")
+def load_snapshot_rows(db: Session, as_of: datetime, stand_oids: Optional[Sequence[str]] = None) -> List[Tuple[Any, ...]]:
+    if stand_oids is None:
+        return [tuple(row) for row in db.execute(stand_snapshot_statement(as_of))]
+    rows: List[Tuple[Any, ...]] = []
+    for chunk in chunked(stand_oids):
+        rows.extend(tuple(row) for row in db.execute(stand_snapshot_statement(as_of, chunk)))
+    return rows
+
+
+ChangePosition = Tuple[datetime, Optional[str]]
+
+
+def stand_changes_statement(after: ChangePosition, until: datetime, limit: Optional[int] = None) -> Select:
+    """
+    (stand_oid, changed_at) for the stands with a part or attributes version that took effect or expired after `after`
+    and no later than `until`, where changed_at is the stand's latest such instant, ordered by (changed_at, stand_oid).
+    `after` is an instant, or a (changed_at, stand_oid) position from a previous page to resume after.
+    Each branch of the union seeks one of the effective-date indexes, so the cost follows the changes, not the table size.
+    """
+    since, after_oid = after
+
+    def changed(column: InstrumentedAttribute) -> ColumnElement[bool]:
+        return and_(column >= since if after_oid is not None else column > since, column <= until)
+
+    instants = union_all(
+        select(ORMStandPart.stand_oid, ORMStandPart.effective_date.label("changed_at")).where(changed(ORMStandPart.effective_date)),
+        select(ORMStandPart.stand_oid, ORMStandPart.expiry_date).where(changed(ORMStandPart.expiry_date)),
+        select(ORMStandPart.stand_oid, ORMStandAttributes.effective_date)
+        .join(ORMStandPart, ORMStandPart.stand_part_oid == ORMStandAttributes.stand_part_oid)
+        .where(changed(ORMStandAttributes.effective_date)),
+    ).subquery()
+    changed_at = func.max(instants.c.changed_at).label("changed_at")
+    statement = select(instants.c.stand_oid, changed_at).group_by(instants.c.stand_oid).order_by(changed_at, instants.c.stand_oid)
+    if after_oid is not None:
+        statement = statement.having(or_(changed_at > since, and_(changed_at == since, instants.c.stand_oid > after_oid)))
+    return statement.limit(limit) if limit is not None else statement
+
+
+@timed("query")
+def stands_with_transitions(db: Session, since: datetime, until: datetime) -> List[str]:
+    """
+    OIDs of stands with a part or attributes version that took effect or expired in (since, until]: the stands whose
+    current attributes changed through the passage of time alone.
+    """
+    return [stand_oid for stand_oid, _ in db.execute(stand_changes_statement((since, None), until))]
+
+
+def stand_export_statement(yield_per: int = 1000) -> Select:
+    """
+    One ordered pass over STAND ⟕ STAND_PART ⟕ STAND_ATTRIBUTES, fetched `yield_per` rows at a time through a streaming cursor.
+    """
+    return (
+        select(ORMStand, ORMStandPart, ORMStandAttributes)
+        .outerjoin(ORMStandPart, ORMStandPart.stand_oid == ORMStand.stand_oid)
+        .outerjoin(ORMStandAttributes, ORMStandAttributes.stand_part_oid == ORMStandPart.stand_part_oid)
+        .order_by(ORMStand.stand_oid, ORMStandPart.stand_part_oid)
+        # The export is the complete dump consumers mirror the table from: unlike the reads, it includes the large columns.
+        .options(Load(ORMStandAttributes).undefer_group(LARGE_COLUMNS))
+        .execution_options(yield_per=yield_per)
+    )
+
+
+class StandRowGrouper:
+    """
+    Folds the ordered (Stand, StandPart, StandAttributes) rows of `stand_export_statement` (or `stand_change_rows_statement`)
+    into domain aggregates.
+    `add` returns the previous aggregate once a row for the next stand arrives; `finish` returns the last one.
+    """
+
+    def __init__(self) -> None:
+        self._stand: Optional[ORMStand] = None
+        self._parts: Dict[str, Tuple[ORMStandPart, List[ORMStandAttributes]]] = {}
+
+    def add(self, orm_stand: ORMStand, orm_part: Optional[ORMStandPart], orm_attr: Optional[ORMStandAttributes]) -> Optional[DomainStand]:
+        completed = None
+        if orm_stand is not self._stand:
+            completed = self.finish()
+            self._stand = orm_stand
+        if orm_part is not None:
+            part_attributes = self._parts.setdefault(orm_part.stand_part_oid, (orm_part, []))[1]
+            if orm_attr is not None:
+                part_attributes.append(orm_attr)
+        return completed
+
+    def finish(self) -> Optional[DomainStand]:
+        if self._stand is None:
+            return None
+        # Populate the relationship collections from the joined rows so the adapter never triggers a lazy load.
+        for orm_part, orm_attrs in self._parts.values():
+            set_committed_value(orm_part, "stand_attribute_children", orm_attrs)
+        set_committed_value(self._stand, "stand_part_children", [orm_part for orm_part, _ in self._parts.values()])
+        domain_stand = stand_adapter.orm_to_domain(self._stand)
+        self._stand, self._parts = None, {}
+        return domain_stand
+
+
+def iter_stands(db: Session, yield_per: int = 1000) -> Iterator[DomainStand]:
+    """
+    Stream every Stand aggregate from a single query; memory stays flat regardless of table size.
+    """
+    grouper = StandRowGrouper()
+    for row in db.execute(stand_export_statement(yield_per)):
+        domain_stand = grouper.add(*row)
+        if domain_stand is not None:
+            yield domain_stand
+    domain_stand = grouper.finish()
+    if domain_stand is not None:
+        yield domain_stand
+
+
+def stand_change_rows_statement(after: ChangePosition, until: datetime, yield_per: int = 500) -> Select:
+    """
+    The changes of stand_changes_statement joined to their stands as of `until`, as one ordered pass fetched `yield_per`
+    rows at a time through a streaming cursor: (changed_at, Stand, StandPart, StandAttributes) rows ordered by
+    (changed_at, stand_oid, stand_part_oid). The union is grouped once for the whole feed, not once per page of it.
+    """
+    changes = stand_changes_statement(after, until).order_by(None).subquery()
+    return (
+        select(changes.c.changed_at, ORMStand, ORMStandPart, ORMStandAttributes)
+        .select_from(changes)
+        .join(ORMStand, ORMStand.stand_oid == changes.c.stand_oid)
+        .outerjoin(ORMStandPart, and_(ORMStandPart.stand_oid == ORMStand.stand_oid, part_active_at(until)))
+        .outerjoin(ORMStandAttributes, and_(ORMStandAttributes.stand_part_oid == ORMStandPart.stand_part_oid, attributes_active_at(until)))
+        .order_by(changes.c.changed_at, changes.c.stand_oid, ORMStandPart.stand_part_oid)
+        # The feed keeps the export's mirror up to date, so it carries the large columns too.
+        .options(Load(ORMStandAttributes).undefer_group(LARGE_COLUMNS))
+        .execution_options(yield_per=yield_per)
+    )
+
+
+def iter_stand_changes(db: Session, after: ChangePosition, until: datetime, yield_per: int = 500) -> Iterator[Tuple[datetime, DomainStand]]:
+    """
+    (changed_at, stand as of `until`) for every change after `after` (see stand_changes_statement), streamed from a single
+    query. A stand whose parts have all expired comes back without parts.
+    """
+    grouper = StandRowGrouper()
+    changed_at: Optional[datetime] = None
+    for row_changed_at, *row in db.execute(stand_change_rows_statement(after, until, yield_per)):
+        domain_stand = grouper.add(*row)
+        if domain_stand is not None:
+            yield changed_at, domain_stand
+        changed_at = row_changed_at
+    domain_stand = grouper.finish()
+    if domain_stand is not None:
+        yield changed_at, domain_stand
+
+
+PartTreeDirection = Literal["ancestors", "descendants"]
+
+
+def part_tree_statement(
+    stand_part_oid: str, direction: PartTreeDirection, max_depth: int, attribute_fields: Optional[Sequence[str]] = None
+) -> Select:
+    """
+    A part and its ancestors or descendants (through STAND_PNT_PART_OID) up to `max_depth` levels away, from one recursive CTE.
+    Rows are (StandPart, depth) ordered by depth, with depth 0 for the part itself; the parts' `attribute_fields` come with
+    one extra selectin query. The depth bound also stops the recursion on cyclic parent links, along which parts repeat
+    once per lap (see domain_to_schema_part_tree).
+    """
+    tree = (
+        select(ORMStandPart.stand_part_oid, ORMStandPart.stand_pnt_part_oid, literal(0).label("depth"))
+        .where(ORMStandPart.stand_part_oid == stand_part_oid)
+        .cte("part_tree", recursive=True)
+    )
+    if direction == "descendants":
+        link = ORMStandPart.stand_pnt_part_oid == tree.c.stand_part_oid
+    else:
+        link = ORMStandPart.stand_part_oid == tree.c.stand_pnt_part_oid
+    tree = tree.union_all(
+        select(ORMStandPart.stand_part_oid, ORMStandPart.stand_pnt_part_oid, (tree.c.depth + 1).label("depth"))
+        .join(tree, link)
+        .where(tree.c.depth < max_depth)
+    )
+    return (
+        select(ORMStandPart, tree.c.depth)
+        .join(tree, ORMStandPart.stand_part_oid == tree.c.stand_part_oid)
+        .options(attribute_loader(selectinload(ORMStandPart.stand_attribute_children), attribute_fields))
+        .order_by(tree.c.depth, ORMStandPart.stand_part_oid)
+    )
+
+
+@timed("query")
+def get_part_tree(
+    db: Session,
+    stand_part_oid: str,
+    direction: PartTreeDirection,
+    max_depth: int = 100,
+    attribute_fields: Optional[Sequence[str]] = None,
+) -> List[Tuple[DomainStandPart, int]]:
+    """
+    (part, depth) pairs for the part and its ancestors or descendants, ordered by depth. Empty when the part does not exist.
+    """
+    rows = db.execute(part_tree_statement(stand_part_oid, direction, max_depth, attribute_fields))
+    return [(stand_adapter.orm_to_domain_stand_part(orm_part, attribute_fields), depth) for orm_part, depth in rows]
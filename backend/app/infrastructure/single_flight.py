@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from app.infrastructure.timing import phase
+
+V = TypeVar("V")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[V]):
+    """
+    Coalesces concurrent loads of the same key: the first caller runs the load, callers arriving while it is in flight
+    wait for it and share its result (or exception). Nothing is kept once the load finishes; caching is TTLCache's job.
+    `do` coalesces threads, `do_async` coroutines running on the same event loop.
+
+    `forget` detaches in-flight loads, so callers arriving after a write start a fresh load instead of sharing one that
+    may have read the data before the write.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._futures: Dict[Tuple[int, Hashable], "asyncio.Future[V]"] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.forgotten = 0
+
+    def do(self, key: Hashable, load: Callable[[], V]) -> V:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.loads += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            with phase("coalesced_wait"):
+                call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = load()
+        except BaseException as exc:
+            call.error = exc
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.value
+
+    async def do_async(self, key: Hashable, load: Callable[[], Awaitable[V]]) -> V:
+        # Futures belong to one event loop; keying by the loop keeps apps running on different loops apart.
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            future = self._futures.get(flight_key)
+            if future is None:
+                future = self._futures[flight_key] = loop.create_future()
+                leader = True
+                self.loads += 1
+            else:
+                leader = False
+                self.coalesced += 1
+        if not leader:
+            try:
+                with phase("coalesced_wait"):
+                    # Shielded: a waiter that is cancelled must not cancel the load the others are waiting for.
+                    return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled (e.g. its client went away): load again rather than fail this request.
+                return await self.do_async(key, load)
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved here, so an exception nobody waited for is not logged as unhandled
+            with self._lock:
+                self.errors += 1
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                if self._futures.get(flight_key) is future:
+                    del self._futures[flight_key]
+
+    def forget(self, matches: Callable[[Hashable], bool]) -> int:
+        """
+        Detach the in-flight loads whose key `matches`; their current waiters still get their result. Returns how many.
+        """
+        with self._lock:
+            keys = [key for key in self._calls if matches(key)]
+            flight_keys = [flight_key for flight_key in self._futures if matches(flight_key[1])]
+            for key in keys:
+                del self._calls[key]
+            for flight_key in flight_keys:
+                del self._futures[flight_key]
+            self.forgotten += len(keys) + len(flight_keys)
+            return len(keys) + len(flight_keys)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls) + len(self._futures),
+                "loads": self.loads,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "forgotten": self.forgotten,
+            }
+
+
+# Loads behind GET /stands/{stand_oid}/ cache misses, keyed by (stand_oid, as_of, attribute_fields, session factory).
+stand_reads: SingleFlight = SingleFlight()
@@ -0,0 +1,388 @@
+"""
+Columnar in-memory snapshot of the current STAND_ATTRIBUTES rows, for filters that must answer in milliseconds over
+every stand.
+
+Rows are held column by column in packed arrays, and a filter is evaluated as byte masks (one byte per row, 1 where
+the row matches) that are combined and applied to the row OIDs by C-level operations, so the per-row work never runs
+Python code:
+
+- Low-cardinality string columns are dictionary-encoded into one code byte per row. An equality filter is a single
+  bytes.translate of the codes through a 256-entry table that maps the wanted codes to 1.
+- Numeric columns are an array('d') (NaN for NULL), a permutation of the rows sorted by value, and a byte per row
+  holding its rank bucket (255 equal-count buckets). A range is bisected on the sorted values; the buckets it fully
+  covers are selected with one translate, and only the rows of the two buckets at its edges are set individually.
+- Masks are ANDed as integers. itertools.compress picks the matching stand OIDs out of the OID column, or, for a
+  sparse mask, a regex scan finds its 1 bytes.
+
+Snapshots are immutable; StandSnapshotService swaps in a new one after each refresh. A refresh that only changes the
+values of existing parts patches copies of the columns those values are in and shares the rest; one that adds or
+removes parts rebuilds the snapshot.
+"""
+
+import copy
+import math
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from fastapi import Request
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.repositories.stand_repository import (
+    SNAPSHOT_CODED_FIELDS,
+    SNAPSHOT_NUMERIC_FIELDS,
+    load_snapshot_rows,
+    stands_with_transitions,
+)
+from app.schemas.stand_schema import StandSnapshotQuery
+
+# Rank buckets per numeric column; bucket byte 255 marks NULL.
+BUCKETS = 255
+NULL_BUCKET = 255
+# Below one match in this many rows, the matching rows are found by scanning the mask for 1 bytes instead of compressing
+# the whole OID column with it.
+SPARSE_RATIO = 20
+MATCHED_ROW = re.compile(b"\x01")
+
+
+def same(old: float, new: float) -> bool:
+    # NaN stands for NULL, and NULL is unchanged when it stays NULL.
+    return old == new or (old != old and new != new)
+
+
+def translate_table(selected: Iterable[int]) -> bytes:
+    table = bytearray(256)
+    for code in selected:
+        table[code] = 1
+    return bytes(table)
+
+
+class NumericColumn:
+    def __init__(self, values: Iterable[Any]) -> None:
+        self.values = array("d", (math.nan if value is None else float(value) for value in values))
+        # NaN compares false against everything, so NULLs are left out of the sorted permutation and never match a range.
+        order = sorted((row for row, value in enumerate(self.values) if value == value), key=self.values.__getitem__)
+        self.order = array("I", order)
+        self.sorted_values = array("d", map(self.values.__getitem__, order))
+        # Bucket b holds the rows ranked in [bucket_starts[b], bucket_starts[b + 1]).
+        self.bucket_starts = [-(-bucket * len(order) // BUCKETS) for bucket in range(BUCKETS + 1)]
+        buckets = bytearray([NULL_BUCKET]) * len(self.values)
+        for bucket in range(BUCKETS):
+            for row in self.order[self.bucket_starts[bucket] : self.bucket_starts[bucket + 1]]:
+                buckets[row] = bucket
+        self.buckets = bytes(buckets)
+
+    def mask_between(self, low: Optional[float], high: Optional[float]) -> bytes:
+        start = 0 if low is None else bisect_left(self.sorted_values, low)
+        stop = len(self.order) if high is None else bisect_right(self.sorted_values, high)
+        if start >= stop:
+            return bytes(len(self.values))
+        first, last = bisect_right(self.bucket_starts, start) - 1, bisect_right(self.bucket_starts, stop - 1) - 1
+        mask = bytearray(self.buckets.translate(translate_table(range(first + 1, last))))
+        for row in self.order[start : min(stop, self.bucket_starts[first + 1])]:
+            mask[row] = 1
+        for row in self.order[max(start, self.bucket_starts[last]) : stop]:
+            mask[row] = 1
+        return bytes(mask)
+
+    def decode(self) -> Iterator[Optional[float]]:
+        return (None if value != value else value for value in self.values)
+
+    def patch(self, rows: Sequence[int], values: Iterable[Any]) -> "NumericColumn":
+        """
+        A column with `values` at `rows`; self when none of them changes. Each changed row is moved within the sorted
+        permutation, and only the rows that can have crossed a bucket boundary get their bucket recomputed.
+        """
+        new_values = array("d", (math.nan if value is None else float(value) for value in values))
+        changed = [(row, self.values[row], value) for row, value in zip(rows, new_values) if not same(self.values[row], value)]
+        if not changed:
+            return self
+        patched = array("d", self.values)
+        for row, _, value in changed:
+            patched[row] = value
+        # A NULL set or cleared resizes the permutation, which moves every bucket boundary; so does a wholesale change.
+        if any((old != old) != (value != value) for _, old, value in changed) or 2 * len(changed) * BUCKETS > len(self.order):
+            return NumericColumn(patched)
+        column = copy.copy(self)
+        column.values, column.order, column.sorted_values = patched, array("I", self.order), array("d", self.sorted_values)
+        for row, old, value in changed:
+            if old == old:
+                rank = column.rank(row, old)
+                del column.order[rank], column.sorted_values[rank]
+        for row, _, value in changed:
+            if value == value:
+                rank = column.rank(row, value)
+                column.order.insert(rank, row)
+                column.sorted_values.insert(rank, value)
+        # Ties stay in row order, as sorted() leaves them, so no row moves by more than len(changed) ranks.
+        reach = len(changed)
+        ranks = {column.rank(row, value) for row, _, value in changed if value == value}
+        for start in self.bucket_starts[1:-1]:
+            ranks.update(range(max(0, start - reach), min(len(column.order), start + reach)))
+        buckets = bytearray(self.buckets)
+        for rank in ranks:
+            buckets[column.order[rank]] = bisect_right(self.bucket_starts, rank) - 1
+        column.buckets = bytes(buckets)
+        return column
+
+    def rank(self, row: int, value: float) -> int:
+        # Where `row` with `value` is, or belongs, in the sorted permutation: among equal values, rows are in row order.
+        return bisect_left(self.order, row, bisect_left(self.sorted_values, value), bisect_right(self.sorted_values, value))
+
+
+class DictionaryColumn:
+    def __init__(self, values: Iterable[Optional[str]]) -> None:
+        self.dictionary: List[Optional[str]] = []
+        self.index: Dict[Optional[str], int] = {}
+        codes = array("I")
+        for value in values:
+            code = self.index.get(value)
+            if code is None:
+                code = self.index[value] = len(self.dictionary)
+                self.dictionary.append(value)
+            codes.append(code)
+        # One byte per row while the column has at most 256 distinct values, which is what these columns are chosen for.
+        self.codes = array("B", codes) if len(self.dictionary) <= 256 else codes
+
+    def mask_equal(self, values: Sequence[str]) -> bytes:
+        wanted = {self.index[value] for value in values if value in self.index}
+        if self.codes.typecode == "B":
+            return self.codes.tobytes().translate(translate_table(wanted))
+        return bytes(code in wanted for code in self.codes)
+
+    def decode(self) -> Iterator[Optional[str]]:
+        return map(self.dictionary.__getitem__, self.codes)
+
+    def patch(self, rows: Sequence[int], values: Iterable[Optional[str]]) -> "DictionaryColumn":
+        """
+        A column with `values` at `rows`; self when none of them changes. New values are appended to a copy of the
+        dictionary, and the column is rebuilt if that takes it past one byte per code.
+        """
+        changed = [(row, value) for row, value in zip(rows, values) if self.dictionary[self.codes[row]] != value]
+        if not changed:
+            return self
+        column = copy.copy(self)
+        column.dictionary, column.index, column.codes = list(self.dictionary), dict(self.index), array(self.codes.typecode, self.codes)
+        for row, value in changed:
+            code = column.index.get(value)
+            if code is None:
+                code = column.index[value] = len(column.dictionary)
+                column.dictionary.append(value)
+            if code > 255 and column.codes.typecode == "B":
+                patched = list(self.decode())
+                for row, value in changed:
+                    patched[row] = value
+                return DictionaryColumn(patched)
+            column.codes[row] = code
+        return column
+
+
+class StandAttributesSnapshot:
+    """
+    One row per current stand part, built from stand_snapshot_statement rows, as of `as_of`, ordered by stand_oid.
+    """
+
+    def __init__(self, rows: Sequence[Tuple[Any, ...]], as_of: datetime) -> None:
+        self.as_of = as_of
+        columns = list(zip(*sorted(rows, key=itemgetter(0, 1)))) or [()] * (2 + len(SNAPSHOT_NUMERIC_FIELDS) + len(SNAPSHOT_CODED_FIELDS))
+        self.stand_oids: List[str] = list(columns[0])
+        self.stand_part_oids: List[str] = list(columns[1])
+        numeric = columns[2 : 2 + len(SNAPSHOT_NUMERIC_FIELDS)]
+        coded = columns[2 + len(SNAPSHOT_NUMERIC_FIELDS) :]
+        self.numeric = {name: NumericColumn(values) for name, values in zip(SNAPSHOT_NUMERIC_FIELDS, numeric)}
+        self.coded = {name: DictionaryColumn(values) for name, values in zip(SNAPSHOT_CODED_FIELDS, coded)}
+
+    def __len__(self) -> int:
+        return len(self.stand_oids)
+
+    def rows(self, exclude: Set[str] = frozenset()) -> List[Tuple[Any, ...]]:
+        """
+        The rows the snapshot was built from, less those of the `exclude` stands.
+        """
+        columns = [self.numeric[name].decode() for name in SNAPSHOT_NUMERIC_FIELDS] + [self.coded[name].decode() for name in SNAPSHOT_CODED_FIELDS]
+        rows = zip(self.stand_oids, self.stand_part_oids, *columns)
+        return [row for row in rows if row[0] not in exclude] if exclude else list(rows)
+
+    def replace(self, stand_oids: Set[str], rows: Sequence[Tuple[Any, ...]], as_of: datetime) -> "StandAttributesSnapshot":
+        """
+        A new snapshot with the rows of `stand_oids` replaced by `rows`, which were loaded for those stands at `as_of`.
+        When those stands still have the same parts, only the changed values are patched into the new snapshot's columns;
+        otherwise it is rebuilt from every row.
+        """
+        rows = sorted(rows, key=itemgetter(0, 1))
+        positions: List[int] = []
+        for stand_oid in sorted(stand_oids):
+            positions.extend(range(bisect_left(self.stand_oids, stand_oid), bisect_right(self.stand_oids, stand_oid)))
+        if [(self.stand_oids[row], self.stand_part_oids[row]) for row in positions] != [row[:2] for row in rows]:
+            return StandAttributesSnapshot(self.rows(exclude=stand_oids) + rows, as_of)
+        # The OID columns are shared with this snapshot; neither ever changes them.
+        snapshot = copy.copy(self)
+        snapshot.as_of = as_of
+        columns = list(zip(*rows)) or [()] * (2 + len(SNAPSHOT_NUMERIC_FIELDS) + len(SNAPSHOT_CODED_FIELDS))
+        numeric = columns[2 : 2 + len(SNAPSHOT_NUMERIC_FIELDS)]
+        coded = columns[2 + len(SNAPSHOT_NUMERIC_FIELDS) :]
+        snapshot.numeric = {name: self.numeric[name].patch(positions, values) for name, values in zip(SNAPSHOT_NUMERIC_FIELDS, numeric)}
+        snapshot.coded = {name: self.coded[name].patch(positions, values) for name, values in zip(SNAPSHOT_CODED_FIELDS, coded)}
+        return snapshot
+
+    def filter(self, criteria: StandSnapshotQuery) -> List[str]:
+        """
+        Sorted OIDs of the stands with a part matching every criterion that is set.
+        """
+        masks: List[bytes] = []
+        for name in SNAPSHOT_CODED_FIELDS:
+            values = getattr(criteria, name)
+            if values:
+                masks.append(self.coded[name].mask_equal(values))
+        for name in SNAPSHOT_NUMERIC_FIELDS:
+            low, high = getattr(criteria, f"{name}_min"), getattr(criteria, f"{name}_max")
+            if low is not None or high is not None:
+                masks.append(self.numeric[name].mask_between(low, high))
+        stand_oids: Iterable[str] = self.stand_oids
+        if masks:
+            mask = masks[0]
+            if len(masks) > 1:
+                matched = int.from_bytes(mask, "little")
+                for other in masks[1:]:
+                    matched &= int.from_bytes(other, "little")
+                mask = matched.to_bytes(len(self), "little")
+            if mask.count(1) * SPARSE_RATIO < len(mask):
+                stand_oids = [self.stand_oids[match.start()] for match in MATCHED_ROW.finditer(mask)]
+            else:
+                stand_oids = compress(self.stand_oids, mask)
+        # Rows are in stand_oid order; a stand with several matching parts is listed once.
+        return list(dict.fromkeys(stand_oids))
+
+
+class StandSnapshotService:
+    """
+    Owns the current snapshot. The first `snapshot` call loads it inline; once it is `refresh_seconds` old, readers keep
+    getting it while a background thread refreshes it incrementally: only the stands reported through `mark_changed`
+    (the write paths call it after committing) and those whose current part or attributes changed because a version
+    took effect or expired since the last refresh are reloaded. Every `full_reload_seconds` the whole table is reloaded
+    instead, which also picks up writes made outside this process.
+    """
+
+    def __init__(self, refresh_seconds: float, full_reload_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.refresh_seconds = refresh_seconds
+        self.full_reload_seconds = full_reload_seconds
+        self._clock = clock
+        self._snapshot: Optional[StandAttributesSnapshot] = None
+        self._session_factory: Optional[sessionmaker] = None
+        self._changed: Set[str] = set()
+        self._refreshed_at = 0.0
+        self._full_loaded_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._refreshed = threading.Condition(self._lock)
+        # Serializes refreshes: each one builds on the snapshot the previous one produced.
+        self._refresh_lock = threading.Lock()
+        self.full_loads = 0
+        self.incremental_refreshes = 0
+        self.refresh_errors = 0
+        self.last_error: Optional[str] = None
+        self.last_refresh_ms = 0.0
+
+    def snapshot(self, session_factory: sessionmaker) -> StandAttributesSnapshot:
+        with self._lock:
+            self._session_factory = session_factory
+            snapshot = self._snapshot
+            stale = snapshot is not None and self._refreshed_at + self.refresh_seconds <= self._clock()
+            if stale and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh_in_background, daemon=True).start()
+        if snapshot is None:
+            return self.refresh(full=True)
+        return snapshot
+
+    def mark_changed(self, stand_oids: Iterable[str]) -> None:
+        with self._lock:
+            self._changed.update(stand_oids)
+
+    def refresh(self, full: bool = False) -> StandAttributesSnapshot:
+        """
+        Refresh now, incrementally unless `full` (or no snapshot has been loaded, or a full reload is due).
+        """
+        with self._refresh_lock:
+            with self._lock:
+                session_factory, snapshot = self._session_factory, self._snapshot
+                changed, self._changed = self._changed, set()
+            if session_factory is None:
+                raise RuntimeError("The stand snapshot has not been bound to a session factory yet")
+            start, started = self._clock(), time.perf_counter()
+            full = full or snapshot is None or self._full_loaded_at + self.full_reload_seconds <= start
+            as_of = datetime.now()
+            try:
+                with session_factory() as db:
+                    if full:
+                        snapshot = StandAttributesSnapshot(load_snapshot_rows(db, as_of), as_of)
+                    else:
+                        changed.update(stands_with_transitions(db, snapshot.as_of, as_of))
+                        snapshot = snapshot.replace(changed, load_snapshot_rows(db, as_of, sorted(changed)), as_of) if changed else snapshot
+            except Exception:
+                with self._lock:
+                    self._changed.update(changed)  # retried by the next refresh
+                raise
+            with self._lock:
+                self._snapshot = snapshot
+                self._refreshed_at = self._clock()
+                self.last_refresh_ms = (time.perf_counter() - started) * 1000
+                if full:
+                    self._full_loaded_at = start
+                    self.full_loads += 1
+                else:
+                    self.incremental_refreshes += 1
+            return snapshot
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as exc:  # keep serving the previous snapshot; the error is reported through stats()
+            with self._lock:
+                self.refresh_errors += 1
+                self.last_error = f"{type(exc).__name__}: {exc}"
+        finally:
+            with self._lock:
+                self._refreshing = False
+                self._refreshed.notify_all()
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no background refresh is running; returns False if one still is after `timeout` seconds.
+        """
+        with self._refreshed:
+            return self._refreshed.wait_for(lambda: not self._refreshing, timeout)
+
+    def clear(self) -> None:
+        with self._refresh_lock, self._lock:
+            self._snapshot = None
+            self._session_factory = None
+            self._changed.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                "loaded": snapshot is not None,
+                "rows": len(snapshot) if snapshot is not None else 0,
+                "as_of": snapshot.as_of if snapshot is not None else None,
+                "pending_changes": len(self._changed),
+                "refresh_seconds": self.refresh_seconds,
+                "full_loads": self.full_loads,
+                "incremental_refreshes": self.incremental_refreshes,
+                "refresh_errors": self.refresh_errors,
+                "last_error": self.last_error,
+                "last_refresh_ms": self.last_refresh_ms,
+            }
+
+
+# Served by GET /stands/snapshot when Settings.stand_snapshot_enabled is on. create_app builds one per app from its
+# Settings, on app.state.
+def get_stand_snapshot(request: Request) -> StandSnapshotService:
+    return request.app.state.stand_snapshot
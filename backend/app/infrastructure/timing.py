@@ -0,0 +1,226 @@
+"""
+Per-request phase timing.
+
+RequestTimingMiddleware (app/api/timing_middleware.py) starts a RequestTiming for each HTTP request and keeps it in a
+context variable, which Starlette copies into the threadpool for sync endpoints and dependencies. Instrumented code
+attributes its time to a named phase with `phase()` or the `timed` decorator; both are no-ops outside a request.
+Phases are exclusive: while a nested phase runs, the enclosing one is paused, so the phases plus the untracked
+remainder add up to the request's total.
+
+SQL statements are counted and timed by engine events, and ORM lazy loads by a session event, for every engine and
+session in the process.
+"""
+
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RequestTiming:
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        # Exclusive milliseconds per phase, in the order the phases first ran.
+        self.phases: Dict[str, float] = {}
+        self.sql_statements = 0
+        self.sql_ms = 0.0
+        self.lazy_loads = 0
+        # Engine the request was routed to (database.route_request), if it used the database.
+        self.db_route: Optional[str] = None
+        # The thread running the middleware; the stack sampler also follows the threads of the phases in progress.
+        self.thread = threading.get_ident()
+        # Collapsed stacks ("outer;...;inner") and how often each was sampled, while the request is being profiled.
+        self.samples: Counter = Counter()
+        self._stack: List[List[Any]] = []
+
+    def enter(self, name: str) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            outer = self._stack[-1]
+            self._add(outer[0], now - outer[1])
+        self._stack.append([name, now, threading.get_ident()])
+
+    def exit(self) -> None:
+        now = time.perf_counter()
+        name, started, _ = self._stack.pop()
+        self._add(name, now - started)
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def _add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds * 1000
+
+    def threads(self) -> Set[int]:
+        return {self.thread, *(entry[2] for entry in list(self._stack))}
+
+    def record_statement(self, seconds: float) -> None:
+        self.sql_statements += 1
+        self.sql_ms += seconds * 1000
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def server_timing(self, total_ms: float) -> str:
+        """
+        Server-Timing header value: one entry per phase, "other" for the untracked remainder, the SQL statements (part
+        of the phases they ran in), the engine the request was routed to and the total.
+        """
+        entries = [f"{name};dur={ms:.2f}" for name, ms in self.phases.items()]
+        entries.append(f"other;dur={max(total_ms - sum(self.phases.values()), 0.0):.2f}")
+        entries.append(f'sql;dur={self.sql_ms:.2f};desc="{self.sql_statements} statements / {self.lazy_loads} lazy loads"')
+        if self.db_route is not None:
+            entries.append(f'db;desc="{self.db_route}"')
+        entries.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(entries)
+
+    def as_dict(self, total_ms: float) -> Dict[str, Any]:
+        return {
+            "total_ms": round(total_ms, 3),
+            "phases_ms": {name: round(ms, 3) for name, ms in self.phases.items()},
+            "sql_statements": self.sql_statements,
+            "sql_ms": round(self.sql_ms, 3),
+            "lazy_loads": self.lazy_loads,
+            "db_route": self.db_route,
+        }
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current.get()
+
+
+def start_timing() -> RequestTiming:
+    timing = RequestTiming()
+    _current.set(timing)
+    return timing
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    timing.enter(name)
+    try:
+        yield
+    finally:
+        timing.exit()
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator form of `phase` for plain and async functions.
+    """
+
+    def decorate(function: F) -> F:
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def timed_coroutine(*args, **kwargs):
+                with phase(name):
+                    return await function(*args, **kwargs)
+
+            return timed_coroutine  # type: ignore[return-value]
+
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs):
+            if _current.get() is None:
+                return function(*args, **kwargs)
+            with phase(name):
+                return function(*args, **kwargs)
+
+        return timed_function  # type: ignore[return-value]
+
+    return decorate
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault("timing_starts", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timing = _current.get()
+    starts = conn.info.get("timing_starts")
+    if timing is not None and starts:
+        timing.record_statement(time.perf_counter() - starts.pop())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    timing = _current.get()
+    if timing is not None and orm_execute_state.is_select and orm_execute_state.lazy_loaded_from is not None:
+        timing.lazy_loads += 1
+
+
+class StackSampler:
+    """
+    Samples the Python stacks of the threads serving the registered requests every `interval` seconds, from one daemon
+    thread that only runs while a request is registered. Stack samples rather than cProfile: cProfile only sees the
+    thread that enabled it, and a sync endpoint runs on a threadpool thread, not the one running the middleware.
+    On the event loop thread, samples can include other requests' coroutines interleaved with the profiled one.
+    """
+
+    def __init__(self, interval: float, max_depth: int = 64) -> None:
+        self.interval = interval
+        self.max_depth = max_depth
+        self._active: Set[RequestTiming] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self._active.add(timing)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-stack-sampler", daemon=True)
+                self._thread.start()
+
+    def unregister(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self._active.discard(timing)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                active = list(self._active)
+            frames = sys._current_frames()
+            for timing in active:
+                for thread_id in timing.threads():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        timing.samples[self.collapse(frame)] += 1
+            time.sleep(self.interval)
+
+    def collapse(self, frame) -> str:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+def format_samples(samples: Counter, limit: int = 20) -> str:
+    """
+    The most frequent collapsed stacks, one "count stack" line each (the input format of flamegraph tools).
+    """
+    return "\n".join(f"{count} {stack}" for stack, count in samples.most_common(limit))
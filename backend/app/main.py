@@ -1,10 +1,148 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, Optional
+
 from fastapi import FastAPI
-from app.api.endpoints.stand_endpoint import router as stands_router
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import Settings, get_settings
+from app.api.endpoints.health_endpoint import router as health_router
+from app.api.endpoints.stand_ingest_endpoint import router as stand_ingest_router
+from app.api.endpoints.stand_summary_endpoint import compute_summary, summary_key
+from app.api.endpoints.stand_summary_endpoint import router as stand_summary_router
+from app.api.endpoints.stand_snapshot_endpoint import router as stand_snapshot_router
+from app.api.endpoints.stand_changes_endpoint import router as stand_changes_router
+from app.api.timing_middleware import RequestTimingMiddleware
+from app.infrastructure.admission import AdmissionControl
+from app.infrastructure.cache import RefreshingCache, TTLCache
+from app.infrastructure.database import Database
+from app.infrastructure.repositories import async_stand_repository, stand_repository
+from app.infrastructure.stand_snapshot import StandSnapshotService
+
+logger = logging.getLogger(__name__)
+
+
+def prime_sync(database: Database) -> None:
+    # Reads go to the replica when there is one.
+    with database.session_factory_for(replica=True)() as db:
+        stand_repository.prime_statement_cache(db, database.settings.stand_loader_strategy)
+
+
+async def warm_up(database: Database) -> None:
+    """
+    Fill the pools with Settings.db_pool_warmup_connections connections each and run the hot read statements once, so
+    the first requests of a new worker neither connect nor compile SQL.
+    """
+    settings = database.settings
+    # The sync engine serves ingest, summaries and the change feed in async mode too.
+    connections = await run_in_threadpool(database.warm_up, settings.db_pool_warmup_connections)
+    if settings.db_async:
+        connections += await database.warm_up_async(settings.db_pool_warmup_connections)
+    if settings.db_prime_statements:
+        if settings.db_async:
+            async with database.async_session_factory_for(replica=True)() as db:
+                await async_stand_repository.prime_statement_cache(db, settings.stand_loader_strategy)
+        else:
+            await run_in_threadpool(prime_sync, database)
+    logger.info("warmed up %d pooled connections", connections)
+
+
+async def refresh_summaries(database: Database, stand_summary_cache: RefreshingCache, stop: asyncio.Event) -> None:
+    """
+    Compute the Settings.stand_summary_precompute groupings, then recompute every summary computed so far each
+    stand_summary_refresh_seconds until `stop` is set, so summaries are refreshed whether or not anyone reads them.
+    """
+    settings = database.settings
+    for group_by in settings.stand_summary_precompute:
+        key = summary_key(group_by)
+        try:
+            await run_in_threadpool(stand_summary_cache.get, key, partial(compute_summary, database.session_factory, key))
+        except Exception:
+            logger.warning("computing the %s summary failed", ", ".join(key), exc_info=True)
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), settings.stand_summary_refresh_seconds)
+        except asyncio.TimeoutError:
+            try:
+                await run_in_threadpool(stand_summary_cache.refresh)
+            except Exception:
+                # The summaries already computed keep being served; the next tick tries again.
+                logger.warning("scheduled summary refresh failed", exc_info=True)
+
+
+def drain_refreshes(app: FastAPI, timeout: float) -> bool:
+    # The summary cache and the snapshot refresh on daemon threads, which must not be left querying disposed pools.
+    state, deadline = app.state, time.monotonic() + timeout
+    return state.stand_summary_cache.wait_for_refreshes(timeout) and state.stand_snapshot.wait_for_refreshes(max(0.0, deadline - time.monotonic()))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    database: Database = app.state.database
+    try:
+        await warm_up(database)
+    except SQLAlchemyError:
+        # An unreachable database should not keep the worker from starting; requests connect again on demand.
+        logger.warning("database warmup failed", exc_info=True)
+    stop = asyncio.Event()
+    refresher = asyncio.create_task(refresh_summaries(database, app.state.stand_summary_cache, stop))
+    try:
+        yield
+    finally:
+        stop.set()
+        await refresher
+        if not await run_in_threadpool(drain_refreshes, app, database.settings.shutdown_drain_seconds):
+            logger.warning("background refreshes still running at shutdown; disposing of the engines anyway")
+        await database.dispose()
+
+
+def admission_control(settings: Settings) -> AdmissionControl:
+    return AdmissionControl(
+        pool_capacity=settings.db_pool_size + settings.db_max_overflow,
+        pool_shares=settings.admission_pool_shares,
+        max_queue=settings.admission_max_queue,
+        queue_timeout=settings.admission_queue_timeout_seconds,
+        retry_after_seconds=settings.admission_retry_after_seconds,
+    )
+
+
+def create_app(database: Optional[Database] = None) -> FastAPI:
+    """
+    The application, with its engines created lazily from `database` (by default from Settings). Tests pass a Database
+    over their own engine instead of patching this module. Everything the app configures, caches included, comes from
+    `database.settings`, so apps built from different Settings do not share state.
+    """
+    database = database if database is not None else Database(get_settings())
+    settings = database.settings
+    if settings.db_async:
+        from app.api.endpoints.async_stand_endpoint import router as stands_router
+    else:
+        from app.api.endpoints.stand_endpoint import router as stands_router
+
+    app = FastAPI(lifespan=lifespan)
+    app.state.database = database
+    app.state.admission = admission_control(settings) if settings.admission_enabled else None
+    app.state.stand_cache = TTLCache(settings.stand_cache_max_entries, settings.stand_cache_ttl_seconds)
+    app.state.stand_summary_cache = RefreshingCache(settings.stand_summary_refresh_seconds)
+    app.state.stand_snapshot = StandSnapshotService(settings.stand_snapshot_refresh_seconds, settings.stand_snapshot_full_reload_seconds)
+    app.include_router(stands_router)
+    app.include_router(stand_ingest_router)
+    app.include_router(stand_summary_router)
+    app.include_router(stand_snapshot_router)
+    app.include_router(stand_changes_router)
+    app.include_router(health_router)
+    if settings.request_timing_enabled:
+        app.add_middleware(RequestTimingMiddleware, settings=settings)
+
+    @app.get("/")
+    async def root():
+        return {"message": "Hello World"}
 
-app = FastAPI()
-app.include_router(stands_router)
+    return app
 
 
-@app.get("/")
-async def root():
-    return {"message": "Hello World"}
+app = create_app()
@@ -0,0 +1,92 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class PoolSchema(BaseModel):
+    # Live QueuePool sizing (None for pools without a queue, such as SQLite's)
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    # Counters collected from pool events since startup
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    in_use: int = 0
+    max_in_use: int = 0
+    checkout_errors: int = 0
+    checkout_wait_avg_ms: float = 0.0
+    checkout_wait_max_ms: float = 0.0
+
+
+class DbHealthSchema(BaseModel):
+    status: str
+    ping_ms: float
+    pool: PoolSchema
+    # Present when the async engine is enabled (Settings.db_async)
+    async_pool: Optional[PoolSchema] = None
+    # Present when a read replica is configured (Settings.db_read_url / db_read_replica)
+    read_pool: Optional[PoolSchema] = None
+    async_read_pool: Optional[PoolSchema] = None
+    # Requests per routing decision since startup: "primary", "replica", "read_your_writes"
+    routes: Dict[str, int] = {}
+
+
+class SingleFlightStatsSchema(BaseModel):
+    # Loads running now, loads run, requests that shared another request's load instead, failed loads, and loads
+    # detached by a write to their stand
+    in_flight: int
+    loads: int
+    coalesced: int
+    errors: int
+    forgotten: int
+
+
+class AdmissionStatsSchema(BaseModel):
+    # One route group's concurrency limit, requests running and waiting now, and counters since startup
+    limit: int
+    active: int
+    queue_depth: int
+    max_queue_depth: int
+    admitted: int
+    queued: int
+    rejected_queue_full: int
+    rejected_timeout: int
+    queue_wait_avg_ms: float
+    queue_wait_max_ms: float
+
+
+class CacheStatsSchema(BaseModel):
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class SummaryCacheStatsSchema(BaseModel):
+    size: int
+    refresh_seconds: float
+    hits: int
+    misses: int
+    refreshes: int
+    refresh_errors: int
+    last_error: Optional[str] = None
+
+
+class SnapshotStatsSchema(BaseModel):
+    loaded: bool
+    rows: int
+    as_of: Optional[datetime] = None
+    # Stands reported by write paths since the last refresh.
+    pending_changes: int
+    refresh_seconds: float
+    full_loads: int
+    incremental_refreshes: int
+    refresh_errors: int
+    last_error: Optional[str] = None
+    last_refresh_ms: float
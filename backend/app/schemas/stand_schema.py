@@ -1,7 +1,7 @@
 # Pydantic Models (AKA Schemas)
 
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -60,3 +60,128 @@ class StandSchema(BaseModel):
     od_object_type: str
     # You can map SQLAlchemy's 'stand_part_children' to this field.
     stand_parts: List[StandPartSchema] = []
+
+
+class StandPartTreeSchema(StandPartSchema):
+    # Levels away from the requested part, which is depth 0.
+    depth: int = 0
+    children: List["StandPartTreeSchema"] = []
+
+
+class StandSearchRequest(BaseModel):
+    # Exact matches on StandAttributes columns; repeat a parameter to match any of several values.
+    species: Optional[List[str]] = None
+    timber_type: Optional[List[str]] = None
+    status: Optional[List[str]] = None
+    ownership: Optional[List[str]] = None
+    harvest_code: Optional[List[str]] = None
+    # Inclusive ranges; either bound may be left open.
+    site_index_min: Optional[int] = None
+    site_index_max: Optional[int] = None
+    slope_min: Optional[float] = None
+    slope_max: Optional[float] = None
+    elevation_min: Optional[float] = None
+    elevation_max: Optional[float] = None
+
+
+class StandSearchQuery(StandSearchRequest):
+    # GET /stands/search query string: the criteria plus the paging parameters of GET /stands/. Stands match on their
+    # current parts, or on the parts in effect at `as_of`.
+    limit: Optional[int] = Field(default=None, ge=1)
+    cursor: Optional[str] = None
+    include_parts: bool = False
+    as_of: Optional[datetime] = None
+    fields: Optional[str] = None
+
+
+class StandSnapshotQuery(StandSearchRequest):
+    # GET /stands/snapshot: the search criteria, plus aspect, which the snapshot also holds.
+    aspect_min: Optional[float] = None
+    aspect_max: Optional[float] = None
+
+
+class StandSnapshotMatchSchema(BaseModel):
+    # The snapshot's point in time; it trails the database by up to stand_snapshot_refresh_seconds.
+    as_of: datetime
+    count: int
+    stand_oids: List[str] = []
+
+
+class StandBatchRequest(BaseModel):
+    stand_oids: List[str] = Field(min_length=1, max_length=1000)
+    # Only return the part and attribute versions in effect at this instant.
+    as_of: Optional[datetime] = None
+    # Comma-separated StandAttributes fields to return, as in the `fields` query parameter.
+    fields: Optional[str] = None
+
+
+class StandBatchSchema(BaseModel):
+    stands: List[StandSchema] = []
+    # Requested OIDs with no matching STAND row.
+    missing: List[str] = []
+
+
+class StandPageSchema(BaseModel):
+    stands: List[StandSchema] = []
+    # Opaque cursor for the following page, None on the last page.
+    next: Optional[str] = None
+
+
+class StandChangeSchema(BaseModel):
+    # The latest instant at which one of the stand's part or attributes versions took effect or expired.
+    changed_at: datetime
+    # Resume the feed after this change by passing it back as `cursor`.
+    cursor: str
+    # The stand as of the feed's end; without parts when they have all expired.
+    stand: StandSchema
+
+
+class StandIngestChunkSchema(BaseModel):
+    index: int
+    stands: int
+    written: int
+    failed: int
+    # Rows inserted / updated per table, keyed "stand", "stand_part", "stand_attributes".
+    inserted: Dict[str, int] = {}
+    updated: Dict[str, int] = {}
+    # True when the chunk transaction failed and its stands were retried one per transaction.
+    retried: bool = False
+    duration_ms: float
+
+
+class StandIngestFailureSchema(BaseModel):
+    # Position of the record in the request body (0-based), and its OID when it parsed far enough to have one.
+    index: int
+    stand_oid: Optional[str] = None
+    error: str
+
+
+class StandIngestSchema(BaseModel):
+    received: int
+    written: int
+    chunks: List[StandIngestChunkSchema] = []
+    failures: List[StandIngestFailureSchema] = []
+
+
+class StandSummaryRowSchema(BaseModel):
+    # Only the grouped dimensions are present in a row.
+    species: Optional[str] = None
+    timber_type: Optional[str] = None
+    ownership: Optional[str] = None
+    status: Optional[str] = None
+    stands: int
+    parts: int
+    mean_site_index: Optional[float] = None
+    mean_slope: Optional[float] = None
+    mean_elevation: Optional[float] = None
+
+
+class StandSummarySchema(BaseModel):
+    group_by: List[str]
+    # When the summary was computed; it is refreshed in the background once older than stand_summary_refresh_seconds.
+    refreshed_at: datetime
+    rows: List[StandSummaryRowSchema] = []
+
+
+class StandSummaryRefreshSchema(BaseModel):
+    refreshed: List[List[str]] = []
@@ -0,0 +1,82 @@
+"""
+Compiled StandAttributes converters vs the hand-written keyword-argument adapters they replaced, on a batch of rows.
+The keyword-argument baseline is generated from the same field list, so it is the exact code shape of the old adapters.
+
+    cd backend && python -m benchmarks.bench_converters --rows 10000
+"""
+
+import argparse
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, List
+
+from app.domain.stand_domain import StandAttributes as DomainStandAttributes
+from app.infrastructure.adapters import stand_adapter
+from app.infrastructure.orm_models.stand_model import StandAttributes as ORMStandAttributes
+from app.schemas.stand_schema import StandAttributesSchema
+
+
+def keyword_adapter(target: type) -> Callable:
+    arguments = ", ".join(f"{name}=source.{name}" for name in stand_adapter.STAND_ATTRIBUTES_FIELDS)
+    namespace = {"target": target}
+    exec(f"def convert(source):\n    return target({arguments})", namespace)
+    return namespace["convert"]
+
+
+def rows(count: int) -> List[ORMStandAttributes]:
+    # Every column is set, as on an instance loaded from the database.
+    unset = dict.fromkeys(stand_adapter.STAND_ATTRIBUTES_FIELDS)
+    return [
+        ORMStandAttributes(
+            **unset
+            | dict(
+                stand_part_oid=f"{i:010d}",
+                effective_date=datetime(2020, 1, 1),
+                status="ACTIVE",
+                timber_type="CONIFER",
+                species="DF",
+                site_index=120,
+                description="x" * 100,
+                slope=Decimal("12.5"),
+                aspect=Decimal("180"),
+                elevation=Decimal("350.25"),
+            )
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, function: Callable, argument) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    orm_attrs = rows(args.rows)
+    domain_attrs = stand_adapter.orm_to_domain_stand_attributes_many(orm_attrs)
+    schemas = stand_adapter.domain_to_schema_stand_attributes_many(domain_attrs)
+    cases = [
+        ("orm_to_domain", orm_attrs, keyword_adapter(DomainStandAttributes), stand_adapter.orm_to_domain_stand_attributes_many),
+        ("domain_to_schema", domain_attrs, keyword_adapter(StandAttributesSchema), stand_adapter.domain_to_schema_stand_attributes_many),
+        ("schema_to_domain", schemas, keyword_adapter(DomainStandAttributes), stand_adapter.schema_to_domain_stand_attributes_many),
+        ("domain_to_orm", domain_attrs, keyword_adapter(ORMStandAttributes), stand_adapter.domain_to_orm_stand_attributes_many),
+    ]
+    print(f"{'conversion':<18} {'keyword ms':>11} {'compiled ms':>12} {'speedup':>8}   ({args.rows} rows)")
+    for name, sources, keyword, compiled in cases:
+        baseline = best_of(args.repeat, lambda items: [keyword(item) for item in items], sources)
+        optimized = best_of(args.repeat, compiled, sources)
+        print(f"{name:<18} {baseline:>11.1f} {optimized:>12.1f} {baseline / optimized:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
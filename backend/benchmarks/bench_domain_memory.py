@@ -0,0 +1,93 @@
+"""
+Bytes per StandAttributes held in memory: the previous __dict__-backed dataclass vs the slotted one, with and without
+interned low-cardinality codes. Every row gets freshly built strings, as a database driver returns them.
+
+    cd backend && python -m benchmarks.bench_domain_memory --rows 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from datetime import datetime
+from typing import Callable, List
+
+from app.domain.stand_domain import StandAttributes as DomainStandAttributes
+from app.infrastructure.adapters import stand_adapter
+from app.infrastructure.orm_models.stand_model import StandAttributes as ORMStandAttributes
+
+# The domain class as it was before slots: same fields, instances carry a __dict__.
+DictStandAttributes = make_dataclass("DictStandAttributes", [(f.name, f.type, field(default=f.default)) for f in fields(DomainStandAttributes)])
+
+CODES = {
+    "status": ["ACTIVE", "RETIRED"],
+    "timber_type": ["CONIFER", "HARDWOOD", "MIXED"],
+    "harvest_code": ["CC", "PC", "TH", "NONE"],
+    "source": ["CRUISE", "PHOTO", "EDX"],
+    "ownership": ["STATE", "TRUST"],
+    "species": ["DF", "WH", "RA", "RC", "SS"],
+    "co_dom_species": ["DF", "WH", "RA"],
+    "regeneration_type": ["PLANTED", "NATURAL"],
+    "special_area_flag": ["Y", "N"],
+    "survival_status": ["OK", "FAIL"],
+    "strata": ["A1", "B2", "C3"],
+    "reserved_timber_stand_flag": ["Y", "N"],
+    "sold_flag": ["Y", "N"],
+    "cng_edx_import_flag": ["Y", "N"],
+    "decremented_from_ss_flag": ["Y", "N"],
+    "edx_in_progress_flag": ["Y", "N"],
+}
+
+
+def fresh(value: str) -> str:
+    # Concatenation builds a new string object instead of reusing the literal.
+    return "".join([value[:1], value[1:]])
+
+
+def rows(count: int) -> List[ORMStandAttributes]:
+    unset = dict.fromkeys(stand_adapter.STAND_ATTRIBUTES_FIELDS)
+    return [
+        ORMStandAttributes(
+            **unset
+            | {name: fresh(values[i % len(values)]) for name, values in CODES.items()}
+            | dict(stand_part_oid=f"{i:010d}", effective_date=datetime(2020, 1, 1), stand_number=f"S{i}", site_index=120)
+        )
+        for i in range(count)
+    ]
+
+
+def dict_attributes(count: int) -> list:
+    return [DictStandAttributes(**{name: getattr(a, name) for name in stand_adapter.STAND_ATTRIBUTES_FIELDS}) for a in rows(count)]
+
+
+def retained_bytes(build: Callable[[], list]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    # ORM source rows hold reference cycles through their InstanceState; collect them so only the result is counted.
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    # Convert from a fresh batch every time so the compared cases never share string objects.
+    cases = [
+        ("dict dataclass", lambda: dict_attributes(args.rows)),
+        ("slotted", lambda: stand_adapter.orm_to_domain_stand_attributes_many(rows(args.rows))),
+        ("slotted + interned", lambda: stand_adapter.orm_to_compact_stand_attributes_many(rows(args.rows))),
+        ("frozen + interned", lambda: stand_adapter.orm_to_compact_stand_attributes_many(rows(args.rows), frozen=True)),
+    ]
+    print(f"{'representation':<20} {'bytes/row':>10}   ({args.rows} rows, including the strings they reference)")
+    for name, build in cases:
+        print(f"{name:<20} {retained_bytes(build) / args.rows:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+CPU per GET /stands/{stand_oid}/ for the "orm" and "fast" read modes, measured through the ASGI app against SQLite
+with the stand cache disabled.
+
+    cd backend && python -m benchmarks.bench_read_stand --parts 20 --requests 500
+"""
+
+import argparse
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.infrastructure.database import Base, Database
+from app.infrastructure.orm_models.stand_model import Stand, StandAttributes, StandPart
+from app.main import create_app
+
+
+def seed(session_factory: sessionmaker, parts: int) -> None:
+    stand = Stand(stand_oid="9001001001", od_object_type="STAND")
+    for i in range(parts):
+        part = StandPart(stand_oid="9001001001", stand_part_oid=f"9001{i:06d}", od_part_type="PART", effective_date=datetime(2020, 1, 1))
+        part.stand_attribute_children = [
+            StandAttributes(
+                stand_part_oid=part.stand_part_oid,
+                effective_date=datetime(2020, 1, 1),
+                status="ACTIVE",
+                timber_type="CONIFER",
+                species="DF",
+                site_index=120,
+                description="x" * 200,
+                slope=Decimal("12.5"),
+                aspect=Decimal("180"),
+                elevation=Decimal("350.25"),
+            )
+        ]
+        stand.stand_part_children.append(part)
+    with session_factory() as session:
+        session.add(stand)
+        session.commit()
+
+
+def measure(client: TestClient, requests: int) -> float:
+    """
+    Mean CPU milliseconds per request.
+    """
+    client.get("/stands/9001001001/")  # warm up
+    start = time.process_time()
+    for _ in range(requests):
+        client.get("/stands/9001001001/")
+    return (time.process_time() - start) * 1000 / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parts", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    seed(session_factory, args.parts)
+
+    results = {}
+    # One app per read mode; their lifespans, which dispose of the in-memory database, end together.
+    with ExitStack() as clients:
+        for mode in ("orm", "fast"):
+            settings = get_settings().model_copy(update={"stand_read_mode": mode, "stand_cache_max_entries": 0})
+            client = clients.enter_context(TestClient(create_app(Database(settings, engine=engine))))
+            results[mode] = measure(client, args.requests)
+            print(f"{mode:>4}: {results[mode]:.3f} ms CPU/request ({args.parts} parts)")
+    print(f"saved: {results['orm'] - results['fast']:.3f} ms CPU/request ({1 - results['fast'] / results['orm']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
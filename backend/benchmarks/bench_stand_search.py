@@ -0,0 +1,106 @@
+"""
+Query plans and page latency of GET /stands/search predicates as STAND_ATTRIBUTES grows, on a seeded SQLite database.
+The planner either seeks a search index on STAND_ATTRIBUTES, or walks STAND_PART in STAND_OID order and stops once the
+page is full (its pick for predicates it estimates as unselective). A plan that scans STAND_ATTRIBUTES itself is flagged.
+Run with --drop-indexes to see what the search indexes replace.
+
+    cd backend && python -m benchmarks.bench_stand_search --sizes 10000 100000 300000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database import Base
+from app.infrastructure.orm_models.stand_model import Stand, StandAttributes, StandPart
+from app.infrastructure.repositories.stand_repository import stand_search_statement
+from app.schemas.stand_schema import StandSearchRequest
+
+QUERIES: Dict[str, StandSearchRequest] = {
+    "species+status+site_index": StandSearchRequest(species=["RC"], status=["ACTIVE"], site_index_min=140),
+    "ownership": StandSearchRequest(ownership=["COUNTY"]),
+    "timber_type+slope": StandSearchRequest(timber_type=["HARDWOOD"], slope_min=40),
+    "elevation range": StandSearchRequest(elevation_min=1200, elevation_max=1210),
+    "harvest_code": StandSearchRequest(harvest_code=["SALVAGE"]),
+    "status": StandSearchRequest(status=["ACTIVE"]),
+}
+
+
+def seed(engine: Engine, start: int, stop: int, rng: random.Random) -> None:
+    stands: List[dict] = []
+    parts: List[dict] = []
+    attributes: List[dict] = []
+    for i in range(start, stop):
+        stand_oid, stand_part_oid = f"S{i:09d}", f"P{i:09d}"
+        stands.append({"stand_oid": stand_oid, "od_object_type": "STAND"})
+        parts.append({"stand_part_oid": stand_part_oid, "stand_oid": stand_oid, "od_part_type": "PART", "effective_date": datetime(2020, 1, 1)})
+        attributes.append(
+            {
+                "stand_part_oid": stand_part_oid,
+                "species": rng.choices(["DF", "WH", "RA", "RC"], weights=[60, 25, 12, 3])[0],
+                "status": rng.choices(["ACTIVE", "RETIRED"], weights=[90, 10])[0],
+                "timber_type": rng.choices(["CONIFER", "HARDWOOD", "MIXED"], weights=[70, 10, 20])[0],
+                "ownership": rng.choices(["STATE", "TRUST", "COUNTY"], weights=[70, 29, 1])[0],
+                "harvest_code": rng.choices(["CC", "THIN", "NONE", "SALVAGE"], weights=[30, 30, 39.5, 0.5])[0],
+                "site_index": rng.randint(60, 160),
+                "slope": Decimal(rng.randint(0, 6000)) / 100,
+                "elevation": Decimal(rng.randint(0, 150000)) / 100,
+            }
+        )
+    # ORM bulk INSERT, so the rows are keyed by attribute name like the ingest path's.
+    with Session(engine) as session, session.begin():
+        session.execute(insert(Stand), stands)
+        session.execute(insert(StandPart), parts)
+        session.execute(insert(StandAttributes), attributes)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+
+
+def plan_and_latency(engine: Engine, criteria: StandSearchRequest, repeat: int = 5) -> tuple:
+    statement = stand_search_statement(criteria, datetime.now(), limit=100)
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        plan = "; ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            connection.execute(statement).all()
+            timings.append(time.perf_counter() - start)
+    return plan, min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--drop-indexes", action="store_true", help="drop the search indexes to compare against full scans")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    if args.drop_indexes:
+        with engine.begin() as connection:
+            for index in StandAttributes.__table__.indexes:
+                index.drop(connection)
+
+    rng = random.Random(args.seed)
+    seeded = 0
+    for size in sorted(args.sizes):
+        seed(engine, seeded, size, rng)
+        seeded = size
+        print(f"\n{size} STAND_ATTRIBUTES rows")
+        for name, criteria in QUERIES.items():
+            plan, milliseconds = plan_and_latency(engine, criteria)
+            flag = "FULL SCAN " if "SCAN STAND_ATTRIBUTES" in plan else ""
+            print(f"  {name:<26} {milliseconds:>8.2f} ms   {flag}{plan}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Build and refresh time of the columnar stand snapshot and the latency of its filters, against the same predicates run
+as SQL by GET /stands/search (one page) on the seeded SQLite database of bench_stand_search.
+
+    cd backend && python -m benchmarks.bench_stand_snapshot --size 300000
+"""
+
+import argparse
+import random
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.database import Base
+from app.infrastructure.stand_snapshot import StandSnapshotService
+from app.schemas.stand_schema import StandSnapshotQuery
+from benchmarks.bench_stand_search import QUERIES, plan_and_latency, seed
+
+SNAPSHOT_QUERIES = {name: StandSnapshotQuery(**criteria.model_dump()) for name, criteria in QUERIES.items()}
+SNAPSHOT_QUERIES["terrain"] = StandSnapshotQuery(slope_min=30, slope_max=45, elevation_min=800, site_index_min=100)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--changed", type=int, default=1000, help="stands marked changed before the incremental refresh")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    seed(engine, 0, args.size, random.Random(args.seed))
+    service = StandSnapshotService(refresh_seconds=3600, full_reload_seconds=3600)
+
+    start = time.perf_counter()
+    snapshot = service.snapshot(sessionmaker(bind=engine))
+    print(f"full load of {len(snapshot)} rows: {(time.perf_counter() - start) * 1000:.0f} ms")
+    service.mark_changed(f"S{i:09d}" for i in range(args.changed))
+    start = time.perf_counter()
+    snapshot = service.refresh()
+    print(f"incremental refresh of {args.changed} stands: {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    print(f"  {'query':<26} {'matches':>8} {'snapshot':>11} {'SQL page':>11}")
+    for name, criteria in SNAPSHOT_QUERIES.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            stand_oids = snapshot.filter(criteria)
+            timings.append(time.perf_counter() - start)
+        _, sql_milliseconds = plan_and_latency(engine, criteria)
+        print(f"  {name:<26} {len(stand_oids):>8} {min(timings) * 1000:>8.2f} ms {sql_milliseconds:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Synthetic STAND / STAND_PART / STAND_ATTRIBUTES data for the benchmarks, written through the ORM models into SQLite.
+The same arguments and seed always produce the same rows. STAND_ATTRIBUTES is keyed by STAND_PART_OID, so every part
+carries one attributes row and a dataset has stands × parts attributes rows (1M = 100000 stands × 10 parts).
+"""
+
+import random
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.database import Base
+from app.infrastructure.orm_models.stand_model import Stand, StandAttributes, StandPart
+
+# Low-cardinality codes with skewed frequencies, like the production columns.
+CODES: Dict[str, Dict[str, int]] = {
+    "species": {"DF": 60, "WH": 25, "RA": 12, "RC": 3},
+    "status": {"ACTIVE": 90, "RETIRED": 10},
+    "timber_type": {"CONIFER": 70, "HARDWOOD": 10, "MIXED": 20},
+    "ownership": {"STATE": 70, "TRUST": 29, "COUNTY": 1},
+    "harvest_code": {"CC": 30, "THIN": 30, "NONE": 39, "SALVAGE": 1},
+}
+
+
+def stand_oid(index: int) -> str:
+    return f"S{index:09d}"
+
+
+def sqlite_engine(path: Optional[str] = None) -> Engine:
+    """
+    A file database at `path`, or a private in-memory one, shared by every session (and thread) of the benchmark.
+    """
+    if path is None:
+        return create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    return create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+
+def attribute_row(rng: random.Random, stand_part_oid: str) -> dict:
+    row = {name: rng.choices(list(weights), weights=list(weights.values()))[0] for name, weights in CODES.items()}
+    row.update(
+        stand_part_oid=stand_part_oid,
+        effective_date=datetime(2020, 1, 1),
+        stand_number=f"{rng.randint(1, 99999):05d}",
+        site_index=rng.randint(60, 160),
+        slope=Decimal(rng.randint(0, 6000)) / 100,
+        aspect=Decimal(rng.randint(0, 35999)) / 100,
+        elevation=Decimal(rng.randint(0, 150000)) / 100,
+        description=" ".join(rng.choices(["stand", "thinned", "road", "creek", "buffer", "replant", "survey"], k=rng.randint(0, 30))),
+    )
+    return row
+
+
+def generate(engine: Engine, stands: int, parts: int, seed: int = 1, batch_stands: int = 5000) -> int:
+    """
+    Create the tables and insert `stands` stands of `parts` parts each, `batch_stands` stands per transaction.
+    Returns the number of attributes rows written.
+    """
+    Base.metadata.create_all(engine)
+    rng = random.Random(seed)
+    for start in range(0, stands, batch_stands):
+        stand_rows: List[dict] = []
+        part_rows: List[dict] = []
+        attribute_rows: List[dict] = []
+        for index in range(start, min(start + batch_stands, stands)):
+            oid = stand_oid(index)
+            stand_rows.append({"stand_oid": oid, "od_object_type": "STAND"})
+            for part in range(parts):
+                stand_part_oid = f"P{index * parts + part:09d}"
+                part_rows.append({"stand_part_oid": stand_part_oid, "stand_oid": oid, "od_part_type": "PART", "effective_date": datetime(2020, 1, 1)})
+                attribute_rows.append(attribute_row(rng, stand_part_oid))
+        # ORM bulk INSERT (one executemany per table), with the rows keyed by attribute name like the ingest path's.
+        with Session(engine) as session, session.begin():
+            session.execute(insert(Stand), stand_rows)
+            session.execute(insert(StandPart), part_rows)
+            session.execute(insert(StandAttributes), attribute_rows)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+    return stands * parts
+
+
+def row_counts(engine: Engine) -> Dict[str, int]:
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        return {model.__tablename__: session.scalar(select(func.count()).select_from(model)) for model in (Stand, StandPart, StandAttributes)}
@@ -0,0 +1,229 @@
+"""
+Reproducible benchmark suite on a seeded SQLite dataset (see benchmarks.dataset): get_stand latency, each stand_adapter
+conversion, GET /stands/{stand_oid}/ latency through the ASGI app in both read modes (p50/p95/p99, stand cache off),
+SQL statements per call and request, and peak traced memory. Stands are sampled with a fixed seed, so two runs on the
+same dataset measure the same work.
+
+Results are written as a flat JSON object of metrics, all lower-is-better. With --baseline, every metric is compared
+against a previous run's file and the process exits with status 1 if any got worse by more than --tolerance (query
+counts by any amount), so CI can catch regressions:
+
+    cd backend && python -m benchmarks.suite --stands 20000 --parts 10 --output baseline.json
+    cd backend && python -m benchmarks.suite --stands 20000 --parts 10 --baseline baseline.json
+
+--database keeps the generated SQLite file and reuses it on later runs, which matters at 1M attributes rows.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack
+from typing import Callable, Dict, List, Sequence
+
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.infrastructure.adapters import stand_adapter
+from app.infrastructure.database import Database
+from app.infrastructure.query_counter import count_queries
+from app.infrastructure.repositories.stand_repository import get_stand, stand_aggregate_options, stand_rows_statement
+from app.infrastructure.orm_models.stand_model import Stand as ORMStand
+from app.main import create_app
+from benchmarks.dataset import generate, row_counts, sqlite_engine, stand_oid
+
+Metrics = Dict[str, float]
+
+
+def percentiles(prefix: str, seconds: Sequence[float]) -> Metrics:
+    milliseconds = sorted(sample * 1000 for sample in seconds)
+    cuts = statistics.quantiles(milliseconds, n=100, method="inclusive")
+    return {
+        f"{prefix}.mean_ms": statistics.fmean(milliseconds),
+        f"{prefix}.p50_ms": cuts[49],
+        f"{prefix}.p95_ms": cuts[94],
+        f"{prefix}.p99_ms": cuts[98],
+    }
+
+
+def timed(call: Callable[[], object], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_get_stand(engine: Engine, session_factory: sessionmaker, stand_oids: Sequence[str]) -> Metrics:
+    metrics: Metrics = {}
+    for strategy in ("selectin", "joined"):
+        samples = []
+        with count_queries(engine) as counter:
+            for oid in stand_oids:
+                with session_factory() as db:
+                    start = time.perf_counter()
+                    get_stand(db, oid, strategy)
+                    samples.append(time.perf_counter() - start)
+        metrics.update(percentiles(f"get_stand.{strategy}", samples))
+        metrics[f"get_stand.{strategy}.queries"] = counter.count / len(stand_oids)
+    return metrics
+
+
+def bench_adapters(session_factory: sessionmaker, stand_oids: Sequence[str], repeat: int) -> Metrics:
+    """
+    Mean microseconds per stand for each aggregate-level conversion, on aggregates loaded up front.
+    """
+    with session_factory() as db:
+        orm_stands = db.query(ORMStand).options(*stand_aggregate_options()).filter(ORMStand.stand_oid.in_(stand_oids)).all()
+        stand_rows = [db.execute(stand_rows_statement(oid)).all() for oid in stand_oids]
+        domain_stands = [stand_adapter.orm_to_domain(orm_stand) for orm_stand in orm_stands]
+        schemas = [stand_adapter.domain_to_schema_stand(domain_stand) for domain_stand in domain_stands]
+        conversions: Dict[str, Callable[[], object]] = {
+            "orm_to_domain": lambda: [stand_adapter.orm_to_domain(orm_stand) for orm_stand in orm_stands],
+            "domain_to_schema_stand": lambda: [stand_adapter.domain_to_schema_stand(stand) for stand in domain_stands],
+            "schema_to_domain_stand": lambda: [stand_adapter.schema_to_domain_stand(schema) for schema in schemas],
+            "domain_to_orm": lambda: [stand_adapter.domain_to_orm(stand) for stand in domain_stands],
+            "domain_to_rows": lambda: stand_adapter.domain_to_rows(domain_stands),
+            "rows_to_schema_stand": lambda: [stand_adapter.rows_to_schema_stand(rows) for rows in stand_rows],
+            "schema_to_json": lambda: [schema.model_dump_json() for schema in schemas],
+        }
+        metrics = {}
+        for name, convert in conversions.items():
+            convert()  # warm up
+            metrics[f"adapter.{name}.us_per_stand"] = min(timed(convert, repeat)) * 1e6 / len(orm_stands)
+    return metrics
+
+
+def read_client(clients: ExitStack, engine: Engine, settings: Settings) -> TestClient:
+    # The stand cache is disabled, so every request loads the stand. The app's lifespan, which disposes of the shared
+    # engine, ends with `clients`.
+    settings = settings.model_copy(update={"stand_cache_max_entries": 0})
+    return clients.enter_context(TestClient(create_app(Database(settings, engine=engine))))
+
+
+def bench_read_stand(clients: Dict[str, TestClient], engine: Engine, stand_oids: Sequence[str]) -> Metrics:
+    metrics: Metrics = {}
+    for mode, client in clients.items():
+        client.get(f"/stands/{stand_oids[0]}/")  # warm up
+        with count_queries(engine) as counter:
+            samples = timed_requests(client, stand_oids)
+        metrics.update(percentiles(f"read_stand.{mode}", samples))
+        metrics[f"read_stand.{mode}.queries"] = counter.count / len(stand_oids)
+    return metrics
+
+
+def timed_requests(client: TestClient, stand_oids: Sequence[str]) -> List[float]:
+    samples = []
+    for oid in stand_oids:
+        start = time.perf_counter()
+        response = client.get(f"/stands/{oid}/")
+        samples.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET /stands/{oid}/ returned {response.status_code}")
+    return samples
+
+
+def bench_memory(client: TestClient, stand_oids: Sequence[str]) -> Metrics:
+    """
+    Peak Python heap over a run of requests (tracemalloc), and the process' peak resident set size.
+    """
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        timed_requests(client, stand_oids)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 if sys.platform == "darwin" else 1)
+    return {"memory.read_stand_peak_kib": (peak - baseline) / 1024, "memory.max_rss_kib": max_rss}
+
+
+def compare(results: Metrics, baseline: Metrics, tolerance: float) -> List[str]:
+    """
+    One line per metric that got worse than the baseline by more than `tolerance` (a fraction); query counts may not grow at all.
+    """
+    regressions = []
+    for name, value in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        allowed = previous if name.endswith(".queries") else previous * (1 + tolerance)
+        if value > allowed:
+            change = f"+{value / previous - 1:.0%}" if previous else "new"
+            regressions.append(f"{name}: {previous:.3f} -> {value:.3f} ({change})")
+    return regressions
+
+
+def run(args: argparse.Namespace) -> Dict[str, object]:
+    reuse = args.database is not None and os.path.exists(args.database)
+    engine = sqlite_engine(args.database)
+    if reuse:
+        counts = row_counts(engine)
+        print(f"reusing {args.database}: {counts}")
+    else:
+        start = time.perf_counter()
+        generate(engine, args.stands, args.parts, args.seed)
+        counts = row_counts(engine)
+        print(f"generated {counts} in {time.perf_counter() - start:.1f} s")
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    rng = random.Random(args.seed)
+    stand_oids = [stand_oid(rng.randrange(counts["STAND"])) for _ in range(args.requests)]
+
+    metrics: Metrics = {}
+    metrics.update(bench_get_stand(engine, session_factory, stand_oids))
+    metrics.update(bench_adapters(session_factory, stand_oids[: args.adapter_stands], args.repeat))
+    settings = get_settings()
+    with ExitStack() as clients:
+        read_clients = {mode: read_client(clients, engine, settings.model_copy(update={"stand_read_mode": mode})) for mode in ("orm", "fast")}
+        metrics.update(bench_read_stand(read_clients, engine, stand_oids))
+        metrics.update(bench_memory(read_clients[settings.stand_read_mode], stand_oids[: args.memory_requests]))
+    dataset = {"stands": counts["STAND"], "parts": counts["STAND_PART"], "attributes": counts["STAND_ATTRIBUTES"], "seed": args.seed}
+    return {"dataset": dataset, "python": platform.python_version(), "metrics": metrics}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stands", type=int, default=10000)
+    parser.add_argument("--parts", type=int, default=10, help="parts per stand, each with one attributes row")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database", help="SQLite file to generate into, or reuse when it exists (default: in memory)")
+    parser.add_argument("--requests", type=int, default=500, help="stands read by the get_stand and read_stand benchmarks")
+    parser.add_argument("--adapter-stands", type=int, default=200)
+    parser.add_argument("--memory-requests", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this results file; exit 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown before a metric counts as regressed")
+    args = parser.parse_args()
+
+    results = run(args)
+    for name, value in results["metrics"].items():
+        print(f"  {name:<46} {value:>12.3f}")
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("dataset") != results["dataset"]:
+            print(f"warning: baseline dataset {baseline.get('dataset')} differs from {results['dataset']}")
+        regressions = compare(results["metrics"], baseline["metrics"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
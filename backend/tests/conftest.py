@@ -0,0 +1,122 @@
+from contextlib import ExitStack
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.infrastructure.database import Base, Database
+from app.infrastructure.pool_metrics import instrument_pool
+from app.main import create_app
+from app.infrastructure.adapters import stand_adapter
+from app.infrastructure.orm_models.stand_model import Stand, StandPart, StandAttributes
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    instrument_pool(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def make_stand(stand_oid: str, parts: int = 1, od_object_type: str = "STAND") -> Stand:
+    """
+    Build an ORM Stand with `parts` StandParts, each carrying one StandAttributes row.
+    """
+    stand = Stand(stand_oid=stand_oid, od_object_type=od_object_type)
+    for i in range(parts):
+        stand_part_oid = f"{stand_oid[-6:]}{i:04d}"
+        part = StandPart(
+            stand_oid=stand_oid,
+            stand_part_oid=stand_part_oid,
+            od_part_type="PART",
+            effective_date=datetime(2020, 1, 1),
+        )
+        part.stand_attribute_children = [
+            StandAttributes(stand_part_oid=stand_part_oid, effective_date=datetime(2020, 1, 1), species="DF", status="ACTIVE", site_index=120)
+        ]
+        stand.stand_part_children.append(part)
+    return stand
+
+
+def make_dated_stand(stand_oid: str) -> Stand:
+    """
+    Three part versions: expired at 2021-01-01, current since 2021-01-01 (attributes effective 2022-01-01), and future from 2023-01-01.
+    """
+    stand = make_stand(stand_oid, parts=3)
+    expired, current, future = stand.stand_part_children
+    expired.expiry_date = datetime(2021, 1, 1)
+    current.effective_date = datetime(2021, 1, 1)
+    current.stand_attribute_children[0].effective_date = datetime(2022, 1, 1)
+    future.effective_date = datetime(2023, 1, 1)
+    return stand
+
+
+def make_part_tree_stand(stand_oid: str) -> Stand:
+    """
+    Five parts linked through stand_pnt_part_oid: 0 is the root, 1 and 2 its children, 3 a child of 1 and 4 a child of 3.
+    """
+    stand = make_stand(stand_oid, parts=5)
+    parts = stand.stand_part_children
+    for child, parent in ((1, 0), (2, 0), (3, 1), (4, 3)):
+        parts[child].stand_pnt_part_oid = parts[parent].stand_part_oid
+    return stand
+
+
+def stand_document(stand_oid: str, parts: int = 1, species: str = "DF") -> dict:
+    """
+    make_stand as the JSON document POST /stands/ingest accepts.
+    """
+    orm_stand = make_stand(stand_oid, parts)
+    for part in orm_stand.stand_part_children:
+        part.stand_attribute_children[0].species = species
+    return stand_adapter.domain_to_schema_stand(stand_adapter.orm_to_domain(orm_stand)).model_dump(mode="json")
+
+
+@pytest.fixture
+def seed_stands(session_factory):
+    def seed(*stands: Stand) -> None:
+        with session_factory() as session:
+            session.add_all(stands)
+            session.commit()
+
+    return seed
+
+
+@pytest.fixture
+def make_client(engine):
+    """
+    Clients of apps of their own over the test engine, built from the process' Settings with the given values replaced.
+    Entering a client runs the app's lifespan (warmup); the lifespans end, disposing of the engine, after the test.
+    """
+    with ExitStack() as clients:
+
+        def make(**settings) -> TestClient:
+            app = create_app(Database(get_settings().model_copy(update=settings), engine=engine))
+            return clients.enter_context(TestClient(app))
+
+        yield make
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client()
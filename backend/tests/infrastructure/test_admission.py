@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.core.config import Settings
+from app.infrastructure.admission import AdmissionControl, AdmissionLimiter, AdmissionRejected
+from app.main import admission_control
+
+
+def test_limiter_queues_then_rejects():
+    async def main():
+        limiter = AdmissionLimiter("reads", limit=1, max_queue=1, queue_timeout=5)
+        await limiter.acquire()
+        queued = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert (limiter.active, limiter.stats()["queue_depth"]) == (1, 1)
+        with pytest.raises(AdmissionRejected, match="queue full"):
+            await limiter.acquire()
+        # The released slot goes straight to the waiting request.
+        limiter.release()
+        await queued
+        assert (limiter.active, limiter.stats()["queue_depth"]) == (1, 0)
+        limiter.release()
+        assert limiter.active == 0
+        return limiter.stats()
+
+    stats = asyncio.run(main())
+    assert (stats["admitted"], stats["queued"], stats["max_queue_depth"], stats["rejected_queue_full"]) == (2, 1, 1, 1)
+
+
+def test_limiter_queue_timeout_and_cancellation():
+    async def main():
+        limiter = AdmissionLimiter("reads", limit=1, max_queue=10, queue_timeout=0.01)
+        await limiter.acquire()
+        with pytest.raises(AdmissionRejected, match="queue timeout"):
+            await limiter.acquire()
+        limiter.queue_timeout = 5
+        cancelled = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert limiter.stats()["queue_depth"] == 0
+        limiter.release()
+        assert limiter.active == 0
+        return limiter.stats()
+
+    stats = asyncio.run(main())
+    assert (stats["rejected_timeout"], stats["admitted"]) == (1, 1)
+    assert stats["queue_wait_max_ms"] >= 10
+
+
+def test_limits_are_shares_of_the_pool():
+    control = AdmissionControl(pool_capacity=15, pool_shares={"listing": 0.5, "ingest": 0.01}, max_queue=10, queue_timeout=1, retry_after_seconds=1)
+    # Groups without a share split what the listed ones leave over.
+    assert [control.limit_for(group) for group in ("read", "listing", "ingest")] == [7, 7, 1]
+    assert control.limiter("listing") is control.limiter("listing")
+    assert list(control.stats()) == ["listing"]
+    with pytest.raises(ValueError, match="add up to 1.5"):
+        AdmissionControl(pool_capacity=15, pool_shares={"listing": 0.5, "read": 1.0}, max_queue=10, queue_timeout=1, retry_after_seconds=1)
+
+
+def test_default_shares_partition_the_pool():
+    settings = Settings(_env_file=None)
+    control = admission_control(settings)
+    assert sum(control.limit_for(group) for group in settings.admission_pool_shares) <= settings.db_pool_size + settings.db_max_overflow
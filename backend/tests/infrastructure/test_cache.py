@@ -0,0 +1,105 @@
+import threading
+
+from app.infrastructure.cache import RefreshingCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_lru_eviction_and_expiry():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats() == {"size": 1, "max_entries": 2, "hits": 2, "misses": 2, "evictions": 1, "expirations": 1, "invalidations": 0}
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache(max_entries=10, ttl_seconds=10)
+    cache.set("a", 1)
+    assert cache.invalidate(["a", "missing"]) == 1
+    assert cache.get("a") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_ttl_cache_invalidate_holds_keys_off():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=10, ttl_seconds=10, clock=clock)
+    cache.invalidate(["a"], hold_seconds=5)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    clock.now = 5
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+
+def test_ttl_cache_skips_values_loaded_before_an_invalidate():
+    cache = TTLCache(max_entries=10, ttl_seconds=10)
+    generation = cache.generation("a")
+    cache.invalidate(["a"])
+    cache.set("a", "before the write", generation)
+    assert cache.get("a") is None
+    cache.set("a", "after the write", cache.generation("a"))
+    assert cache.get("a") == "after the write"
+
+
+def test_refreshing_cache_serves_stale_value_while_refreshing():
+    clock = FakeClock()
+    cache = RefreshingCache(refresh_seconds=10, clock=clock)
+    release = threading.Event()
+    values = iter([1, 2])
+
+    def compute():
+        value = next(values)
+        if value == 2:
+            release.wait(5)
+        return value
+
+    assert cache.get("a", compute) == 1
+    clock.now = 10
+    assert cache.get("a", compute) == 1  # stale: starts the background refresh
+    assert cache.get("a", compute) == 1  # still the old value, and no second refresh is started
+    assert not cache.wait_for_refreshes(timeout=0.01)
+    release.set()
+    assert cache.wait_for_refreshes(timeout=5)
+    assert cache.get("a", compute) == 2
+    assert cache.stats()["refreshes"] == 2
+
+
+def test_refreshing_cache_refresh_and_expire():
+    cache = RefreshingCache(refresh_seconds=3600)
+    counter = iter(range(10))
+    assert cache.get("a", lambda: next(counter)) == 0
+    assert cache.refresh() == ["a"]
+    assert cache.get("a", lambda: next(counter)) == 1
+    assert cache.refresh(["missing"]) == []
+
+    failing = RefreshingCache(refresh_seconds=3600)
+    failing.get("b", lambda: 1)
+
+    def broken():
+        raise ValueError("boom")
+
+    failing.get("b", broken)  # remembered as the key's compute; the cached value is still fresh
+    failing.expire()
+    assert failing.get("b", broken) == 1
+    for _ in range(500):
+        if failing.stats()["refresh_errors"]:
+            break
+        threading.Event().wait(0.01)
+    assert failing.stats()["last_error"] == "ValueError: boom"
+    assert failing.get("b", broken) == 1
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.single_flight import SingleFlight
+
+
+def test_concurrent_threads_share_one_load():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return "stand"
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(flight.do, "a", load) for _ in range(8)]
+        while flight.stats()["coalesced"] < 7:
+            time.sleep(0.001)
+        release.set()
+        assert [future.result() for future in futures] == ["stand"] * 8
+    assert len(calls) == 1
+    assert flight.stats() == {"in_flight": 0, "loads": 1, "coalesced": 7, "errors": 0, "forgotten": 0}
+    # Nothing is kept once the load is done.
+    assert flight.do("a", lambda: "again") == "again"
+
+
+def test_waiters_share_the_leader_s_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def load():
+        release.wait(5)
+        raise LookupError("database down")
+
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(flight.do, "a", load) for _ in range(3)]
+        while flight.stats()["coalesced"] < 2:
+            time.sleep(0.001)
+        release.set()
+        for future in futures:
+            with pytest.raises(LookupError):
+                future.result()
+    assert flight.stats()["errors"] == 1
+
+
+def test_forget_starts_a_fresh_load_for_later_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def stale():
+        release.wait(5)
+        return "before write"
+
+    with ThreadPoolExecutor(1) as pool:
+        leader = pool.submit(flight.do, ("a", None), stale)
+        while flight.stats()["in_flight"] < 1:
+            time.sleep(0.001)
+        assert flight.forget(lambda key: key[0] == "a") == 1
+        assert flight.do(("a", None), lambda: "after write") == "after write"
+        release.set()
+        assert leader.result() == "before write"
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_concurrent_coroutines_share_one_load():
+    flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "stand"
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("a", load) for _ in range(5)), flight.do_async("b", load))
+
+    assert asyncio.run(main()) == ["stand"] * 6
+    assert len(calls) == 2
+    assert flight.stats()["coalesced"] == 4
+
+
+def test_waiters_load_again_when_the_leader_is_cancelled():
+    flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.05)
+        return "stand"
+
+    async def main():
+        leader = asyncio.create_task(flight.do_async("a", load))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do_async("a", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter
+
+    assert asyncio.run(main()) == "stand"
@@ -0,0 +1,87 @@
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from app.domain.stand_domain import StandAttributes as DomainStandAttributes
+from app.infrastructure.adapters import converters, stand_adapter
+from app.infrastructure.orm_models.stand_model import StandAttributes as ORMStandAttributes
+from app.schemas.stand_schema import StandAttributesSchema
+
+
+def orm_attributes(i: int = 0) -> ORMStandAttributes:
+    values = {name: f"v{i}" for name in stand_adapter.STAND_ATTRIBUTES_FIELDS}
+    values.update(
+        stand_part_oid=f"900100{i:04d}",
+        effective_date=datetime(2021, 1, 1),
+        last_thinned_date=None,
+        survival_checked=datetime(2022, 6, 1),
+        site_index=100 + i,
+        slope=Decimal("12.5"),
+        aspect=None,
+        elevation=Decimal("301.25"),
+    )
+    return ORMStandAttributes(**values)
+
+
+def test_compiled_adapters_match_field_by_field_conversion():
+    orm_attrs = [orm_attributes(i) for i in range(3)]
+    fields = stand_adapter.STAND_ATTRIBUTES_FIELDS
+
+    domain_attrs = stand_adapter.orm_to_domain_stand_attributes_many(orm_attrs)
+    assert domain_attrs == [DomainStandAttributes(**{name: getattr(attr, name) for name in fields}) for attr in orm_attrs]
+    assert stand_adapter.orm_to_domain_stand_attributes(orm_attrs[0]) == domain_attrs[0]
+
+    schemas = stand_adapter.domain_to_schema_stand_attributes_many(domain_attrs)
+    assert schemas == [StandAttributesSchema(**asdict(attr)) for attr in domain_attrs]
+    assert isinstance(schemas[0].slope, float)
+    assert stand_adapter.domain_to_schema_stand_attributes(domain_attrs[0]) == schemas[0]
+
+    round_tripped = stand_adapter.schema_to_domain_stand_attributes_many(schemas)
+    assert round_tripped == [DomainStandAttributes(**schema.model_dump()) for schema in schemas]
+    assert stand_adapter.schema_to_domain_stand_attributes(schemas[0]) == round_tripped[0]
+
+    orm_copies = stand_adapter.domain_to_orm_stand_attributes_many(domain_attrs)
+    assert [{name: getattr(attr, name) for name in fields} for attr in orm_copies] == [asdict(attr) for attr in domain_attrs]
+    assert isinstance(stand_adapter.domain_to_orm_stand_attributes(domain_attrs[0]), ORMStandAttributes)
+
+
+def test_field_mapping_rejects_drift():
+    @dataclass
+    class Domain:
+        stand_part_oid: str
+        species: Optional[str] = None
+
+    class Schema(BaseModel):
+        stand_part_oid: str
+
+    with pytest.raises(TypeError, match="missing"):
+        converters.field_mapping(Domain, ORMStandAttributes, Schema)
+
+
+def test_orm_to_domain_falls_back_to_attribute_access_for_unloaded_columns():
+    # Columns never set (or deferred/expired) are absent from the instance __dict__.
+    domain_attr = stand_adapter.orm_to_domain_stand_attributes(ORMStandAttributes(stand_part_oid="9001001001", species="DF"))
+    assert domain_attr == DomainStandAttributes(stand_part_oid="9001001001", species="DF")
+
+
+def test_compact_adapter_interns_codes_and_frozen_rows_convert_to_schema():
+    orm_attrs = [orm_attributes(0), orm_attributes(0)]
+    # Distinct but equal strings, as the driver returns for every fetched row.
+    for orm_attr in orm_attrs:
+        orm_attr.species = "".join(["D", "F"])
+    assert orm_attrs[0].species is not orm_attrs[1].species
+
+    compact = stand_adapter.orm_to_compact_stand_attributes_many(orm_attrs)
+    assert compact[0].species is compact[1].species
+    assert compact == stand_adapter.orm_to_domain_stand_attributes_many(orm_attrs)
+    assert not hasattr(compact[0], "__dict__")
+
+    frozen = stand_adapter.orm_to_compact_stand_attributes_many(orm_attrs, frozen=True)
+    with pytest.raises(AttributeError):
+        frozen[0].species = "WH"
+    assert len({frozen[0], frozen[1]}) == 1
+    assert stand_adapter.domain_to_schema_stand_attributes_many(frozen) == stand_adapter.domain_to_schema_stand_attributes_many(compact)
@@ -0,0 +1,126 @@
+import random
+from datetime import datetime
+
+from app.infrastructure.orm_models.stand_model import StandAttributes
+from app.infrastructure.stand_snapshot import StandAttributesSnapshot, StandSnapshotService
+from app.schemas.stand_schema import StandSnapshotQuery
+from tests.conftest import make_stand
+
+AS_OF = datetime(2024, 1, 1)
+
+
+def snapshot_row(stand_oid, part, site_index=None, slope=None, aspect=None, elevation=None, species=None, status=None):
+    return (stand_oid, f"{stand_oid}-{part}", site_index, slope, aspect, elevation, species, None, status, None, None)
+
+
+def sample_snapshot():
+    return StandAttributesSnapshot(
+        [
+            snapshot_row("A", 0, site_index=120, slope=10.0, aspect=180.0, species="DF", status="ACTIVE"),
+            snapshot_row("A", 1, site_index=90, slope=45.0, species="WH", status="ACTIVE"),
+            snapshot_row("B", 0, site_index=110, slope=None, aspect=90.0, species="DF", status="HARVESTED"),
+            snapshot_row("C", 0, site_index=None, slope=20.0, species=None),
+        ],
+        AS_OF,
+    )
+
+
+def test_snapshot_filters_return_stand_oids():
+    snapshot = sample_snapshot()
+    assert snapshot.filter(StandSnapshotQuery()) == ["A", "B", "C"]
+    assert snapshot.filter(StandSnapshotQuery(species=["DF"])) == ["A", "B"]
+    assert snapshot.filter(StandSnapshotQuery(species=["DF", "WH", "XX"], status=["ACTIVE"])) == ["A"]
+    assert snapshot.filter(StandSnapshotQuery(slope_min=15)) == ["A", "C"]  # NULL slopes never match a range
+    assert snapshot.filter(StandSnapshotQuery(slope_max=10, site_index_min=100)) == ["A"]
+    assert snapshot.filter(StandSnapshotQuery(aspect_min=90, aspect_max=90)) == ["B"]
+    # Predicates are matched on the same part: A has a WH part and a part with site_index 120, but not both.
+    assert snapshot.filter(StandSnapshotQuery(species=["WH"], site_index_min=100)) == []
+
+
+def test_snapshot_columns_are_packed_and_dictionary_encoded():
+    snapshot = sample_snapshot()
+    species = snapshot.coded["species"]
+    assert species.dictionary == ["DF", "WH", None]
+    assert species.codes.typecode == "B" and list(species.codes) == [0, 1, 0, 2]
+    assert snapshot.numeric["slope"].values.typecode == "d"
+    assert list(snapshot.numeric["slope"].order) == [0, 3, 1]
+
+
+def test_snapshot_ranges_match_a_row_by_row_scan():
+    # Enough rows, with ties and NULLs, that ranges start and end inside rank buckets as well as on their boundaries.
+    rng = random.Random(7)
+    rows = [snapshot_row(f"S{i:04d}", 0, slope=rng.choice([None, rng.randint(0, 50)]), species=rng.choice(["DF", "WH"])) for i in range(2000)]
+    snapshot = StandAttributesSnapshot(rows, AS_OF)
+    for _ in range(200):
+        low, high = rng.choice([None, rng.randint(-5, 55)]), rng.choice([None, rng.randint(-5, 55)])
+
+        def in_range(slope):
+            if low is None and high is None:
+                return True
+            return slope is not None and (low is None or slope >= low) and (high is None or slope <= high)
+
+        expected = [row[0] for row in rows if row[6] == "DF" and in_range(row[3])]
+        assert snapshot.filter(StandSnapshotQuery(species=["DF"], slope_min=low, slope_max=high)) == expected
+
+
+def test_snapshot_replace_swaps_the_rows_of_changed_stands():
+    snapshot = sample_snapshot()
+    replaced = snapshot.replace({"A"}, [snapshot_row("A", 2, site_index=70, species="RC")], datetime(2024, 2, 1))
+    assert len(replaced) == 3
+    assert replaced.filter(StandSnapshotQuery(species=["RC"])) == ["A"]
+    assert replaced.filter(StandSnapshotQuery(species=["WH"])) == []
+    assert snapshot.filter(StandSnapshotQuery(species=["WH"])) == ["A"]  # snapshots are immutable
+
+
+def columns_of(snapshot):
+    numeric = {name: (list(column.decode()), list(column.order), column.buckets) for name, column in snapshot.numeric.items()}
+    return numeric, {name: list(column.decode()) for name, column in snapshot.coded.items()}
+
+
+def test_snapshot_replace_patches_changed_values_like_a_rebuild():
+    rng = random.Random(11)
+    rows = [snapshot_row(f"S{i:04d}", 0, slope=rng.choice([None, rng.randint(0, 50)]), species=rng.choice(["DF", "WH"])) for i in range(3000)]
+    snapshot = StandAttributesSnapshot(rows, AS_OF)
+    for _ in range(50):
+        changed = {rows[rng.randrange(len(rows))][0] for _ in range(rng.randint(1, 4))}
+        # NULL slopes stay NULL, so each patch moves rows within the permutation without resizing it.
+        slopes = {row[0]: row[3] for row in rows if row[0] in changed}
+        new_rows = [
+            snapshot_row(stand_oid, 0, slope=None if slopes[stand_oid] is None else rng.randint(0, 50), species=rng.choice(["DF", "WH", "RC"]))
+            for stand_oid in changed
+        ]
+        patched = snapshot.replace(changed, new_rows, AS_OF)
+        rows = [row for row in rows if row[0] not in changed] + new_rows
+        rebuilt = StandAttributesSnapshot(rows, AS_OF)
+        assert columns_of(patched) == columns_of(rebuilt)
+        assert patched.filter(StandSnapshotQuery(slope_min=10, slope_max=30)) == rebuilt.filter(StandSnapshotQuery(slope_min=10, slope_max=30))
+        # Columns without a changed value are shared with the previous snapshot.
+        assert patched.numeric["aspect"] is snapshot.numeric["aspect"]
+        snapshot = patched
+
+
+def test_service_refreshes_marked_stands_incrementally(session_factory, seed_stands):
+    seed_stands(make_stand("000000000001"), make_stand("000000000002"))
+    service = StandSnapshotService(refresh_seconds=3600, full_reload_seconds=3600)
+    assert service.snapshot(session_factory).filter(StandSnapshotQuery(species=["DF"])) == ["000000000001", "000000000002"]
+
+    with session_factory() as session:
+        session.get(StandAttributes, "0000010000").species = "WH"
+        session.get(StandAttributes, "0000020000").species = "WH"
+        session.commit()
+    service.mark_changed(["000000000001"])
+    snapshot = service.refresh()
+    # Only the marked stand was reloaded; the other change waits for the next full reload.
+    assert snapshot.filter(StandSnapshotQuery(species=["WH"])) == ["000000000001"]
+    assert service.refresh(full=True).filter(StandSnapshotQuery(species=["WH"])) == ["000000000001", "000000000002"]
+    stats = service.stats()
+    assert (stats["full_loads"], stats["incremental_refreshes"], stats["pending_changes"]) == (2, 1, 0)
+
+
+def test_service_refreshes_stale_snapshots_in_the_background(session_factory, seed_stands):
+    seed_stands(make_stand("000000000001"))
+    service = StandSnapshotService(refresh_seconds=0, full_reload_seconds=3600)
+    first = service.snapshot(session_factory)
+    assert service.snapshot(session_factory) is first  # stale: served while a background refresh starts
+    assert service.wait_for_refreshes(timeout=5)
+    assert service.stats()["incremental_refreshes"] == 1
@@ -0,0 +1,182 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect
+
+from app.infrastructure.query_counter import assert_query_count
+from app.infrastructure.repositories.stand_repository import (
+    get_part_tree,
+    get_stand,
+    get_stand_schema,
+    get_stands,
+    iter_stands,
+    search_stands,
+    stand_search_statement,
+)
+from app.schemas.stand_schema import StandSearchRequest
+from tests.conftest import make_dated_stand, make_part_tree_stand, make_stand
+
+
+@pytest.mark.parametrize("loader_strategy, expected_queries", [("selectin", 3), ("joined", 1)])
+@pytest.mark.parametrize("parts", [1, 25])
+def test_get_stand_query_count_is_independent_of_part_count(engine, db_session, seed_stands, loader_strategy, expected_queries, parts):
+    seed_stands(make_stand("9001001001", parts=parts))
+
+    with assert_query_count(engine, expected_queries):
+        stand = get_stand(db_session, "9001001001", loader_strategy)
+        assert len(stand.stand_parts) == parts
+        assert all(len(part.stand_attributes) == 1 for part in stand.stand_parts)
+
+
+def test_get_stand_missing_returns_none(db_session):
+    assert get_stand(db_session, "0000000000") is None
+
+
+def test_get_stand_rejects_unknown_loader_strategy(db_session):
+    with pytest.raises(ValueError):
+        get_stand(db_session, "9001001001", "lazy")
+
+
+def test_get_stands_chunks_in_list_and_reports_missing(engine, db_session, seed_stands, monkeypatch):
+    monkeypatch.setattr("app.infrastructure.repositories.stand_repository.IN_CLAUSE_CHUNK_SIZE", 2)
+    seed_stands(*(make_stand(f"900100100{i}", parts=3) for i in range(4)))
+    requested = ["9001001003", "9001001000", "0000000000", "9001001001", "9001001000", "9001001002"]
+
+    # 3 chunks of 2 OIDs, each loaded with the selectin strategy (stand, parts, attributes).
+    with assert_query_count(engine, 9):
+        stands, missing = get_stands(db_session, requested)
+
+    assert [stand.stand_oid for stand in stands] == ["9001001003", "9001001000", "9001001001", "9001001002"]
+    assert all(len(stand.stand_parts) == 3 for stand in stands)
+    assert missing == ["0000000000"]
+
+
+def test_iter_stands_groups_joined_rows_into_aggregates(engine, db_session, seed_stands):
+    seed_stands(make_stand("9001001002", parts=3), make_stand("9001001001", parts=0), make_stand("9001001003", parts=2))
+
+    # One streamed statement; the adapters must not lazy-load any collection.
+    with assert_query_count(engine, 1):
+        stands = list(iter_stands(db_session, yield_per=2))
+
+    assert [(stand.stand_oid, len(stand.stand_parts)) for stand in stands] == [("9001001001", 0), ("9001001002", 3), ("9001001003", 2)]
+    assert all(len(part.stand_attributes) == 1 for stand in stands for part in stand.stand_parts)
+
+
+@pytest.mark.parametrize("loader_strategy", ["selectin", "joined", "fast"])
+def test_as_of_filters_part_and_attribute_versions(engine, db_session, seed_stands, loader_strategy):
+    seed_stands(make_dated_stand("9001001001"))
+
+    def parts_at(as_of):
+        if loader_strategy == "fast":
+            stand = get_stand_schema(db_session, "9001001001", as_of)
+        else:
+            stand = get_stand(db_session, "9001001001", loader_strategy, as_of)
+        return [(part.stand_part_oid[-1], len(part.stand_attributes)) for part in stand.stand_parts]
+
+    assert parts_at(None) == [("0", 1), ("1", 1), ("2", 1)]
+    assert parts_at(datetime(2020, 6, 1)) == [("0", 1)]
+    assert parts_at(datetime(2021, 6, 1)) == [("1", 0)]
+    assert parts_at(datetime(2024, 1, 1)) == [("1", 1), ("2", 1)]
+    # The stand itself is returned even when no part is in effect.
+    assert parts_at(datetime(2019, 1, 1)) == []
+
+
+def test_as_of_indexes_are_declared(engine):
+    indexes = {index["name"]: index["column_names"] for table in ("STAND_PART", "STAND_ATTRIBUTES") for index in inspect(engine).get_indexes(table)}
+    assert indexes["IX_STAND_PART_STAND_OID_EFFECTIVE_DATE"] == ["STAND_OID", "EFFECTIVE_DATE", "EXPIRY_DATE"]
+    # A part has one attributes row, so its as-of filter is answered by the primary key seek.
+    assert "IX_STAND_ATTRIBUTES_STAND_PART_OID_EFFECTIVE_DATE" not in indexes
+    assert inspect(engine).get_pk_constraint("STAND_ATTRIBUTES")["constrained_columns"] == ["STAND_PART_OID"]
+
+
+@pytest.mark.parametrize(
+    "part, direction, max_depth, expected",
+    [
+        ("0", "descendants", 100, [("0", 0), ("1", 1), ("2", 1), ("3", 2), ("4", 3)]),
+        ("0", "descendants", 1, [("0", 0), ("1", 1), ("2", 1)]),
+        ("4", "ancestors", 100, [("4", 0), ("3", 1), ("1", 2), ("0", 3)]),
+        ("4", "ancestors", 2, [("4", 0), ("3", 1), ("1", 2)]),
+        ("2", "descendants", 100, [("2", 0)]),
+    ],
+)
+def test_get_part_tree_is_one_cte_plus_attributes(engine, db_session, seed_stands, part, direction, max_depth, expected):
+    seed_stands(make_part_tree_stand("9001001001"))
+    with assert_query_count(engine, 2):
+        parts = get_part_tree(db_session, f"001001000{part}", direction, max_depth)
+    assert [(domain_part.stand_part_oid[-1], depth) for domain_part, depth in parts] == expected
+    assert all(len(domain_part.stand_attributes) == 1 for domain_part, _ in parts)
+
+
+def test_get_part_tree_stops_on_cycles(db_session, seed_stands):
+    stand = make_part_tree_stand("9001001001")
+    stand.stand_part_children[0].stand_pnt_part_oid = stand.stand_part_children[4].stand_part_oid
+    seed_stands(stand)
+    assert len(get_part_tree(db_session, "0010010000", "descendants", 10)) == 14
+    assert get_part_tree(db_session, "0000000000", "descendants") == []
+
+
+def seed_search_stands(seed_stands) -> None:
+    # Stand i: species DF for even i, WH for odd; site_index 100 + 10 * i; stand 3 is RETIRED.
+    stands = [make_stand(f"900100100{i}") for i in range(6)]
+    for i, stand in enumerate(stands):
+        attributes = stand.stand_part_children[0].stand_attribute_children[0]
+        attributes.species = "DF" if i % 2 == 0 else "WH"
+        attributes.site_index = 100 + 10 * i
+        attributes.status = "RETIRED" if i == 3 else "ACTIVE"
+    seed_stands(*stands)
+
+
+@pytest.mark.parametrize(
+    "criteria, expected",
+    [
+        ({}, [0, 1, 2, 3, 4, 5]),
+        ({"species": ["DF"]}, [0, 2, 4]),
+        ({"species": ["DF", "WH"], "status": ["ACTIVE"]}, [0, 1, 2, 4, 5]),
+        ({"species": ["WH"], "site_index_min": 110, "site_index_max": 130}, [1, 3]),
+        ({"status": ["ACTIVE"], "site_index_max": 115, "ownership": ["STATE"]}, []),
+    ],
+)
+def test_search_stands_filters_in_sql(db_session, seed_stands, criteria, expected):
+    seed_search_stands(seed_stands)
+    stands, has_more = search_stands(db_session, StandSearchRequest(**criteria), include_parts=False)
+    assert [int(stand.stand_oid[-1]) for stand in stands] == expected
+    assert not has_more
+
+
+def test_search_stands_keyset_pages(db_session, seed_stands):
+    seed_search_stands(seed_stands)
+    criteria = StandSearchRequest(status=["ACTIVE"])
+    first, has_more = search_stands(db_session, criteria, limit=3)
+    assert [stand.stand_oid for stand in first] == ["9001001000", "9001001001", "9001001002"] and has_more
+    second, has_more = search_stands(db_session, criteria, after=first[-1].stand_oid, limit=3)
+    assert [stand.stand_oid for stand in second] == ["9001001004", "9001001005"] and not has_more
+    assert len(second[0].stand_parts) == 1
+
+
+def test_search_stands_matches_the_parts_in_effect(db_session, seed_stands):
+    # Only the expired part version is western hemlock; the current one is Douglas-fir.
+    stand = make_dated_stand("9001001001")
+    stand.stand_part_children[0].stand_attribute_children[0].species = "WH"
+    seed_stands(stand)
+    hemlock = StandSearchRequest(species=["WH"])
+    assert search_stands(db_session, hemlock) == ([], False)
+    assert [stand.stand_oid for stand in search_stands(db_session, StandSearchRequest(species=["DF"]))[0]] == ["9001001001"]
+    stands, _ = search_stands(db_session, hemlock, as_of=datetime(2020, 6, 1))
+    assert [part.stand_part_oid[-1] for part in stands[0].stand_parts] == ["0"]
+
+
+@pytest.mark.parametrize(
+    "criteria, index",
+    [
+        ({"species": ["DF"], "status": ["ACTIVE"], "site_index_min": 110}, "IX_STAND_ATTRIBUTES_SPECIES_STATUS_SITE_INDEX"),
+        ({"ownership": ["STATE"]}, "IX_STAND_ATTRIBUTES_OWNERSHIP"),
+        ({"elevation_min": 300, "elevation_max": 400}, "IX_STAND_ATTRIBUTES_ELEVATION"),
+    ],
+)
+def test_search_is_index_backed(engine, criteria, index):
+    statement = stand_search_statement(StandSearchRequest(**criteria), datetime.now())
+    with engine.connect() as connection:
+        sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+        plan = [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+    assert any(index in step for step in plan), plan
+    assert not any(step.startswith("SCAN STAND_ATTRIBUTES") for step in plan), plan
@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.endpoints import stand_endpoint
+from app.core.config import Settings
+from app.infrastructure.database import Database
+from app.main import create_app
+from tests.conftest import make_stand
+
+
+def admission_client(engine, **settings):
+    # One connection in the pool: stand reads are admitted one at a time.
+    settings = Settings(_env_file=None, db_url="sqlite://", db_pool_size=1, db_max_overflow=0, admission_retry_after_seconds=3, **settings)
+    return TestClient(create_app(Database(settings, engine=engine)))
+
+
+@pytest.fixture
+def slow_reads(seed_stands, monkeypatch):
+    seed_stands(*(make_stand(f"00000000000{i}") for i in range(4)))
+    load_stand_schema = stand_endpoint.load_stand_schema
+
+    def slow_load_stand_schema(*args):
+        time.sleep(0.3)
+        return load_stand_schema(*args)
+
+    monkeypatch.setattr(stand_endpoint, "load_stand_schema", slow_load_stand_schema)
+
+
+def concurrent_reads(client, count):
+    with ThreadPoolExecutor(count) as pool:
+        return list(pool.map(client.get, [f"/stands/00000000000{i}/" for i in range(count)]))
+
+
+def test_requests_beyond_the_queue_are_shed(engine, slow_reads):
+    with admission_client(engine, admission_max_queue=1) as client:
+        responses = concurrent_reads(client, 4)
+        assert sorted(response.status_code for response in responses) == [200, 200, 503, 503]
+        rejected = next(response for response in responses if response.status_code == 503)
+        assert rejected.headers["retry-after"] == "3"
+        stats = client.get("/health/admission").json()["stand_read"]
+        assert (stats["limit"], stats["active"], stats["queue_depth"]) == (1, 0, 0)
+        assert (stats["admitted"], stats["rejected_queue_full"], stats["max_queue_depth"]) == (2, 2, 1)
+        # Slots are released once the handlers return.
+        assert client.get("/stands/000000000000/").status_code == 200
+
+
+def test_queued_requests_time_out(engine, slow_reads):
+    with admission_client(engine, admission_queue_timeout_seconds=0.05) as client:
+        responses = concurrent_reads(client, 2)
+        assert sorted(response.status_code for response in responses) == [200, 503]
+        assert client.get("/health/admission").json()["stand_read"]["rejected_timeout"] == 1
+
+
+def test_admission_control_can_be_disabled(engine, slow_reads):
+    with admission_client(engine, admission_enabled=False, admission_max_queue=0) as client:
+        assert [response.status_code for response in concurrent_reads(client, 3)] == [200] * 3
+        assert client.get("/health/admission").json() == {}
+
+
+def test_cached_stands_are_served_while_the_group_is_full(engine, slow_reads):
+    with admission_client(engine, admission_max_queue=0) as client:
+        assert client.get("/stands/000000000000/").status_code == 200
+        with ThreadPoolExecutor(1) as pool:
+            miss = pool.submit(client.get, "/stands/000000000001/")
+            deadline = time.monotonic() + 5
+            while client.get("/health/admission").json()["stand_read"]["active"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # The only slot is taken by the load: another miss is shed, the cached stand is still served.
+            assert client.get("/stands/000000000002/").status_code == 503
+            assert client.get("/stands/000000000000/").status_code == 200
+            assert miss.result().status_code == 200
+        assert client.get("/health/admission").json()["stand_read"]["admitted"] == 2
+
+
+def test_streamed_bodies_hold_their_slot_until_sent(engine, seed_stands, monkeypatch):
+    # The export holds a pooled connection while it streams, so its slot must be held as long.
+    seed_stands(make_stand("000000000001"))
+    ndjson_lines = stand_endpoint.ndjson_lines
+    active = []
+
+    def recording_ndjson_lines(stands):
+        for line in ndjson_lines(stands):
+            active.append(client.get("/health/admission").json()["stand_export"]["active"])
+            yield line
+
+    monkeypatch.setattr(stand_endpoint, "ndjson_lines", recording_ndjson_lines)
+    with admission_client(engine) as client:
+        assert client.get("/stands/export").status_code == 200
+        assert active == [1]
+        assert client.get("/health/admission").json()["stand_export"]["active"] == 0
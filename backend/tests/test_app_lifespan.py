@@ -0,0 +1,109 @@
+import logging
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import Settings
+from app.infrastructure.database import Base, Database
+from app.infrastructure.pool_metrics import get_pool_metrics
+from app.main import create_app
+from tests.conftest import make_stand
+
+
+def sqlite_settings(url: str, **values) -> Settings:
+    return Settings(_env_file=None, db_url=url, **values)
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = Database(sqlite_settings(f"sqlite:///{tmp_path / 'stands.db'}", db_pool_warmup_connections=3))
+    Base.metadata.create_all(database.engine)
+    return database
+
+
+def test_settings_only_require_mssql_fields_for_an_mssql_engine():
+    with pytest.raises(ValueError, match="DB_USERNAME"):
+        Settings(_env_file=None).database_url()
+    assert sqlite_settings("sqlite://").database_url() == "sqlite://"
+    mssql = Settings(_env_file=None, db_username="u", db_password="p", db_host="h", db_name="n", db_odbc_driver="d")
+    assert mssql.async_database_url() == "mssql+aioodbc://u:p@h/n?driver=d"
+
+
+def test_engines_are_created_on_first_use():
+    database = Database(sqlite_settings("sqlite://"))
+    create_app(database)
+    assert database._engine is None
+    assert database.async_engine is None
+    assert database.session_factory.kw["bind"] is database.engine
+
+
+def test_lifespan_warms_up_the_pool_and_disposes_it(database):
+    with TestClient(create_app(database)) as client:
+        assert database.engine.pool.checkedin() == 3
+        assert get_pool_metrics(database.engine).connects == 3
+        assert client.get("/health/db").json()["pool"]["connects"] == 3
+    assert database.engine.pool.checkedin() == 0
+
+
+def test_lifespan_primes_the_read_statements(database):
+    with database.session_factory() as session:
+        session.add_all([make_stand("000000000001", parts=2), make_stand("000000000002", parts=2)])
+        session.commit()
+    cache_hits = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        cache_hits.append(context.cache_hit == context.dialect.CACHE_HIT)
+
+    with TestClient(create_app(database)) as client:
+        event.listen(database.engine, "before_cursor_execute", record)
+        try:
+            assert client.get("/stands/000000000002/").status_code == 200
+        finally:
+            event.remove(database.engine, "before_cursor_execute", record)
+    # Parent stand, parts and attributes: all compiled at startup.
+    assert cache_hits == [True, True, True]
+
+
+def test_unreachable_database_does_not_block_startup(tmp_path, caplog):
+    database = Database(sqlite_settings(f"sqlite:///{tmp_path / 'missing' / 'stands.db'}"))
+    with caplog.at_level(logging.WARNING, logger="app.main"), TestClient(create_app(database)) as client:
+        assert client.get("/").status_code == 200
+    assert "database warmup failed" in caplog.text
+
+
+def test_summaries_are_precomputed_and_refreshed_on_a_schedule(tmp_path):
+    settings = sqlite_settings(f"sqlite:///{tmp_path / 'stands.db'}", stand_summary_precompute=[["species"]], stand_summary_refresh_seconds=0.05)
+    database = Database(settings)
+    Base.metadata.create_all(database.engine)
+    app = create_app(database)
+    stand_summary_cache = app.state.stand_summary_cache
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 5
+        while stand_summary_cache.stats()["refreshes"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        misses = stand_summary_cache.stats()["misses"]
+        assert client.get("/stands/summary").json()["rows"] == []
+        assert stand_summary_cache.stats()["misses"] == misses
+    assert stand_summary_cache.stats()["refreshes"] >= 3
+
+
+def test_shutdown_waits_for_background_refreshes(database, monkeypatch):
+    events = []
+
+    def slow_compute():
+        time.sleep(0.2)
+        events.append("refreshed")
+
+    async def dispose():
+        events.append("disposed")
+
+    monkeypatch.setattr(database, "dispose", dispose)
+    app = create_app(database)
+    stand_summary_cache = app.state.stand_summary_cache
+    with TestClient(app):
+        stand_summary_cache.get(("slow",), lambda: None)
+        stand_summary_cache.expire()
+        stand_summary_cache.get(("slow",), slow_compute)
+    assert events == ["refreshed", "disposed"]
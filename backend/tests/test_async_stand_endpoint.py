@@ -0,0 +1,107 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.endpoints import async_stand_endpoint
+from app.core.config import get_settings
+from app.infrastructure.database import Base, Database
+from app.infrastructure.query_counter import assert_query_count
+from app.infrastructure.repositories import async_stand_repository
+from app.main import create_app
+from tests.conftest import make_part_tree_stand, make_stand
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # A file database shared by the sync seeding engine and the aiosqlite engine under test.
+    engine = create_engine(f"sqlite:///{tmp_path / 'stands.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(engine, tmp_path):
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stands.db'}")
+    yield async_sessionmaker(autoflush=False, expire_on_commit=False, bind=async_engine)
+    async_engine.sync_engine.dispose()
+
+
+@pytest.fixture
+def async_client(engine, tmp_path):
+    # An app serving the async routes, over the same file database; its lifespan disposes of both engines.
+    settings = get_settings().model_copy(update={"db_async": True})
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stands.db'}")
+    with TestClient(create_app(Database(settings, engine=engine, async_engine=async_engine))) as client:
+        yield client
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_async_get_stand_query_count(async_session_factory, seed_stands, anyio_backend):
+    seed_stands(make_stand("9001001001", parts=10))
+    async with async_session_factory() as db:
+        with assert_query_count(db.bind.sync_engine, 3):
+            stand = await async_stand_repository.get_stand(db, "9001001001")
+    assert len(stand.stand_parts) == 10
+
+
+def test_async_read_stand(async_client, seed_stands):
+    seed_stands(make_stand("9001001001", parts=2))
+    response = async_client.get("/stands/9001001001/")
+    assert response.status_code == 200
+    assert len(response.json()["stand_parts"]) == 2
+    assert async_client.get("/stands/9001001099/").status_code == 404
+
+
+def test_async_list_batch_and_export(async_client, seed_stands):
+    seed_stands(*(make_stand(f"900100100{i}", parts=1) for i in range(3)))
+
+    page = async_client.get("/stands/", params={"limit": 2}).json()
+    assert [stand["stand_oid"] for stand in page["stands"]] == ["9001001000", "9001001001"]
+    page = async_client.get("/stands/", params={"limit": 2, "cursor": page["next"]}).json()
+    assert [stand["stand_oid"] for stand in page["stands"]] == ["9001001002"]
+
+    batch = async_client.post("/stands/batch", json={"stand_oids": ["9001001002", "9001001099"]}).json()
+    assert [stand["stand_oid"] for stand in batch["stands"]] == ["9001001002"]
+    assert batch["missing"] == ["9001001099"]
+
+    exported = [json.loads(line) for line in async_client.get("/stands/export").text.splitlines()]
+    assert [stand["stand_oid"] for stand in exported] == ["9001001000", "9001001001", "9001001002"]
+
+
+def test_async_part_tree(async_client, seed_stands):
+    seed_stands(make_part_tree_stand("9001001001"))
+    tree = async_client.get("/stand-parts/0010010004/ancestors", params={"max_depth": 1}).json()
+    assert (tree["stand_part_oid"], tree["depth"], tree["children"][0]["stand_part_oid"]) == ("0010010003", 1, "0010010004")
+
+
+def test_async_search(async_client, seed_stands):
+    stands = [make_stand(f"900100100{i}") for i in range(3)]
+    stands[0].stand_part_children[0].stand_attribute_children[0].species = "WH"
+    seed_stands(*stands)
+    data = async_client.get("/stands/search", params={"species": "DF", "limit": 1}).json()
+    assert [stand["stand_oid"] for stand in data["stands"]] == ["9001001001"]
+    assert data["next"] is not None
+
+
+def test_async_concurrent_reads_share_one_load(async_client, seed_stands, monkeypatch):
+    seed_stands(make_stand("9001001001", parts=2))
+    calls = []
+    load_stand_schema = async_stand_endpoint.load_stand_schema
+
+    async def slow_load_stand_schema(*args):
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return await load_stand_schema(*args)
+
+    monkeypatch.setattr(async_stand_endpoint, "load_stand_schema", slow_load_stand_schema)
+    with ThreadPoolExecutor(5) as pool:
+        responses = list(pool.map(async_client.get, ["/stands/9001001001/"] * 5))
+    assert [response.status_code for response in responses] == [200] * 5
+    assert len(calls) == 1
@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.infrastructure.database import Database
+from app.infrastructure.pool_metrics import PoolMetrics
+from app.main import create_app
+
+
+def test_db_health_reports_pool_metrics(client):
+    first = client.get("/health/db").json()["pool"]
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ok"
+    pool = data["pool"]
+    # The previous request's connection has been returned; the current one is still checked out.
+    assert pool["checkouts"] == first["checkouts"] + 1
+    assert pool["checkins"] == first["checkins"] + 1
+    assert pool["in_use"] == 1
+    assert pool["connects"] == 1
+    assert data["async_pool"] is None
+
+
+def test_pool_metrics_checkout_wait():
+    metrics = PoolMetrics()
+    metrics.record_checkout_wait(0.002)
+    metrics.record_checkout_wait(0.004, failed=True)
+    stats = metrics.as_dict()
+    assert stats["checkout_wait_avg_ms"] == 3.0
+    assert stats["checkout_wait_max_ms"] == 4.0
+    assert stats["checkout_errors"] == 1
+
+
+def test_db_health_is_503_when_the_database_is_unreachable(tmp_path):
+    settings = Settings(_env_file=None, db_url=f"sqlite:///{tmp_path / 'missing' / 'stands.db'}")
+    with TestClient(create_app(Database(settings))) as client:
+        response = client.get("/health/db")
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Database unavailable"}
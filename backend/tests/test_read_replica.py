@@ -0,0 +1,104 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings
+from app.infrastructure.database import Base, Database
+from app.main import create_app
+from tests.conftest import make_stand, stand_document
+
+
+@pytest.fixture
+def database(tmp_path):
+    # Two SQLite files stand in for the primary and its readable secondary; they are not replicated, so which one
+    # answered shows where a request was routed.
+    settings = Settings(
+        _env_file=None,
+        db_url=f"sqlite:///{tmp_path / 'primary.db'}",
+        db_read_url=f"sqlite:///{tmp_path / 'replica.db'}",
+        stand_snapshot_enabled=True,
+    )
+    database = Database(settings)
+    for engine in (database.engine, database.read_engine):
+        Base.metadata.create_all(engine)
+    with Session(database.engine) as session:
+        session.add(make_stand("000000000001"))
+        session.commit()
+    with Session(database.read_engine) as session:
+        session.add(make_stand("000000000002"))
+        session.commit()
+    return database
+
+
+@pytest.fixture
+def replica_client(database):
+    with TestClient(create_app(database)) as client:
+        yield client
+
+
+def test_reads_go_to_the_replica(replica_client):
+    response = replica_client.get("/stands/000000000002/")
+    assert response.status_code == 200
+    assert 'db;desc="replica"' in response.headers["server-timing"]
+    assert replica_client.get("/stands/000000000001/").status_code == 404
+    batch = replica_client.post("/stands/batch", json={"stand_oids": ["000000000001", "000000000002"]}).json()
+    assert batch["missing"] == ["000000000001"]
+
+
+def test_read_primary_header(replica_client):
+    response = replica_client.get("/stands/000000000001/", headers={"X-Read-Primary": "1"})
+    assert response.status_code == 200
+    assert 'db;desc="read_your_writes"' in response.headers["server-timing"]
+
+
+def test_reads_pinned_to_the_primary_bypass_the_cache(replica_client):
+    # Cached from the replica; the primary has no such stand.
+    assert replica_client.get("/stands/000000000002/").status_code == 200
+    stand_cache = replica_client.app.state.stand_cache
+    hits = stand_cache.stats()["hits"]
+    assert replica_client.get("/stands/000000000002/", headers={"X-Read-Primary": "1"}).status_code == 404
+    assert replica_client.get("/stands/000000000002/").status_code == 200
+    assert stand_cache.stats()["hits"] == hits + 1
+
+
+def test_writes_go_to_the_primary_and_pin_the_client_s_reads_to_it(replica_client, database):
+    response = replica_client.post("/stands/ingest", json=[stand_document("000000000003")])
+    assert response.json()["written"] == 1
+    assert "read_primary" in response.cookies
+    # The client now carries the cookie: its reads see its own write.
+    assert replica_client.get("/stands/000000000003/").status_code == 200
+    replica_client.cookies.clear()
+    assert replica_client.get("/stands/000000000003/").status_code == 404
+
+    health = replica_client.get("/health/db").json()
+    assert health["routes"] == {"primary": 1, "read_your_writes": 1, "replica": 2}
+    assert health["read_pool"]["checkouts"] > 0
+
+
+def test_reads_fall_back_to_the_primary_without_a_replica(client, seed_stands):
+    seed_stands(make_stand("000000000001"))
+    response = client.get("/stands/000000000001/")
+    assert response.status_code == 200
+    assert 'db;desc="primary"' in response.headers["server-timing"]
+    assert "read_primary" not in client.post("/stands/ingest", json=[stand_document("000000000004")]).cookies
+    assert client.get("/health/db").json()["read_pool"] is None
+
+
+def test_replica_reads_do_not_refill_the_cache_right_after_a_write(replica_client):
+    assert replica_client.get("/stands/000000000002/").status_code == 200
+    assert replica_client.post("/stands/ingest", json=[stand_document("000000000002", parts=2)]).json()["written"] == 1
+    replica_client.cookies.clear()
+    # The replica still has the stand as it was before the write: served, but not cached.
+    assert len(replica_client.get("/stands/000000000002/").json()["stand_parts"]) == 1
+    assert replica_client.app.state.stand_cache.get("000000000002") is None
+
+
+def test_summaries_and_the_snapshot_are_computed_on_the_primary(replica_client):
+    # Refreshed after writes, so they must not read a replica that may lag behind them.
+    assert replica_client.get("/stands/summary").json()["rows"][0]["stands"] == 1
+    assert replica_client.get("/stands/snapshot").json()["stand_oids"] == ["000000000001"]
+    assert replica_client.post("/stands/ingest", json=[stand_document("000000000003")]).json()["written"] == 1
+    assert replica_client.post("/stands/snapshot/refresh").json()["pending_changes"] == 0
+    assert replica_client.get("/stands/snapshot").json()["stand_oids"] == ["000000000001", "000000000003"]
+    assert replica_client.post("/stands/summary/refresh").status_code == 200
+    assert replica_client.get("/stands/summary").json()["rows"][0]["stands"] == 2
@@ -0,0 +1,70 @@
+import logging
+import time
+
+from app.infrastructure.timing import phase, start_timing, timed
+from tests.conftest import make_stand
+
+
+def server_timing(response) -> dict:
+    entries = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, *params = entry.split(";")
+        entries[name] = dict(param.split("=", 1) for param in params)
+    return entries
+
+
+def test_phases_are_exclusive():
+    timing = start_timing()
+    with phase("outer"):
+        time.sleep(0.02)
+        with phase("inner"):
+            time.sleep(0.02)
+    assert set(timing.phases) == {"outer", "inner"}
+    assert 15 < timing.phases["inner"] < 35
+    assert 15 < timing.phases["outer"] < 35
+    assert sum(timing.phases.values()) <= timing.elapsed_ms()
+
+
+def test_timed_is_a_no_op_outside_a_request():
+    @timed("query")
+    def query():
+        return 1
+
+    assert query() == 1
+
+
+def test_read_stand_server_timing(client, seed_stands, caplog):
+    seed_stands(make_stand("000000000001", parts=3))
+    with caplog.at_level(logging.INFO, logger="app.request_timing"):
+        response = client.get("/stands/000000000001/")
+    assert response.status_code == 200
+    entries = server_timing(response)
+    assert {"query", "adapter", "serialize", "other", "sql", "total"} <= set(entries)
+    assert entries["sql"]["desc"].startswith('"') and "statements" in entries["sql"]["desc"]
+
+    records = [record.request_timing for record in caplog.records if hasattr(record, "request_timing")]
+    assert len(records) == 1
+    record = records[0]
+    assert (record["method"], record["route"], record["status"]) == ("GET", "/stands/{stand_oid}/", 200)
+    assert record["sql_statements"] > 0
+    assert record["lazy_loads"] == 0
+    assert sum(record["phases_ms"].values()) <= record["total_ms"]
+
+
+def test_get_db_checkout_is_timed(client, seed_stands):
+    seed_stands(make_stand("000000000001"))
+    response = client.post("/stands/batch", json={"stand_oids": ["000000000001"]})
+    assert response.status_code == 200
+    assert "db_checkout" in server_timing(response)
+
+
+def test_sampled_requests_are_profiled(make_client, seed_stands, caplog):
+    client = make_client(request_profile_rate=1.0, request_profile_interval_ms=0.1)
+    seed_stands(make_stand("000000000001", parts=20))
+    with caplog.at_level(logging.INFO, logger="app.request_timing"):
+        for _ in range(20):
+            assert client.get("/stands/000000000001/").status_code == 200
+    profiles = [record.request_profile for record in caplog.records if hasattr(record, "request_profile")]
+    assert profiles
+    assert profiles[0]["reason"] == "sampled"
+    assert all(count > 0 for count in profiles[0]["samples"].values())
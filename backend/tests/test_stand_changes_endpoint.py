@@ -0,0 +1,77 @@
+import json
+from datetime import datetime
+
+from app.infrastructure.query_counter import count_queries
+from app.infrastructure.repositories.stand_repository import stand_changes_statement
+from tests.conftest import make_dated_stand, make_stand
+
+
+def changes(client, **params):
+    response = client.get("/stands/changes", params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def feed_stands():
+    # 01: one part since 2020. 02: its attributes superseded in 2022. 03: make_dated_stand, last change 2023-01-01.
+    # 04: its only part expired in 2021. 05: a part that only takes effect in 2999.
+    later = make_stand("000000000002")
+    later.stand_part_children[0].stand_attribute_children[0].effective_date = datetime(2022, 6, 1)
+    expired = make_stand("000000000004")
+    expired.stand_part_children[0].expiry_date = datetime(2021, 3, 1)
+    future = make_stand("000000000005")
+    future.stand_part_children[0].effective_date = datetime(2999, 1, 1)
+    future.stand_part_children[0].stand_attribute_children[0].effective_date = datetime(2999, 1, 1)
+    return make_stand("000000000001"), later, make_dated_stand("000000000003"), expired, future
+
+
+def test_changes_since(client, seed_stands):
+    seed_stands(*feed_stands())
+    lines = changes(client, since="2021-01-01T00:00:00")
+    assert [(line["stand"]["stand_oid"], line["changed_at"]) for line in lines] == [
+        ("000000000004", "2021-03-01T00:00:00"),
+        ("000000000002", "2022-06-01T00:00:00"),
+        ("000000000003", "2023-01-01T00:00:00"),
+    ]
+    # Stands are returned as of the end of the feed: the expired stand has no parts left.
+    assert lines[0]["stand"]["stand_parts"] == []
+    assert len(lines[2]["stand"]["stand_parts"]) == 2
+    assert len(changes(client)) == 4
+
+
+def test_changes_resume_from_cursor(make_client, seed_stands):
+    client = make_client(stand_changes_batch_size=1)
+    stands = [make_stand(f"00000000001{i}") for i in range(3)]
+    seed_stands(*stands)
+    lines = changes(client)
+    assert [line["stand"]["stand_oid"] for line in lines] == ["000000000010", "000000000011", "000000000012"]
+    # Same instant for all three: the cursor's stand_oid breaks the tie.
+    resumed = changes(client, cursor=lines[0]["cursor"])
+    assert [line["stand"]["stand_oid"] for line in resumed] == ["000000000011", "000000000012"]
+    assert changes(client, cursor=lines[-1]["cursor"]) == []
+    assert client.get("/stands/changes", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_changes_stream_from_one_query(make_client, seed_stands, engine):
+    client = make_client(stand_changes_batch_size=1)
+    stands = feed_stands()
+    stands[1].stand_part_children[0].stand_attribute_children[0].description = "Burned 2020"
+    seed_stands(*stands)
+    with count_queries(engine) as counter:
+        lines = changes(client)
+    # Fetched a row at a time, but the changes are grouped once and the stands come with them.
+    assert len(lines) == 4
+    assert len(counter.statements) == 1
+    # Like the export, the feed carries the large columns.
+    later = next(line["stand"] for line in lines if line["stand"]["stand_oid"] == "000000000002")
+    assert later["stand_parts"][0]["stand_attributes"][0]["description"] == "Burned 2020"
+
+
+def test_changes_statement_seeks_effective_date_indexes(engine):
+    statement = stand_changes_statement((datetime(2024, 1, 1), "000000000001"), datetime(2024, 2, 1), 100)
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        plan = " ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+    for index in ("IX_STAND_PART_EFFECTIVE_DATE", "IX_STAND_PART_EXPIRY_DATE", "IX_STAND_ATTRIBUTES_EFFECTIVE_DATE"):
+        assert index in plan
@@ -1,19 +1,198 @@
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from backend.app.api.endpoints.stand_endpoint import router  # Adjust the import as necessary
+import csv
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Create a temporary FastAPI app for testing
-app = FastAPI()
-app.include_router(router)
+from app.api.endpoints import stand_endpoint
+from app.infrastructure.cache import invalidate_stands
+from app.infrastructure.query_counter import assert_query_count
+from tests.conftest import make_dated_stand, make_part_tree_stand, make_stand, stand_document
 
-client = TestClient(app)
 
-
-def test_stands_endpoint():
+def test_stands_endpoint(client, seed_stands):
+    seed_stands(make_stand("9001001098"), make_stand("9001001001"), make_stand("9001001002"))
     response = client.get("/stands/")
     assert response.status_code == 200
     data = response.json()
     assert "stands" in data
-    # Check that the response contains exactly the expected list of stands
+    # Stands are listed in STAND_OID order without their parts by default
     expected = ["9001001001", "9001001002", "9001001098"]
-    assert data["stands"] == expected
+    assert [stand["stand_oid"] for stand in data["stands"]] == expected
+    assert all(stand["stand_parts"] == [] for stand in data["stands"])
+    assert data["next"] is None
+
+
+def test_stands_endpoint_keyset_pages(client, seed_stands):
+    seed_stands(*(make_stand(f"900100100{i}", parts=2) for i in range(5)))
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "include_parts": True}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get("/stands/", params=params).json()
+        assert len(data["stands"]) <= 2
+        assert all(len(stand["stand_parts"]) == 2 for stand in data["stands"])
+        seen.extend(stand["stand_oid"] for stand in data["stands"])
+        cursor = data["next"]
+        if cursor is None:
+            break
+    assert seen == [f"900100100{i}" for i in range(5)]
+
+
+def test_stands_endpoint_clamps_limit(make_client, seed_stands):
+    client = make_client(stand_page_max_limit=2)
+    seed_stands(*(make_stand(f"900100100{i}") for i in range(3)))
+    data = client.get("/stands/", params={"limit": 1000}).json()
+    assert len(data["stands"]) == 2
+    assert data["next"] is not None
+
+
+def test_stands_endpoint_rejects_bad_cursor(client):
+    assert client.get("/stands/", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_read_stands_batch(client, seed_stands):
+    seed_stands(make_stand("9001001001", parts=2), make_stand("9001001002"))
+    response = client.post("/stands/batch", json={"stand_oids": ["9001001002", "9001001001", "9001001099"]})
+    assert response.status_code == 200
+    data = response.json()
+    assert [stand["stand_oid"] for stand in data["stands"]] == ["9001001002", "9001001001"]
+    assert len(data["stands"][1]["stand_parts"]) == 2
+    assert data["missing"] == ["9001001099"]
+
+
+def test_read_stands_batch_rejects_empty_request(client):
+    assert client.post("/stands/batch", json={"stand_oids": []}).status_code == 422
+
+
+def test_export_stands_ndjson(client, seed_stands):
+    seed_stands(make_stand("9001001002", parts=2), make_stand("9001001001"))
+    response = client.get("/stands/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [stand["stand_oid"] for stand in lines] == ["9001001001", "9001001002"]
+    assert lines[1] == client.get("/stands/9001001002/").json()
+
+
+def test_export_stands_csv(client, seed_stands):
+    seed_stands(make_stand("9001001001", parts=2), make_stand("9001001002", parts=0))
+    response = client.get("/stands/export", params={"format": "csv"})
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    expected = [("9001001001", "0010010000"), ("9001001001", "0010010001"), ("9001001002", "")]
+    assert [(row["stand_oid"], row["stand_part_oid"]) for row in rows] == expected
+    assert rows[0]["species"] == "DF"
+    assert rows[0]["attributes_effective_date"] == "2020-01-01T00:00:00"
+
+
+def test_read_stand_etag_and_cache(client, seed_stands, engine):
+    seed_stands(make_stand("9001001001", parts=2))
+    before = client.get("/health/cache").json()
+    first = client.get("/stands/9001001001/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    # Served from the cache: no SQL at all, and the client's copy is still current.
+    with assert_query_count(engine, 0):
+        not_modified = client.get("/stands/9001001001/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    stats = client.get("/health/cache").json()
+    assert (stats["hits"] - before["hits"], stats["misses"] - before["misses"]) == (1, 1)
+
+    invalidate_stands(client.app.state.stand_cache, ["9001001001"])
+    assert client.get("/stands/9001001001/", headers={"If-None-Match": '"stale"'}).json() == first.json()
+
+
+def test_read_stand_overtaken_by_a_write_is_not_cached(client, seed_stands, monkeypatch):
+    seed_stands(make_stand("9001001001"))
+    loaded, resume = threading.Event(), threading.Event()
+    render_stand = stand_endpoint.render_stand
+
+    def slow_render_stand(stand_schema):
+        # The stand has been read; the ingest below commits and invalidates it before the read caches what it loaded.
+        loaded.set()
+        resume.wait(5)
+        return render_stand(stand_schema)
+
+    monkeypatch.setattr(stand_endpoint, "render_stand", slow_render_stand)
+    with ThreadPoolExecutor(1) as pool:
+        stale = pool.submit(client.get, "/stands/9001001001/")
+        assert loaded.wait(5)
+        assert client.post("/stands/ingest", json=[stand_document("9001001001", parts=2)]).json()["written"] == 1
+        resume.set()
+        assert len(stale.result().json()["stand_parts"]) == 1
+    assert client.app.state.stand_cache.get("9001001001") is None
+    assert len(client.get("/stands/9001001001/").json()["stand_parts"]) == 2
+
+
+def test_read_stand_as_of_bypasses_cache(client, seed_stands):
+    seed_stands(make_dated_stand("9001007001"))
+    assert len(client.get("/stands/9001007001/").json()["stand_parts"]) == 3
+    response = client.get("/stands/9001007001/", params={"as_of": "2021-06-01T00:00:00"})
+    assert [part["stand_part_oid"][-1] for part in response.json()["stand_parts"]] == ["1"]
+    assert "ETag" in response.headers
+    assert len(client.get("/stands/9001007001/").json()["stand_parts"]) == 3
+
+    data = client.post("/stands/batch", json={"stand_oids": ["9001007001"], "as_of": "2020-06-01T00:00:00"}).json()
+    assert [part["stand_part_oid"][-1] for part in data["stands"][0]["stand_parts"]] == ["0"]
+    data = client.get("/stands/", params={"include_parts": True, "as_of": "2024-01-01T00:00:00"}).json()
+    assert [part["stand_part_oid"][-1] for part in data["stands"][0]["stand_parts"]] == ["1", "2"]
+
+
+def test_part_tree_endpoints_nest_parts(client, seed_stands):
+    seed_stands(make_part_tree_stand("9001008001"))
+
+    def shape(node):
+        return (node["stand_part_oid"][-1], node["depth"], [shape(child) for child in node["children"]])
+
+    descendants = client.get("/stand-parts/0080010000/descendants").json()
+    assert shape(descendants) == ("0", 0, [("1", 1, [("3", 2, [("4", 3, [])])]), ("2", 1, [])])
+    assert descendants["stand_attributes"][0]["species"] == "DF"
+    assert shape(client.get("/stand-parts/0080010000/descendants", params={"max_depth": 1}).json()) == ("0", 0, [("1", 1, []), ("2", 1, [])])
+    ancestors = client.get("/stand-parts/0080010004/ancestors").json()
+    assert shape(ancestors) == ("0", 3, [("1", 2, [("3", 1, [("4", 0, [])])])])
+
+    assert client.get("/stand-parts/0000000000/descendants").status_code == 404
+    assert client.get("/stand-parts/0080010000/siblings").status_code == 422
+
+
+def test_part_tree_endpoints_cut_cycles(client, seed_stands):
+    stand = make_part_tree_stand("9001008001")
+    stand.stand_part_children[0].stand_pnt_part_oid = stand.stand_part_children[4].stand_part_oid
+    seed_stands(stand)
+
+    def shape(node):
+        return (node["stand_part_oid"][-1], node["depth"], [shape(child) for child in node["children"]])
+
+    descendants = client.get("/stand-parts/0080010000/descendants", params={"max_depth": 10}).json()
+    assert shape(descendants) == ("0", 0, [("1", 1, [("3", 2, [("4", 3, [])])]), ("2", 1, [])])
+    ancestors = client.get("/stand-parts/0080010003/ancestors", params={"max_depth": 10}).json()
+    assert shape(ancestors) == ("4", 3, [("0", 2, [("1", 1, [("3", 0, [])])])])
+
+
+def test_search_endpoint(client, seed_stands):
+    stands = [make_stand(f"900100900{i}") for i in range(3)]
+    stands[1].stand_part_children[0].stand_attribute_children[0].species = "WH"
+    seed_stands(*stands)
+    data = client.get("/stands/search", params={"species": ["DF"], "status": "ACTIVE", "site_index_min": 100, "limit": 1}).json()
+    assert [stand["stand_oid"] for stand in data["stands"]] == ["9001009000"]
+    data = client.get("/stands/search", params={"species": ["DF"], "cursor": data["next"], "include_parts": True}).json()
+    assert [stand["stand_oid"] for stand in data["stands"]] == ["9001009002"]
+    assert data["stands"][0]["stand_parts"][0]["stand_attributes"][0]["species"] == "DF"
+    assert data["next"] is None
+    assert client.get("/stands/search", params={"site_index_min": "high"}).status_code == 422
+
+
+def test_search_endpoint_ignores_expired_parts(client, seed_stands):
+    stand = make_dated_stand("9001009001")
+    stand.stand_part_children[0].stand_attribute_children[0].species = "WH"
+    seed_stands(stand)
+    assert client.get("/stands/search", params={"species": "WH"}).json()["stands"] == []
+    data = client.get("/stands/search", params={"species": "WH", "as_of": "2020-06-01T00:00:00"}).json()
+    assert [stand["stand_oid"] for stand in data["stands"]] == ["9001009001"]
@@ -0,0 +1,58 @@
+import json
+
+from app.infrastructure.repositories.stand_repository import get_stand
+from tests.conftest import stand_document
+
+
+def test_ingest_json_array_inserts_then_updates(client, db_session):
+    body = [stand_document("9001002001", parts=2), stand_document("9001002002")]
+    data = client.post("/stands/ingest", json=body).json()
+    assert (data["received"], data["written"], data["failures"]) == (2, 2, [])
+    assert data["chunks"][0]["inserted"] == {"stand": 2, "stand_part": 3, "stand_attributes": 3}
+
+    data = client.post("/stands/ingest", json=[stand_document("9001002001", parts=2, species="WH")]).json()
+    assert data["chunks"][0]["updated"] == {"stand": 1, "stand_part": 2, "stand_attributes": 2}
+    assert data["chunks"][0]["inserted"] == {"stand": 0, "stand_part": 0, "stand_attributes": 0}
+    stand = get_stand(db_session, "9001002001")
+    assert [part.stand_attributes[0].species for part in stand.stand_parts] == ["WH", "WH"]
+
+
+def test_ingest_ndjson_in_chunks_reports_invalid_lines(make_client, db_session):
+    client = make_client(stand_ingest_chunk_size=2)
+    lines = [json.dumps(stand_document(f"900100300{i}")) for i in range(3)]
+    lines.insert(1, '{"stand_oid": "9001003999"}')
+    lines.insert(2, "not json")
+    response = client.post("/stands/ingest", content="\n".join(lines) + "\n\n", headers={"Content-Type": "application/x-ndjson"})
+    data = response.json()
+    assert (data["received"], data["written"]) == (5, 3)
+    assert [chunk["stands"] for chunk in data["chunks"]] == [2, 1]
+    assert [failure["index"] for failure in data["failures"]] == [1, 2]
+    assert "od_object_type" in data["failures"][0]["error"]
+    assert get_stand(db_session, "9001003002") is not None
+
+
+def test_ingest_retries_failed_chunk_one_stand_at_a_time(client, engine, db_session):
+    # SQLite only enforces foreign keys when asked to; the test engine has a single shared connection.
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+    orphan = stand_document("9001004002")
+    orphan["stand_parts"][0]["stand_attributes"][0]["stand_part_oid"] = "NOPART0000"
+    data = client.post("/stands/ingest", json=[stand_document("9001004001"), orphan]).json()
+    assert data["written"] == 1
+    assert data["chunks"][0]["retried"] is True
+    assert [(failure["index"], failure["stand_oid"]) for failure in data["failures"]] == [(1, "9001004002")]
+    assert "FOREIGN KEY" in data["failures"][0]["error"]
+    assert get_stand(db_session, "9001004001") is not None
+    assert get_stand(db_session, "9001004002") is None
+
+
+def test_ingest_invalidates_cached_stands(client):
+    client.post("/stands/ingest", json=[stand_document("9001005001")])
+    assert client.get("/stands/9001005001/").json()["stand_parts"][0]["stand_attributes"][0]["species"] == "DF"
+    client.post("/stands/ingest", json=[stand_document("9001005001", species="WH")])
+    assert client.get("/stands/9001005001/").json()["stand_parts"][0]["stand_attributes"][0]["species"] == "WH"
+
+
+def test_ingest_rejects_non_array_json(client):
+    assert client.post("/stands/ingest", json={"stand_oid": "9001006001"}).status_code == 400
+    assert client.post("/stands/ingest", content="{", headers={"Content-Type": "application/json"}).status_code == 400
@@ -0,0 +1,54 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.api.endpoints import stand_endpoint
+from tests.conftest import make_stand
+
+
+def slow_loads(monkeypatch, delay: float = 0.2):
+    calls = []
+    load_stand_schema = stand_endpoint.load_stand_schema
+
+    def slow_load_stand_schema(*args):
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        return load_stand_schema(*args)
+
+    monkeypatch.setattr(stand_endpoint, "load_stand_schema", slow_load_stand_schema)
+    return calls
+
+
+def concurrent_gets(client, *paths):
+    with ThreadPoolExecutor(len(paths)) as pool:
+        return list(pool.map(client.get, paths))
+
+
+def test_concurrent_reads_of_a_stand_share_one_load(client, seed_stands, monkeypatch):
+    seed_stands(make_stand("000000000001", parts=2))
+    calls = slow_loads(monkeypatch)
+    before = client.get("/health/single-flight").json()
+    responses = concurrent_gets(client, *["/stands/000000000001/"] * 6)
+    assert [response.status_code for response in responses] == [200] * 6
+    assert len({response.content for response in responses}) == 1
+    assert len(calls) == 1
+    after = client.get("/health/single-flight").json()
+    assert (after["loads"] - before["loads"], after["coalesced"] - before["coalesced"]) == (1, 5)
+
+
+def test_reads_with_other_options_load_separately(client, seed_stands, monkeypatch):
+    seed_stands(make_stand("000000000001"), make_stand("000000000002"))
+    calls = slow_loads(monkeypatch, 0.1)
+    responses = concurrent_gets(
+        client, "/stands/000000000001/", "/stands/000000000002/", "/stands/000000000001/?fields=species", "/stands/000000000003/"
+    )
+    assert [response.status_code for response in responses] == [200, 200, 200, 404]
+    assert len(calls) == 4
+
+
+def test_coalescing_can_be_disabled(make_client, seed_stands, monkeypatch):
+    client = make_client(stand_read_coalescing=False)
+    seed_stands(make_stand("000000000001"))
+    calls = slow_loads(monkeypatch, 0.1)
+    concurrent_gets(client, *["/stands/000000000001/"] * 3)
+    assert len(calls) == 3
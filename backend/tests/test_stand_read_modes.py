@@ -0,0 +1,131 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.adapters import stand_adapter
+from app.infrastructure.orm_models.stand_model import Stand, StandAttributes, StandPart
+from app.infrastructure.query_counter import assert_query_count, count_queries
+from app.infrastructure.repositories.stand_repository import get_stand
+from app.schemas.stand_schema import StandSchema
+
+
+def full_stand() -> Stand:
+    stand = Stand(stand_oid="9001001001", od_object_type="STAND")
+    for i, pnt in enumerate([None, "9001001000"]):
+        part = StandPart(
+            stand_oid="9001001001",
+            stand_part_oid=f"900100100{i}",
+            stand_pnt_part_oid=pnt,
+            od_part_type="PART",
+            rte_scenario_oid="1",
+            effective_date=datetime(2020, 1, 1, 12, 30),
+            expiry_date=datetime(2030, 1, 1) if i else None,
+        )
+        # Every string column gets a value that fits its length
+        values = {
+            key: f"{key[:3]}{i}"[: column.type.length] for key, column in stand_adapter.STAND_ATTRIBUTES_COLUMNS if column.type.python_type is str
+        }
+        values.update(
+            stand_part_oid=part.stand_part_oid,
+            effective_date=datetime(2021, 2, 3, 4, 5, 6),
+            last_thinned_date=None,
+            survival_checked=datetime(2022, 1, 1),
+            site_index=110 + i,
+            description="Douglas-fir — north slope ✓",
+            slope=Decimal("12.34567"),
+            aspect=Decimal("270"),
+            elevation=None,
+        )
+        part.stand_attribute_children = [StandAttributes(**values)]
+        stand.stand_part_children.append(part)
+    return stand
+
+
+@pytest.mark.parametrize("read_mode", ["orm", "fast"])
+def test_read_modes_match_response_model_bytes(make_client, seed_stands, db_session, read_mode):
+    seed_stands(full_stand())
+
+    # The original path: the schema returned through FastAPI's response_model validation and rendering.
+    reference = FastAPI()
+    reference.get("/reference", response_model=StandSchema)(lambda: stand_adapter.domain_to_schema_stand(get_stand(db_session, "9001001001")))
+    expected = TestClient(reference).get("/reference").content
+
+    response = make_client(stand_read_mode=read_mode).get("/stands/9001001001/")
+    assert response.status_code == 200
+    assert response.content == expected
+
+
+def test_fast_read_is_one_statement(make_client, seed_stands, engine):
+    client = make_client(stand_read_mode="fast")
+    seed_stands(full_stand())
+    with assert_query_count(engine, 1):
+        assert client.get("/stands/9001001001/").status_code == 200
+    assert client.get("/stands/9001001099/").status_code == 404
+
+
+@pytest.mark.parametrize("read_mode", ["orm", "fast"])
+def test_sparse_fields_trim_columns_and_payload(make_client, seed_stands, engine, read_mode):
+    client = make_client(stand_read_mode=read_mode)
+    seed_stands(full_stand())
+    full = client.get("/stands/9001001001/").json()
+
+    with count_queries(engine) as counter:
+        sparse = client.get("/stands/9001001001/", params={"fields": "species, site_index,slope"}).json()
+    assert all("DESCRIPTION" not in statement and "OLD_ID_1" not in statement for statement in counter.statements)
+    for full_part, sparse_part in zip(full["stand_parts"], sparse["stand_parts"]):
+        assert sparse_part["stand_part_oid"] == full_part["stand_part_oid"]
+        attributes = full_part["stand_attributes"][0]
+        expected = {name: attributes[name] for name in ("stand_part_oid", "species", "site_index", "slope")}
+        assert sparse_part["stand_attributes"] == [expected]
+
+    assert client.get("/stands/9001001001/", params={"fields": "species,colour"}).status_code == 400
+
+
+def test_sparse_fields_on_listing_and_batch(client, seed_stands):
+    seed_stands(full_stand())
+    page = client.get("/stands/", params={"include_parts": True, "fields": "status"}).json()
+    assert page["next"] is None
+    assert page["stands"][0]["stand_parts"][0]["stand_attributes"] == [{"stand_part_oid": "9001001000", "status": "sta0"}]
+    batch = client.post("/stands/batch", json={"stand_oids": ["9001001001"], "fields": "description"}).json()
+    assert batch["missing"] == []
+    expected = [{"stand_part_oid": "9001001001", "description": "Douglas-fir — north slope ✓"}]
+    assert batch["stands"][0]["stand_parts"][1]["stand_attributes"] == expected
+
+
+def test_large_columns_are_deferred_outside_the_aggregate_loaders(seed_stands, db_session, engine):
+    seed_stands(full_stand())
+    orm_attrs = db_session.query(StandAttributes).first()
+    assert {"description", "old_id_1", "old_id_2"}.isdisjoint(orm_attrs.__dict__)
+    db_session.expunge_all()
+    # The aggregate loaders fetch them with the rest of the row: no lazy load per attributes row.
+    with assert_query_count(engine, 3):
+        stand = get_stand(db_session, "9001001001")
+    assert [part.stand_attributes[0].description for part in stand.stand_parts] == ["Douglas-fir — north slope ✓"] * 2
+
+
+@pytest.mark.parametrize("read_mode", ["orm", "fast"])
+def test_default_reads_return_the_large_columns(make_client, seed_stands, read_mode):
+    client = make_client(stand_read_mode=read_mode)
+    seed_stands(full_stand())
+    attributes = client.get("/stands/9001001001/").json()["stand_parts"][0]["stand_attributes"][0]
+    assert attributes["description"] == "Douglas-fir — north slope ✓"
+    assert attributes["old_id_1"] == "old0"
+    page = client.get("/stands/", params={"include_parts": True}).json()
+    assert page["stands"][0]["stand_parts"][0]["stand_attributes"][0]["description"] == "Douglas-fir — north slope ✓"
+
+
+def test_apps_read_their_own_settings(make_client, seed_stands, engine):
+    seed_stands(full_stand())
+    fast = make_client(stand_read_mode="fast", stand_cache_max_entries=0)
+    default = make_client()
+    for _ in range(2):
+        with assert_query_count(engine, 1):
+            assert fast.get("/stands/9001001001/").status_code == 200
+    assert fast.get("/health/cache").json()["max_entries"] == 0
+    with assert_query_count(engine, 3):
+        assert default.get("/stands/9001001001/").status_code == 200
+    with assert_query_count(engine, 0):
+        assert default.get("/stands/9001001001/").status_code == 200
@@ -0,0 +1,37 @@
+import pytest
+
+from tests.conftest import make_dated_stand, make_stand, stand_document
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(stand_snapshot_enabled=True)
+
+
+def test_snapshot_disabled_by_default(make_client):
+    assert make_client().get("/stands/snapshot").status_code == 404
+
+
+def test_snapshot_filter(client, seed_stands):
+    steep = make_stand("000000000001")
+    steep.stand_part_children[0].stand_attribute_children[0].slope = 35
+    # Only the dated stand's current part is in the snapshot; its expired part is not.
+    seed_stands(steep, make_stand("000000000002"), make_dated_stand("000000000003"))
+    response = client.get("/stands/snapshot", params={"slope_min": 30})
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["count"], data["stand_oids"]) == (1, ["000000000001"])
+    assert client.get("/stands/snapshot", params={"species": "DF", "site_index_max": 120}).json()["count"] == 3
+    assert client.get("/health/snapshot").json()["rows"] == 4
+
+
+def test_ingest_marks_stands_for_the_next_refresh(client, seed_stands):
+    seed_stands(make_stand("000000000001"))
+    assert client.get("/stands/snapshot", params={"species": "WH"}).json()["count"] == 0
+    assert client.post("/stands/ingest", json=[stand_document("000000000001", species="WH")]).status_code == 200
+    health = client.get("/health/snapshot").json()
+    assert health["pending_changes"] == 1
+
+    stats = client.post("/stands/snapshot/refresh").json()
+    assert (stats["incremental_refreshes"], stats["pending_changes"]) == (health["incremental_refreshes"] + 1, 0)
+    assert client.get("/stands/snapshot", params={"species": "WH"}).json()["stand_oids"] == ["000000000001"]
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from tests.conftest import make_dated_stand, make_stand
+
+
+def summary_stands():
+    first, second, hemlock = make_stand("000000000001", parts=2), make_stand("000000000002"), make_stand("000000000003")
+    first.stand_part_children[1].stand_attribute_children[0].site_index = 100
+    second.stand_part_children[0].stand_attribute_children[0].slope = 30
+    attributes = hemlock.stand_part_children[0].stand_attribute_children[0]
+    attributes.species, attributes.ownership = "WH", "STATE"
+    return first, second, hemlock
+
+
+def test_summary_groups_current_parts(client, seed_stands):
+    # The dated stand's expired part is left out.
+    seed_stands(*summary_stands(), make_dated_stand("000000000004"))
+    response = client.get("/stands/summary")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["group_by"] == ["species"]
+    assert data["rows"] == [
+        {"species": "DF", "stands": 3, "parts": 5, "mean_site_index": 116.0, "mean_slope": 30.0, "mean_elevation": None},
+        {"species": "WH", "stands": 1, "parts": 1, "mean_site_index": 120.0, "mean_slope": None, "mean_elevation": None},
+    ]
+
+
+def test_summary_multiple_dimensions_in_canonical_order(client, seed_stands):
+    seed_stands(*summary_stands())
+    data = client.get("/stands/summary", params={"group_by": ["ownership", "species"]}).json()
+    assert data["group_by"] == ["species", "ownership"]
+    assert [(row["species"], row["ownership"], row["parts"]) for row in data["rows"]] == [("DF", None, 3), ("WH", "STATE", 1)]
+    assert client.get("/stands/summary", params={"group_by": "height"}).status_code == 422
+
+
+def test_summary_is_cached_until_refreshed(client, seed_stands):
+    seed_stands(make_stand("000000000001"))
+    first = client.get("/stands/summary").json()
+    seed_stands(make_stand("000000000002"))
+    assert client.get("/stands/summary").json() == first
+
+    response = client.post("/stands/summary/refresh")
+    assert response.json() == {"refreshed": [["species"]]}
+    refreshed = client.get("/stands/summary").json()
+    assert refreshed["rows"][0]["stands"] == 2
+    assert datetime.fromisoformat(refreshed["refreshed_at"]) >= datetime.fromisoformat(first["refreshed_at"])
+    assert client.get("/health/summary-cache").json()["refreshes"] == 2
+
+
+def test_ingest_expires_summaries(client):
+    client.get("/stands/summary")
+    stand = {"stand_oid": "000000000001", "od_object_type": "STAND", "stand_part_children": []}
+    assert client.post("/stands/ingest", json=[stand]).status_code == 200
+    stand_summary_cache = client.app.state.stand_summary_cache
+    assert stand_summary_cache.stats()["size"] == 1
+    refreshes = stand_summary_cache.stats()["refreshes"]
+    assert client.get("/stands/summary").status_code == 200
+    # The expired summary is still served, and recomputed in the background.
+    assert stand_summary_cache.wait_for_refreshes(timeout=5)
+    assert stand_summary_cache.stats()["refreshes"] == refreshes + 1